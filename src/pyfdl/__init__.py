@@ -8,50 +8,89 @@ from .common import (
     NO_ROUNDING,
     Base,
     Dimensions,
+    LazyCollection,
     Point,
     RoundStrategy,
     TypedCollection,
 )
+from .archive import FDLArchive
+from .batch import BatchResult, BatchValidator, validate_files, validate_strings
 from .clipid import ClipID
+from .codegen import compile_serializers
 from .context import Context
-from .errors import FDLError, FDLValidationError
+from .errors import FDLError, FDLValidationError, ValidationIssue
 from .fdl import FDL
 from .framing_decision import FramingDecision
 from .framing_intent import FramingIntent
-from .handlers import read_from_file, read_from_string, write_to_file, write_to_string
+from .geometry import GeometryStore
+from .handlers import (
+    iter_contexts,
+    read_from_buffer,
+    read_from_bytes,
+    read_from_file,
+    read_from_string,
+    write_to_bytes,
+    write_to_file,
+    write_to_stream,
+    write_to_string,
+)
 from .header import Header
+from .json_backends import JSON_BACKENDS, JSONBackend, get_json_backend
 from .rounding import set_rounding_strategy, get_rounding_strategy
+from .store import FDLStore
+from .validators import get_validator, preload_validators
 
 
 __all__ = [
     "Base",
+    "BatchResult",
+    "BatchValidator",
     "Canvas",
     "CanvasTemplate",
     "ClipID",
+    "compile_serializers",
     "Context",
     "DEFAULT_ROUNDING_STRATEGY",
     "Dimensions",
     "FDL",
+    "FDLArchive",
     "FDLError",
+    "FDLStore",
     "FDLValidationError",
     "FDL_SCHEMA_MAJOR",
     "FDL_SCHEMA_MINOR",
     "FDL_SCHEMA_VERSION",
     "FramingDecision",
     "FramingIntent",
+    "GeometryStore",
+    "get_json_backend",
     "get_rounding_strategy",
+    "get_validator",
     "Header",
+    "iter_contexts",
+    "JSON_BACKENDS",
+    "JSONBackend",
+    "LazyCollection",
     "NO_ROUNDING",
     "Point",
+    "preload_validators",
+    "read_from_buffer",
+    "read_from_bytes",
     "read_from_file",
     "read_from_string",
     "rounding",
     "RoundStrategy",
     "TypedCollection",
+    "validate_files",
+    "validate_strings",
+    "ValidationIssue",
+    "write_to_bytes",
     "write_to_file",
+    "write_to_stream",
     "write_to_string",
 ]
 
 __version__ = "0.1.0.dev0"
 
 set_rounding_strategy(DEFAULT_ROUNDING_STRATEGY)
+compile_serializers()
@@ -0,0 +1,215 @@
+import os
+import tarfile
+import zipfile
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Optional, Union
+
+from .batch import _init_worker
+from .compression import open_decompressed
+from .errors import FDLError, UnknownHandlerError
+from .fdl import FDL
+from .handlers import read_from_bytes
+from .plugins import get_registry
+
+
+def _read_member(data: bytes, handler_name: str, kwargs: dict) -> FDL:
+    return read_from_bytes(data, handler_name=handler_name, **kwargs)
+
+
+def _handler_name(name: str) -> Optional[str]:
+    path = PurePosixPath(name)
+    # Skip the resource forks macOS adds to zip files, which share the names of the real files
+    if path.name.startswith("._") or "__MACOSX" in path.parts:
+        return None
+
+    try:
+        handler = get_registry().get_handler_by_suffix("".join(path.suffixes), func_name="read_from_bytes")
+
+    except UnknownHandlerError:
+        return None
+
+    return handler.name
+
+
+class FDLArchive:
+    def __init__(self, path: Union[Path, str]):
+        """Read FDLs straight from a zip or tar archive, without extracting it first.
+
+        Opening an archive only indexes its members. Each FDL is read and parsed when it's asked for,
+        and not kept afterwards. Members are picked by suffix like any other file, so ".fdl", ".fdl.gz"
+        and ".fdlb" files are all found, while other files are ignored. Compressed members are
+        decompressed while they're read.
+
+        Zip files and uncompressed tar files give quick access to any member. Compressed tar files have to
+        be decompressed from the start to find a member, so use `iter_fdls` to read them in order.
+
+        Args:
+            path: to ".zip", ".tar" or compressed tar file like ".tar.gz"
+
+        Raises:
+            FDLError: if the file isn't a zip or tar archive
+        """
+        self.path = Path(path)
+        self._members = {}
+        # The archive stays open until `close`, unless indexing it fails
+        with ExitStack() as stack:
+            if zipfile.is_zipfile(self.path):
+                self._archive = stack.enter_context(zipfile.ZipFile(self.path))
+                infos = [(info.filename, info) for info in self._archive.infolist() if not info.is_dir()]
+
+            elif tarfile.is_tarfile(self.path):
+                self._archive = stack.enter_context(tarfile.open(self.path, "r:*"))
+                infos = [(info.name, info) for info in self._archive.getmembers() if info.isfile()]
+
+            else:
+                msg = f"Not a zip or tar archive: {self.path}"
+                raise FDLError(msg)
+
+            for name, info in infos:
+                handler_name = _handler_name(name)
+                if handler_name is not None:
+                    self._members[name] = (info, handler_name)
+
+            stack.pop_all()
+
+    def names(self) -> list[str]:
+        """
+        Returns:
+            names: of the FDL files in the archive, in the order they're stored
+        """
+        return list(self._members)
+
+    def read_bytes(self, name: str) -> bytes:
+        """Read the contents of an FDL file in the archive. Compressed files are decompressed.
+
+        Args:
+            name: of file in the archive
+
+        Raises:
+            FDLError: if there is no FDL file by that name
+
+        Returns:
+            data:
+        """
+        info, _ = self._get_member(name)
+        with self._open(info) as fp, open_decompressed(fp) as source:
+            return source.read()
+
+    def read(self, name: str, **handler_kwargs: Optional[Any]) -> FDL:
+        """Read and parse an FDL file in the archive
+
+        Args:
+            name: of file in the archive
+            **handler_kwargs: arguments passed to handler like `validate` or `lazy`
+
+        Raises:
+            FDLError: if there is no FDL file by that name
+            FDLValidationError: if the FDL doesn't follow the spec
+
+        Returns:
+            FDL:
+        """
+        _, handler_name = self._get_member(name)
+        return _read_member(self.read_bytes(name), handler_name, handler_kwargs)
+
+    def iter_fdls(
+        self, max_workers: Optional[int] = None, parallel: bool = False, **handler_kwargs: Optional[Any]
+    ) -> Iterator[tuple[str, FDL]]:
+        """Read and parse all the FDL files in the archive, in the order they're stored.
+
+        In parallel mode the files are still read from the archive one at a time, but parsed and validated
+        on a pool of worker processes. Only a few files are queued at a time, so large archives aren't
+        held in memory.
+
+        Args:
+            max_workers: number of worker processes in parallel mode. Defaults to the number of processors
+            parallel: parse the files on a pool of worker processes
+            **handler_kwargs: arguments passed to handler like `validate` or `lazy`
+
+        Raises:
+            FDLValidationError: if an FDL doesn't follow the spec
+
+        Returns:
+            fdls: pairs of file name and FDL
+        """
+        if not parallel:
+            for name, (_, handler_name) in self._members.items():
+                yield name, _read_member(self.read_bytes(name), handler_name, handler_kwargs)
+
+            return
+
+        # Keep a bounded amount of work queued, like the BatchValidator
+        max_pending = (max_workers or os.cpu_count() or 1) * 4
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(None,)) as executor:
+            for name, (_, handler_name) in self._members.items():
+                future = executor.submit(_read_member, self.read_bytes(name), handler_name, handler_kwargs)
+                pending.append((name, future))
+                if len(pending) >= max_pending:
+                    name, future = pending.popleft()
+                    yield name, future.result()
+
+            while pending:
+                name, future = pending.popleft()
+                yield name, future.result()
+
+    def read_all(
+        self, max_workers: Optional[int] = None, parallel: bool = False, **handler_kwargs: Optional[Any]
+    ) -> dict[str, FDL]:
+        """Read and parse all the FDL files in the archive. See [iter_fdls](archive.md#pyfdl.FDLArchive.iter_fdls)
+
+        Args:
+            max_workers: number of worker processes in parallel mode. Defaults to the number of processors
+            parallel: parse the files on a pool of worker processes
+            **handler_kwargs: arguments passed to handler like `validate` or `lazy`
+
+        Raises:
+            FDLValidationError: if an FDL doesn't follow the spec
+
+        Returns:
+            fdls: by file name
+        """
+        return dict(self.iter_fdls(max_workers=max_workers, parallel=parallel, **handler_kwargs))
+
+    def _get_member(self, name: str) -> tuple[Any, str]:
+        try:
+            return self._members[name]
+
+        except KeyError:
+            msg = f'No FDL file by name: "{name}" in archive: {self.path}'
+            raise FDLError(msg) from None
+
+    def _open(self, info: Union[zipfile.ZipInfo, tarfile.TarInfo]) -> IO[bytes]:
+        if isinstance(self._archive, zipfile.ZipFile):
+            return self._archive.open(info)
+
+        return self._archive.extractfile(info)
+
+    def close(self) -> None:
+        """Close the archive"""
+        self._archive.close()
+
+    def __getitem__(self, name: str) -> FDL:
+        return self.read(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._members
+
+    def __enter__(self) -> "FDLArchive":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self.path)!r})"
@@ -0,0 +1,227 @@
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from .errors import FDLValidationError, ValidationIssue
+from .fdl import FDL
+from .handlers import read_from_file, read_from_string
+from .plugins import get_registry
+from .validators import preload_validators
+
+
+class BatchResult:
+    def __init__(
+        self,
+        index: int,
+        source: str,
+        errors: Optional[list[ValidationIssue]] = None,
+        exception: Optional[str] = None,
+    ):
+        """Outcome of validating one FDL in a batch
+
+        Args:
+            index: position of the FDL in the provided paths or strings
+            source: path to the file or "<string>"
+            errors: validation errors found in the FDL
+            exception: description of any other problem like unreadable files or broken json
+        """
+        self.index = index
+        self.source = source
+        self.errors = errors or []
+        self.exception = exception
+
+    @property
+    def valid(self) -> bool:
+        """`True` if the FDL was read without any errors"""
+        return not self.errors and self.exception is None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(index={self.index}, source={self.source!r}, valid={self.valid})"
+
+
+def _init_worker(versions: Optional[list[tuple[int, int]]]) -> None:
+    # Warm up the worker so the first file doesn't pay for loading schemas and plugins
+    get_registry()
+    preload_validators(versions)
+
+
+def _validate(index: int, source: str, read: Callable, args: tuple, kwargs: dict) -> BatchResult:
+    try:
+        result = read(*args, validate=True, **kwargs)
+        if not isinstance(result, FDL):
+            # Handlers of many FDLs per file, like JSON Lines, read them as they're iterated
+            deque(result, maxlen=0)
+
+    except FDLValidationError as err:
+        return BatchResult(index, source, errors=err.errors, exception=None if err.errors else str(err))
+
+    # Handlers may be plugins raising anything, and one broken file mustn't stop the batch
+    except Exception as err:  # noqa: BLE001
+        return BatchResult(index, source, exception=f"{err.__class__.__name__}: {err}")
+
+    return BatchResult(index, source)
+
+
+def _validate_file(index: int, path: str, kwargs: dict) -> BatchResult:
+    return _validate(index, path, read_from_file, (path,), kwargs)
+
+
+def _validate_string(index: int, s: str, kwargs: dict) -> BatchResult:
+    return _validate(index, "<string>", read_from_string, (s,), kwargs)
+
+
+class BatchValidator:
+    def __init__(self, max_workers: Optional[int] = None, versions: Optional[Iterable[tuple[int, int]]] = None):
+        """Validate lots of FDLs in parallel on a pool of worker processes. The workers are started once
+        with the json schema validators loaded, and are reused until the `BatchValidator` is closed.
+
+        Results are streamed back as they complete, or in the order the FDLs were provided when
+        `ordered=True`. Problems are reported per FDL, so one broken file doesn't stop the batch.
+
+        Args:
+            max_workers: number of worker processes. Defaults to the number of processors
+            versions: (major, minor) of schema versions to load in the workers. Defaults to all bundled versions
+        """
+        self.max_workers = max_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(list(versions) if versions is not None else None,),
+        )
+        # Keep a bounded amount of work queued to avoid holding a whole archive in memory
+        self._max_pending = (max_workers or os.cpu_count() or 1) * 4
+
+    def validate_files(
+        self,
+        paths: Iterable[Union[Path, str]],
+        ordered: bool = False,
+        handler_name: Optional[str] = None,
+        **handler_kwargs: Optional[Any],
+    ) -> Iterator[BatchResult]:
+        """Validate FDL files
+
+        Args:
+            paths: to files to validate
+            ordered: yield results in the same order as `paths`
+            handler_name: name of handler to use. Picked based on suffix by default
+            **handler_kwargs: arguments passed to handler like `fail_fast` or `max_errors`
+
+        Returns:
+            results: one per file
+        """
+        kwargs = dict(handler_kwargs, handler_name=handler_name)
+        jobs = ((_validate_file, index, str(path), kwargs) for index, path in enumerate(paths))
+        return self._run(jobs, ordered)
+
+    def validate_strings(
+        self,
+        strings: Iterable[str],
+        ordered: bool = False,
+        handler_name: str = "fdl",
+        **handler_kwargs: Optional[Any],
+    ) -> Iterator[BatchResult]:
+        """Validate FDLs provided as strings
+
+        Args:
+            strings: string representations of FDLs
+            ordered: yield results in the same order as `strings`
+            handler_name: name of handler to use
+            **handler_kwargs: arguments passed to handler like `fail_fast` or `max_errors`
+
+        Returns:
+            results: one per string
+        """
+        kwargs = dict(handler_kwargs, handler_name=handler_name)
+        jobs = ((_validate_string, index, s, kwargs) for index, s in enumerate(strings))
+        return self._run(jobs, ordered)
+
+    def _run(self, jobs: Iterator[tuple], ordered: bool) -> Iterator[BatchResult]:
+        pending = deque() if ordered else set()
+
+        def submit() -> bool:
+            job = next(jobs, None)
+            if job is None:
+                return False
+
+            future = self._executor.submit(*job)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+
+            return True
+
+        while len(pending) < self._max_pending and submit():
+            pass
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+
+            for future in done:
+                submit()
+                # Problems with the worker process itself, like a crash, are raised here
+                yield future.result()
+
+    def close(self) -> None:
+        """Shut down the worker processes"""
+        self._executor.shutdown()
+
+    def __enter__(self) -> "BatchValidator":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def validate_files(
+    paths: Iterable[Union[Path, str]],
+    max_workers: Optional[int] = None,
+    ordered: bool = False,
+    handler_name: Optional[str] = None,
+    **handler_kwargs: Optional[Any],
+) -> Iterator[BatchResult]:
+    """Validate FDL files in parallel with a temporary [BatchValidator](batch.md#pyfdl.BatchValidator).
+    Please use a `BatchValidator` directly to reuse the worker processes for several batches.
+
+    Args:
+        paths: to files to validate
+        max_workers: number of worker processes. Defaults to the number of processors
+        ordered: yield results in the same order as `paths`
+        handler_name: name of handler to use. Picked based on suffix by default
+        **handler_kwargs: arguments passed to handler like `fail_fast` or `max_errors`
+
+    Returns:
+        results: one per file
+    """
+    with BatchValidator(max_workers=max_workers) as validator:
+        yield from validator.validate_files(paths, ordered=ordered, handler_name=handler_name, **handler_kwargs)
+
+
+def validate_strings(
+    strings: Iterable[str],
+    max_workers: Optional[int] = None,
+    ordered: bool = False,
+    handler_name: str = "fdl",
+    **handler_kwargs: Optional[Any],
+) -> Iterator[BatchResult]:
+    """Validate FDLs provided as strings in parallel with a temporary [BatchValidator](batch.md#pyfdl.BatchValidator).
+
+    Args:
+        strings: string representations of FDLs
+        max_workers: number of worker processes. Defaults to the number of processors
+        ordered: yield results in the same order as `strings`
+        handler_name: name of handler to use
+        **handler_kwargs: arguments passed to handler like `fail_fast` or `max_errors`
+
+    Returns:
+        results: one per string
+    """
+    with BatchValidator(max_workers=max_workers) as validator:
+        yield from validator.validate_strings(strings, ordered=ordered, handler_name=handler_name, **handler_kwargs)
@@ -0,0 +1,71 @@
+from typing import Any
+
+from .errors import FDLError
+from .json_backends import JSONInput
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+# Binary FDLs start with this, followed by the FDL's json data encoded with MessagePack
+MAGIC = b"FDLB\x01"
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        msg = 'Binary FDLs require "msgpack". Please install it with: pip install pyfdl[binary]'
+        raise ImportError(msg)
+
+
+def pack(data: Any) -> bytes:
+    """Encode json data like the output of `FDL.to_dict` in the binary FDL format.
+
+    The format is a short header followed by the data encoded with [MessagePack](https://msgpack.org).
+    It holds the same types as json, so data decoded with `unpack` is exactly the same as the original.
+
+    Args:
+        data: to encode
+
+    Raises:
+        ImportError: if `msgpack` isn't installed
+        FDLError: if the data holds anything json can't hold either
+
+    Returns:
+        data: encoded
+    """
+    _require_msgpack()
+    try:
+        return MAGIC + msgpack.packb(data, use_bin_type=True, unicode_errors="surrogatepass")
+
+    except (TypeError, OverflowError, ValueError) as err:
+        raise FDLError(str(err)) from err
+
+
+def unpack(buffer: JSONInput) -> Any:
+    """Decode data in the binary FDL format
+
+    Args:
+        buffer: bytes or any other buffer like a `memoryview` or an `mmap`
+
+    Raises:
+        ImportError: if `msgpack` isn't installed
+        FDLError: if the data isn't in the binary FDL format or is broken
+
+    Returns:
+        data: decoded json data
+    """
+    _require_msgpack()
+    with memoryview(buffer) as view:
+        if view[: len(MAGIC)] != MAGIC:
+            msg = f"Not a binary FDL. Binary FDLs start with: {MAGIC!r}"
+            raise FDLError(msg)
+
+        with view[len(MAGIC) :] as body:
+            try:
+                return msgpack.unpackb(body, raw=False, unicode_errors="surrogatepass")
+
+            except (ValueError, TypeError) as err:
+                msg = f"Broken binary FDL: {err}"
+                raise FDLError(msg) from err
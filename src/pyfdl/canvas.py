@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Optional, TypeVar, Union
 
 from .common import Base, Dimensions, Point, TypedCollection
@@ -8,6 +9,33 @@ CanvasTemplate = TypeVar("CanvasTemplate")
 
 
 class Canvas(Base):
+    attributes = (
+        "label",
+        "id",
+        "source_canvas_id",
+        "dimensions",
+        "effective_dimensions",
+        "effective_anchor_point",
+        "photosite_dimensions",
+        "physical_dimensions",
+        "anamorphic_squeeze",
+        "framing_decisions",
+    )
+    kwarg_map = MappingProxyType({"id": "id_"})
+    object_map = MappingProxyType(
+        {
+            "dimensions": Dimensions,
+            "effective_dimensions": Dimensions,
+            "effective_anchor_point": Point,
+            "photosite_dimensions": Dimensions,
+            "physical_dimensions": Dimensions,
+            "framing_decisions": FramingDecision,
+        }
+    )
+    required = ("id", "source_canvas_id", "dimensions", "effective_dimensions.effective_anchor_point")
+    defaults = MappingProxyType({"source_canvas_id": "self.id", "anamorphic_squeeze": 1})
+    indexes = ("label", "source_canvas_id")
+
     def __init__(
         self,
         label: Optional[str] = None,
@@ -22,30 +50,6 @@ class Canvas(Base):
         framing_decisions: Optional[TypedCollection] = None,
     ):
         super().__init__()
-        self.attributes = [
-            "label",
-            "id",
-            "source_canvas_id",
-            "dimensions",
-            "effective_dimensions",
-            "effective_anchor_point",
-            "photosite_dimensions",
-            "physical_dimensions",
-            "anamorphic_squeeze",
-            "framing_decisions",
-        ]
-        self.kwarg_map = {"id": "id_"}
-        self.object_map = {
-            "dimensions": Dimensions,
-            "effective_dimensions": Dimensions,
-            "effective_anchor_point": Point,
-            "photosite_dimensions": Dimensions,
-            "physical_dimensions": Dimensions,
-            "framing_decisions": FramingDecision,
-        }
-        self.required = ["id", "source_canvas_id", "dimensions", "effective_dimensions.effective_anchor_point"]
-        self.defaults = {"source_canvas_id": "self.id", "anamorphic_squeeze": 1}
-
         self.label = label
         self.id = id_
         self.source_canvas_id = source_canvas_id
@@ -66,6 +70,7 @@ class Canvas(Base):
         self._dimensions = dim
         if dim is not None:
             self._dimensions.dtype = int
+        self._changed(dim)
 
     @property
     def effective_dimensions(self) -> Union[Dimensions, None]:
@@ -76,6 +81,7 @@ class Canvas(Base):
         self._effective_dimensions = dim
         if dim is not None:
             self._effective_dimensions.dtype = int
+        self._changed(dim)
 
     @property
     def photosite_dimensions(self) -> Union[Dimensions, None]:
@@ -86,6 +92,7 @@ class Canvas(Base):
         self._photosite_dimensions = dim
         if dim is not None:
             self._photosite_dimensions.dtype = int
+        self._changed(dim)
 
     @property
     def physical_dimensions(self) -> Union[Dimensions, None]:
@@ -94,6 +101,7 @@ class Canvas(Base):
     @physical_dimensions.setter
     def physical_dimensions(self, dim: Union[Dimensions, None]):
         self._physical_dimensions = dim
+        self._changed(dim)
 
     def place_framing_intent(self, framing_intent: FramingIntent) -> str:
         """Create a new [FramingDecision](framing_decision.md#pyfdl.FramingDecision) based on the provided
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Optional, Union
 
 from .common import Base, Dimensions, RoundStrategy
@@ -5,6 +6,44 @@ from .errors import FDLError
 
 
 class CanvasTemplate(Base):
+    attributes = (
+        "label",
+        "id",
+        "target_dimensions",
+        "target_anamorphic_squeeze",
+        "fit_source",
+        "fit_method",
+        "alignment_method_vertical",
+        "alignment_method_horizontal",
+        "preserve_from_source_canvas",
+        "maximum_dimensions",
+        "pad_to_maximum",
+        "round",
+    )
+    kwarg_map = MappingProxyType({"id": "id_", "round": "round_"})
+    object_map = MappingProxyType(
+        {"target_dimensions": Dimensions, "maximum_dimensions": Dimensions, "round": RoundStrategy}
+    )
+    required = (
+        "id",
+        "target_dimensions",
+        "target_anamorphic_squeeze",
+        "fit_source",
+        "fit_method",
+        "pad_to_maximum.maximum_dimensions",
+    )
+    defaults = MappingProxyType(
+        {
+            "target_anamorphic_squeeze": 1,
+            "fit_source": "framing_decision.dimensions",
+            "alignment_method_vertical": "center",
+            "alignment_method_horizontal": "center",
+            "preserve_from_source_canvas": "none",
+            "pad_to_maximum": False,
+        }
+    )
+    indexes = ("label",)
+
     def __init__(
         self,
         label: Optional[str] = None,
@@ -21,40 +60,6 @@ class CanvasTemplate(Base):
         round_: Optional[RoundStrategy] = None,
     ):
         super().__init__()
-        self.attributes = [
-            "label",
-            "id",
-            "target_dimensions",
-            "target_anamorphic_squeeze",
-            "fit_source",
-            "fit_method",
-            "alignment_method_vertical",
-            "alignment_method_horizontal",
-            "preserve_from_source_canvas",
-            "maximum_dimensions",
-            "pad_to_maximum",
-            "round",
-        ]
-
-        self.kwarg_map = {"id": "id_", "round": "round_"}
-        self.object_map = {"target_dimensions": Dimensions, "maximum_dimensions": Dimensions, "round": RoundStrategy}
-        self.required = [
-            "id",
-            "target_dimensions",
-            "target_anamorphic_squeeze",
-            "fit_source",
-            "fit_method",
-            "pad_to_maximum.maximum_dimensions",
-        ]
-        self.defaults = {
-            "target_anamorphic_squeeze": 1,
-            "fit_source": "framing_decision.dimensions",
-            "alignment_method_vertical": "center",
-            "alignment_method_horizontal": "center",
-            "preserve_from_source_canvas": "none",
-            "pad_to_maximum": False,
-        }
-
         self.label = label
         self.id = id_
         self.target_dimensions = target_dimensions
@@ -77,6 +82,7 @@ class CanvasTemplate(Base):
         self._target_dimensions = dim
         if dim is not None:
             self._target_dimensions.dtype = int
+        self._changed(dim)
 
     @property
     def maximum_dimensions(self) -> Union[Dimensions, None]:
@@ -87,6 +93,7 @@ class CanvasTemplate(Base):
         self._maximum_dimensions = dim
         if dim is not None:
             self._maximum_dimensions.dtype = int
+        self._changed(dim)
 
     @property
     def fit_source(self) -> str:
@@ -108,6 +115,7 @@ class CanvasTemplate(Base):
             raise FDLError(msg)
 
         self._fit_source = value
+        self._changed()
 
     @property
     def fit_method(self) -> str:
@@ -124,6 +132,7 @@ class CanvasTemplate(Base):
             raise FDLError(msg)
 
         self._fit_method = value
+        self._changed()
 
     @property
     def alignment_method_vertical(self) -> str:
@@ -140,6 +149,7 @@ class CanvasTemplate(Base):
             raise FDLError(msg)
 
         self._alignment_method_vertical = value
+        self._changed()
 
     @property
     def alignment_method_horizontal(self) -> str:
@@ -156,6 +166,7 @@ class CanvasTemplate(Base):
             raise FDLError(msg)
 
         self._alignment_method_horizontal = value
+        self._changed()
 
     @property
     def preserve_from_source_canvas(self) -> str:
@@ -178,6 +189,7 @@ class CanvasTemplate(Base):
             raise FDLError(msg)
 
         self._preserve_from_source_canvas = value
+        self._changed()
 
     def get_desqueezed_width(self, source_width: float, squeeze_factor: float) -> float:
         """
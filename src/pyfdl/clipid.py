@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Optional, Union
 
 from pyfdl import Base
@@ -5,6 +6,10 @@ from pyfdl.errors import FDLError
 
 
 class FileSequence(Base):
+    attributes = ("value", "idx", "min", "max")
+    required = ("value", "idx", "min", "max")
+    kwarg_map = MappingProxyType({"min": "min_", "max": "max_"})
+
     def __init__(
             self,
             value: Optional[str] = None,
@@ -16,10 +21,6 @@ class FileSequence(Base):
         self._min = 0
         self._max = 0
 
-        self.attributes = ["value", "idx", "min", "max"]
-        self.required = ["value", "idx", "min", "max"]
-        self.kwarg_map = {"min": "min_", "max": "max_"}
-
         self.value = value
         self.idx = idx
         self.min = min_
@@ -35,6 +36,7 @@ class FileSequence(Base):
             raise FDLError("Sequences do not allow negative values")
 
         self._min = value
+        self._changed()
 
     @property
     def max(self) -> int:
@@ -46,12 +48,17 @@ class FileSequence(Base):
             raise FDLError("Sequences do not allow negative values")
 
         self._max = value
+        self._changed()
 
     def __repr__(self):
         return self.to_dict()
 
 
 class ClipID(Base):
+    attributes = ("clip_name", "file", "sequence")
+    object_map = MappingProxyType({"sequence": FileSequence})
+    required = ("clip_name",)
+
     def __init__(
             self,
             clip_name: Optional[str] = None,
@@ -63,10 +70,6 @@ class ClipID(Base):
         self._file = None
         self._sequence = None
 
-        self.attributes = ["clip_name", "file", "sequence"]
-        self.object_map = {"sequence": FileSequence}
-        self.required = ["clip_name"]
-
         self.clip_name = clip_name
         self.file = file
         self.sequence = sequence
@@ -81,6 +84,7 @@ class ClipID(Base):
             raise FDLError("A sequence is already provided. You may only have file OR sequence as an identifier")
 
         self._file = file
+        self._changed()
 
     @property
     def sequence(self) -> Union[FileSequence, None]:
@@ -92,6 +96,7 @@ class ClipID(Base):
             raise FDLError("A file is already provided. You may only have file OR sequence as an identifier")
 
         self._sequence = sequence
+        self._changed(sequence)
 
     def __repr__(self):
         return (
@@ -0,0 +1,206 @@
+from typing import Any, Callable, Optional
+
+from .common import Base, LazyCollection, TypedCollection
+from .errors import FDLError
+from .validators import get_schema
+
+
+def _resolve(node: dict, schema: dict) -> dict:
+    ref = node.get("$ref")
+    if ref is None:
+        return node
+
+    # Only local references like "#/$defs/dimensions_int" are used in the spec
+    target = schema
+    for part in ref.lstrip("#/").split("/"):
+        target = target[part]
+
+    return target
+
+
+def map_schema_arrays(root_cls: type, schema: dict) -> dict:
+    """Walk the schema along with the `object_map` of the classes to figure out which
+    attributes hold arrays of objects and which hold single objects.
+
+    Args:
+        root_cls: class matching the root of the schema
+        schema: json schema
+
+    Returns:
+        arrays: mapping classes to a `dict` of attribute names and `True` if the value is an array
+    """
+    arrays = {}
+    stack = [(root_cls, schema)]
+    while stack:
+        cls, node = stack.pop()
+        properties = node.get("properties", {})
+        fields = cls.get_fields()
+        layout = arrays.setdefault(cls, {})
+
+        for key, child_cls in fields.object_map.items():
+            child_node = properties.get(key)
+            if child_node is None or key in layout:
+                continue
+
+            child_node = _resolve(child_node, schema)
+            is_array = child_node.get("type") == "array"
+            layout[key] = is_array
+            if is_array:
+                child_node = _resolve(child_node.get("items", {}), schema)
+
+            stack.append((child_cls, child_node))
+
+    return arrays
+
+
+def _generate_to_dict(fields: Any, layout: dict) -> tuple[str, dict]:
+    namespace = {"TypedCollection": TypedCollection, "Base": Base, "FDLError": FDLError}
+    lines = ["def to_dict(self):"]
+
+    names = {}
+    for idx, key in enumerate(fields.attributes):
+        names[key] = f"v{idx}"
+        lines.append(f"    v{idx} = self.{key}")
+
+    # Required attributes, checked the same way as `Base.check_required`
+    lines.append("    missing = []")
+    for attr1, attr2 in fields.required_links:
+        name1 = names.get(attr1, f"self.{attr1}")
+        if attr2 is None:
+            lines.append(f"    if {name1} is None:")
+            lines.append(f"        missing.append({attr1!r})")
+        else:
+            name2 = names.get(attr2, f"self.{attr2}")
+            lines.append(f"    if {name1} is not None and {name2} is None:")
+            lines.append(f"        missing.append({attr2!r})")
+
+    lines.append("    data = {}")
+    for key in fields.attributes:
+        name = names[key]
+        required = key in fields.required_keys
+        is_array = layout.get(key)
+
+        if is_array:
+            value = f"{name}.to_list()"
+            test = f"isinstance({name}, TypedCollection)"
+            if required:
+                lines.append(f"    data[{key!r}] = {value} if {test} else {name}")
+            else:
+                lines.append(f"    if {test}:")
+                lines.append(f"        data[{key!r}] = {value}")
+                lines.append(f"    elif {name}:")
+                lines.append(f"        data[{key!r}] = {name}")
+            continue
+
+        if is_array is False:
+            # Known single object from the schema
+            value = f"{name}.to_dict() if {name} is not None else None"
+        elif key in fields.object_map:
+            # Not described in the schema. Fall back to checking the value
+            value = (
+                f"{name}.to_list() if isinstance({name}, TypedCollection) "
+                f"else {name}.to_dict() if isinstance({name}, Base) else {name}"
+            )
+        else:
+            value = name
+
+        if required:
+            lines.append(f"    data[{key!r}] = {value}")
+        elif key in fields.object_map and is_array is None:
+            lines.append(f"    if {name} or isinstance({name}, TypedCollection):")
+            lines.append(f"        data[{key!r}] = {value}")
+        else:
+            lines.append(f"    if {name}:")
+            lines.append(f"        data[{key!r}] = {value}")
+
+    lines.append("    if missing:")
+    lines.append('        raise FDLError(f"{self!r} is missing some required attributes: {missing}")')
+    lines.append("    return data")
+
+    return "\n".join(lines), namespace
+
+
+def _generate_from_dict(fields: Any, layout: dict) -> tuple[str, dict]:
+    namespace = {"TypedCollection": TypedCollection, "LazyCollection": LazyCollection}
+    lines = ["def from_dict(cls, raw, lazy=False):", "    kwargs = {}", "    get = raw.get"]
+
+    for idx, (key, keyword, obj_cls) in enumerate(fields.from_dict_plan):
+        lines.append(f"    value = get({key!r})")
+        lines.append("    if value is not None:")
+
+        if obj_cls is None:
+            lines.append(f"        kwargs[{keyword!r}] = value")
+            continue
+
+        cls_name = f"cls{idx}"
+        namespace[cls_name] = obj_cls
+        is_array = layout.get(key)
+        collection = [
+            "if lazy:",
+            f"    kwargs[{keyword!r}] = LazyCollection({cls_name}, value)",
+            "else:",
+            f"    tc = TypedCollection({cls_name})",
+            "    add = tc.add",
+            f"    item_from_dict = {cls_name}.from_dict",
+            "    for item in value:",
+            "        add(item_from_dict(item))",
+            f"    kwargs[{keyword!r}] = tc",
+        ]
+
+        if is_array:
+            lines.extend(f"        {line}" for line in collection)
+        elif is_array is False:
+            lines.append(f"        kwargs[{keyword!r}] = {cls_name}.from_dict(value)")
+        else:
+            lines.append("        if isinstance(value, list):")
+            lines.extend(f"            {line}" for line in collection)
+            lines.append("        else:")
+            lines.append(f"            kwargs[{keyword!r}] = {cls_name}.from_dict(value)")
+
+    lines.append("    return cls(**kwargs)")
+
+    return "\n".join(lines), namespace
+
+
+def _compile(source: str, namespace: dict, name: str, cls: type) -> Callable:
+    code = compile(source, f"<pyfdl.codegen {cls.__name__}.{name}>", "exec")
+    exec(code, namespace)  # noqa: S102
+    return namespace[name]
+
+
+def compile_serializers(classes: Optional[list] = None, schema: Optional[dict] = None) -> None:
+    """Generate specialized `to_dict` and `from_dict` functions for model classes based on their
+    field registry and the json schema. The functions are stored in the registry of each class and used
+    by [Base.to_dict](common.md#pyfdl.Base.to_dict) and [Base.from_dict](common.md#pyfdl.Base.from_dict).
+
+    This is done for the built-in classes when importing PyFDL.
+
+    Args:
+        classes: to generate functions for. Defaults to all subclasses of `Base` declaring their fields
+            on the class
+        schema: json schema describing an FDL. Defaults to the bundled schema of the current version
+    """
+    from .fdl import FDL
+
+    if schema is None:
+        schema = get_schema()
+
+    if classes is None:
+        classes = []
+        stack = list(Base.__subclasses__())
+        while stack:
+            cls = stack.pop()
+            stack.extend(cls.__subclasses__())
+            if cls.__dict__.get("_fields") is not None:
+                classes.append(cls)
+
+    arrays = map_schema_arrays(FDL, schema)
+    for cls in classes:
+        fields = cls.get_fields()
+        layout = arrays.get(cls, {})
+
+        source, namespace = _generate_to_dict(fields, layout)
+        fields.serializer = _compile(source, namespace, "to_dict", cls)
+
+        source, namespace = _generate_from_dict(fields, layout)
+        fields.deserializer = _compile(source, namespace, "from_dict", cls)
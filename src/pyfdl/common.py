@@ -1,6 +1,12 @@
+import functools
 import math
+import operator
 import uuid
-from typing import Any, Optional, Union
+import weakref
+from collections.abc import Sequence
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Any, Callable, Optional, Union
 
 from pyfdl.errors import FDLError
 from pyfdl.rounding import get_rounding_strategy
@@ -10,43 +16,289 @@ FDL_SCHEMA_MINOR = 0
 FDL_SCHEMA_VERSION = {"major": FDL_SCHEMA_MAJOR, "minor": FDL_SCHEMA_MINOR}
 
 
+# Values of these types are immutable and safe to share between copies
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Internal bookkeeping that is never copied or pickled
+_UNTRACKED = frozenset(("_dict_cache", "_relations_cache", "_parent", "_adopted"))
+
+
+# Attribute names of pickled objects, shared by all objects with the same layout.
+# Pickle stores each shared tuple once and refers back to it for the following objects
+_STATE_KEYS = {}
+
+
+def _restore(cls: type, keys: tuple, values: tuple) -> Any:
+    """Recreate a pickled [Base](common.md#pyfdl.Base) object from its compact state"""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(zip(keys, values))
+
+    return obj
+
+
+def _adopt(child: Any, parent_ref: weakref.ref) -> None:
+    """Register a parent to notify when `child` changes. Values shared between
+    several objects keep a reference to each of them.
+    """
+    current = child._parent
+    if current is None:
+        child._parent = parent_ref
+
+    elif type(current) is tuple:
+        if parent_ref not in current:
+            child._parent = (*current, parent_ref)
+
+    elif current is not parent_ref:
+        child._parent = (current, parent_ref)
+
+
+def _adopt_value(value: Any, parent_ref: weakref.ref) -> None:
+    """Register a parent to notify when an attribute value or the items of a collection change"""
+    if isinstance(value, TypedCollection):
+        value._owner = parent_ref
+        # Items of untouched lazy collections are adopted as they're created
+        if not isinstance(value, LazyCollection) or value.is_materialized:
+            for item in value._data.values():
+                if item._parent is None:
+                    item._parent = parent_ref
+                else:
+                    _adopt(item, parent_ref)
+
+    elif isinstance(value, Base):
+        _adopt(value, parent_ref)
+
+
+def _track_attributes(cls: type, attributes: Sequence[str]) -> None:
+    """Make the plain attributes of a class mark their objects as changed when set.
+    Attributes handled by properties are left alone, as their setters do it themselves.
+    """
+    for key in attributes:
+        if not any(key in klass.__dict__ for klass in cls.__mro__):
+            setattr(cls, key, _Field(key))
+
+    cls._tracked = True
+
+
+class _Field:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        """Plain attribute of a [Base](common.md#pyfdl.Base) subclass, marking its object as changed when set.
+        There's no `__get__`, so values are read straight from the `__dict__` of the object.
+        """
+        self.name = name
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = value
+        # Objects aren't tracked while they're built, only after a cache has been filled
+        if obj._adopted or obj._parent is not None:
+            obj._changed(value)
+
+
+class _Fields:
+    def __init__(
+        self,
+        attributes: list,
+        kwarg_map: dict,
+        object_map: dict,
+        required: list,
+        defaults: dict,
+        id_attribute: str,
+        indexes: Optional[list] = None,
+    ):
+        """Metadata describing the fields of a [Base](common.md#pyfdl.Base) subclass.
+        Built once per class and shared by all its instances.
+        """
+        self.attributes = tuple(attributes)
+        self.kwarg_map = dict(kwarg_map)
+        self.object_map = dict(object_map)
+        self.required = tuple(required)
+        self.defaults = dict(defaults)
+        self.id_attribute = id_attribute
+        self.indexes = tuple(indexes or ())
+
+        # Lookup set used to decide if empty values may be omitted
+        self.required_keys = frozenset(required)
+
+        # Pre-split linked requirements like: "effective_dimensions.effective_anchor_point"
+        self.required_links = tuple(
+            tuple(required_key.split(".")) if "." in required_key else (required_key, None)
+            for required_key in required
+        )
+
+        # Values of the attributes holding objects or collections, which notify their parent of changes
+        self.child_keys = tuple(key for key in self.attributes if key in self.object_map)
+        if len(self.child_keys) > 1:
+            self.get_children = operator.attrgetter(*self.child_keys)
+
+        else:
+            # A single attribute getter doesn't return a tuple
+            self.get_children = lambda obj: tuple(getattr(obj, key) for key in self.child_keys)
+
+        # (key, keyword, class) for every attribute, used when creating objects from dicts
+        self.from_dict_plan = tuple(
+            (key, self.kwarg_map.get(key, key), self.object_map.get(key)) for key in self.attributes
+        )
+
+        # Specialized functions generated by `pyfdl.codegen.compile_serializers`
+        self.serializer = None
+        self.deserializer = None
+
+    @classmethod
+    def from_source(cls, source: Any) -> "_Fields":
+        """Collect field metadata from a class or an instance"""
+        return cls(
+            attributes=source.attributes,
+            kwarg_map=source.kwarg_map,
+            object_map=source.object_map,
+            required=source.required,
+            defaults=source.defaults,
+            id_attribute=source.id_attribute,
+            indexes=getattr(source, "indexes", ()),
+        )
+
+
 class Base:
+    # Subclasses get a __dict__ unless they declare __slots__ of their own
+    __slots__ = ()
+
+    # Holds a tuple of known attributes
+    attributes = ()
+    # Maps attribute names that clash with reserved builtin functions to safe alternatives (id -> id_)
+    kwarg_map = MappingProxyType({})
+    # Map keys to custom classes
+    object_map = MappingProxyType({})
+    # Tuple of required attributes
+    required = ()
+    # Default values for attributes
+    defaults = MappingProxyType({})
+    # Attribute used as a unique identifier
+    id_attribute = "id"
+    # Attributes TypedCollections keep secondary indexes of
+    indexes = ()
+
+    # Field registry built once per class
+    _fields = None
+
+    # Cached output of `to_dict`, cleared when this object or one of its children change
+    _dict_cache = None
+    # Cached ids and references checked by `FDL.validate`, cleared along with `_dict_cache`
+    _relations_cache = None
+    # Weak reference(s) to the object(s) holding this object
+    _parent = None
+    # `True` once the children of this object notify it of changes
+    _adopted = False
+    # `True` once the plain attributes of the class track changes
+    _tracked = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = None
+        cls._tracked = False
+        # Subclasses declaring their fields in __init__ are resolved on first use in `get_fields`
+        if cls.attributes:
+            cls._fields = _Fields.from_source(cls)
+            _track_attributes(cls, cls._fields.attributes)
+
     def __init__(self):
         """Base class not to be instanced directly.
 
+        Subclasses describe their fields with the class level variables below. These are collected
+        into a registry once when the class is created and shared by all instances. They are read-only,
+        so sequences are declared as tuples and mappings are wrapped in `types.MappingProxyType`.
+
         Attributes:
-            attributes: list of attributes described in FDL spec
+            attributes: tuple of attributes described in FDL spec
             kwarg_map: map attribute names that clash with reserved builtin python functions to safe alternatives
                 like: (id -> id_) and (uuid -> uuid_)
             object_map: map attributes to custom classes
-            required: list of required attributes.
+            required: tuple of required attributes.
                 Supports linked attributes like: "effective_dimensions.effective_anchor_point" where
                 "effective_anchor_point" is required if "effective_dimensions" is set
             defaults: map default values to attributes. In addition to primitive values supports: callable,
                 subclasses of [Base](common.md#pyfdl.Base)
+            id_attribute: attribute used as a unique identifier
+            indexes: attributes a [TypedCollection](common.md#pyfdl.TypedCollection) keeps secondary indexes of.
+                Supports attributes of sub objects like: "clip_id.clip_name"
+
+        """
+
+    @classmethod
+    def get_fields(cls) -> _Fields:
+        """Get the field registry of this class.
 
+        Subclasses setting their field metadata on the instance in `__init__` instead of on the class
+        are supported by instancing the class once and caching the result.
+
+        Returns:
+            fields: registry shared by all instances of this class
         """
-        # Holds a list of known attributes
-        self.attributes = []
-        # Maps attribute names that clash with reserved builtin functions to safe alternatives (id -> id_)
-        self.kwarg_map = {}
-        # Map keys to custom classes
-        self.object_map = {}
-        # List of required attributes
-        self.required = []
-        # Default values for attributes
-        self.defaults = {}
-        # Attribute used as a unique identifier
-        self.id_attribute = "id"
+        fields = cls.__dict__.get("_fields")
+        if fields is None:
+            fields = _Fields.from_source(cls())
+            cls._fields = fields
+
+        return fields
+
+    def _get_fields(self) -> _Fields:
+        # Instances may still override the class level metadata
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict and "attributes" in instance_dict:
+            return _Fields.from_source(self)
+
+        return self.get_fields()
 
     @property
     def rounding_strategy(self) -> "RoundStrategy":
         return get_rounding_strategy()
 
+    def _changed(self, value: Any = None) -> None:
+        """Called by attribute setters after a value is set. Objects are only tracked once a cache has been
+        filled, so this does nothing while objects are built.
+
+        Args:
+            value: new value. Objects and collections are told to notify this object of their changes
+        """
+        if self._adopted:
+            if isinstance(value, (Base, TypedCollection)):
+                _adopt_value(value, weakref.ref(self))
+
+        elif self._parent is None:
+            return
+
+        self.invalidate()
+
+    @property
+    def is_dirty(self) -> bool:
+        """`True` if this object or any of its children changed since the last call to `to_dict`"""
+        return self._dict_cache is None
+
+    def invalidate(self) -> None:
+        """Mark this object and the objects holding it as changed, so `to_dict` builds a new
+        representation the next time it's called. Changes made through attributes and collections are
+        picked up automatically. Call this if values are changed behind the back of the objects.
+        """
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            if obj._dict_cache is not None:
+                obj._dict_cache = None
+            if obj._relations_cache is not None:
+                obj._relations_cache = None
+
+            parent = obj._parent
+            if parent is None:
+                continue
+
+            for ref in parent if type(parent) is tuple else (parent,):
+                parent_obj = ref()
+                if parent_obj is not None:
+                    stack.append(parent_obj)
+
     def apply_defaults(self) -> None:
         """Applies default values defined in the `defaults` attribute to attributes that are `None`"""
 
-        for key, value in self.defaults.items():
+        for key, value in self._get_fields().defaults.items():
             if getattr(self, key) is None:
                 # value is a function
                 if callable(value):
@@ -71,16 +323,15 @@ class Base:
         """
 
         missing = []
-        for required_key in self.required:
+        for attr1, attr2 in self._get_fields().required_links:
             # Check for dependant attributes.
             # Like "effective_anchor_point" required if "effective_dimensions" is provided
-            if "." in required_key:
-                attr1, attr2 = required_key.split(".")
+            if attr2 is not None:
                 if getattr(self, attr1) is not None and getattr(self, attr2) is None:
                     missing.append(attr2)
 
-            elif getattr(self, required_key) is None:
-                missing.append(required_key)
+            elif getattr(self, attr1) is None:
+                missing.append(attr1)
 
         return missing
 
@@ -88,19 +339,62 @@ class Base:
         """
         Produce a dictionary representation of the current object along with all sub objects.
 
+        The result is cached and returned as is until this object or one of its children change.
+        Please treat it as read-only, or make a copy before modifying it.
+
         Raises:
            FDLError: if required keys are missing
 
         Returns:
             representation of object
         """
+        data = self._dict_cache
+        if data is not None:
+            return data
+
+        fields = self._get_fields()
+        if fields.serializer is not None:
+            data = fields.serializer(self)
+        else:
+            data = self._build_dict(fields)
+
+        self._adopt_children(fields)
+        self._dict_cache = data
+
+        return data
+
+    def _adopt_children(self, fields: _Fields) -> None:
+        # Children notify us when they change. Set up the first time a cache is filled, after which
+        # new values and items are adopted by the setters and collections as they come in
+        if self._adopted:
+            return
+
+        if not type(self).__dict__.get("_tracked"):
+            # Subclasses declaring their fields in __init__
+            _track_attributes(type(self), fields.attributes)
+
+        self._adopted = True
+        self_ref = weakref.ref(self)
+        for value in fields.get_children(self):
+            if value is None:
+                continue
+
+            if isinstance(value, TypedCollection):
+                _adopt_value(value, self_ref)
+            elif value._parent is None:
+                value._parent = self_ref
+            else:
+                _adopt(value, self_ref)
+
+    def _build_dict(self, fields: _Fields) -> dict:
+        required_keys = fields.required_keys
 
         data = {}
-        for key in self.attributes:
+        for key in fields.attributes:
             value = getattr(self, key)
 
             # check if empty value should be omitted
-            if key not in self.required and not value and not isinstance(value, TypedCollection):
+            if key not in required_keys and not value and not isinstance(value, TypedCollection):
                 # Keys with arrays as values should pass (for now?)
                 continue
 
@@ -122,47 +416,132 @@ class Base:
         return data
 
     @classmethod
-    def from_dict(cls, raw: dict) -> Any:
+    def from_dict(cls, raw: dict, lazy: bool = False) -> Any:
         """Create instances of classes from a provided dict.
 
         Args:
             raw: dictionary to convert to supported classes
+            lazy: keep lists of items as [LazyCollection](common.md#pyfdl.LazyCollection)s which
+                only create their items when first accessed
 
         Returns:
             cls: and instance of the current class
         """
-        kwargs = {}
-        # We only use this to get access to attributes
-        _tmp_instance = cls()
+        fields = cls.get_fields()
+        if fields.deserializer is not None:
+            return fields.deserializer(cls, raw, lazy)
 
-        for key in _tmp_instance.attributes:
+        kwargs = {}
+        for key, keyword, _cls in fields.from_dict_plan:
             # We get the value before we convert the key to a valid name
             value = raw.get(key)
             if value is None:
                 continue
 
-            # Check for keyword override
-            keyword = _tmp_instance.kwarg_map.get(key, key)
-
-            if key in _tmp_instance.object_map:
-                if isinstance(value, list):
-                    _cls = _tmp_instance.object_map[key]
-
+            if _cls is not None:
+                if isinstance(value, list) and lazy:
+                    value = LazyCollection(_cls, value)
+                elif isinstance(value, list):
                     tc = TypedCollection(_cls)
                     for item in value:
                         tc.add(_cls.from_dict(item))
                     value = tc
                 else:
-                    value = _tmp_instance.object_map[key].from_dict(value)
+                    value = _cls.from_dict(value)
 
             kwargs[keyword] = value
 
         return cls(**kwargs)
 
+    def copy(self) -> Any:
+        """Create a deep copy of this object along with all sub objects.
+        The copy is made from the current state directly, skipping `__init__` and any checks.
+
+        Returns:
+            copy: of this object
+        """
+        state = self.__dict__
+        if "attributes" in state:
+            # Instance level metadata. Go through __init__ to be on the safe side
+            return self._copy_from_attributes()
+
+        cls = self.__class__
+        new = cls.__new__(cls)
+        new_state = new.__dict__
+        for name, value in state.items():
+            if name in _UNTRACKED:
+                continue
+
+            if type(value) in _PLAIN_TYPES:
+                pass
+
+            elif isinstance(value, (Base, TypedCollection)):
+                value = value.copy()
+
+            elif isinstance(value, (dict, list)):
+                value = deepcopy(value)
+
+            new_state[name] = value
+
+        return new
+
+    def _copy_from_attributes(self) -> Any:
+        kwargs = {}
+        for key, keyword, _ in self._get_fields().from_dict_plan:
+            value = getattr(self, key)
+            if isinstance(value, (Base, TypedCollection)):
+                value = value.copy()
+
+            elif isinstance(value, (dict, list)):
+                value = deepcopy(value)
+
+            kwargs[keyword] = value
+
+        return self.__class__(**kwargs)
+
     @staticmethod
     def generate_uuid():
         return str(uuid.uuid4())
 
+    def __deepcopy__(self, memo: dict) -> Any:
+        return self.copy()
+
+    def __getstate__(self) -> tuple[tuple, tuple]:
+        """Compact state used by `pickle`. Caches and references to parents are left out.
+
+        Returns:
+            state: attribute names and their values. Objects with the same layout share the tuple of names
+        """
+        state = getattr(self, "__dict__", None)
+        if state is None:
+            # Slotted classes
+            state = {
+                name: getattr(self, name)
+                for cls in type(self).__mro__
+                for name in cls.__dict__.get("__slots__", ())
+                if hasattr(self, name)
+            }
+
+        if not _UNTRACKED.isdisjoint(state):
+            state = {name: value for name, value in state.items() if name not in _UNTRACKED}
+
+        keys = tuple(state)
+        keys = _STATE_KEYS.setdefault(keys, keys)
+
+        return keys, tuple(state.values())
+
+    def __setstate__(self, state: Union[tuple[tuple, tuple], dict]) -> None:
+        # Also accepts the dicts of objects pickled by earlier versions
+        items = zip(*state) if isinstance(state, tuple) else state.items()
+
+        self._parent = None
+        for name, value in items:
+            setattr(self, name, value)
+
+    def __reduce__(self) -> tuple:
+        # Restored straight into the __dict__ of a new object, skipping `__init__` and attribute setters
+        return _restore, (type(self), *self.__getstate__())
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}"
 
@@ -170,20 +549,50 @@ class Base:
         return str(self.to_dict())
 
 
+def _get_attribute(item: Any, attribute: str) -> Any:
+    """Get the value of an attribute. Supports attributes of sub objects like: "clip_id.clip_name" """
+    for name in attribute.split("."):
+        if item is None:
+            return None
+        item = getattr(item, name)
+
+    return item
+
+
 class TypedCollection:
     def __init__(self, cls: Any):
         """Collection only accepting items of a given class.
         In addition, a strict control of unique id's is enforced.
+        Items keep the order they were added in and may be accessed by position or slice.
+
+        Secondary indexes are kept for the attributes listed in `cls.indexes`, making
+        [find](common.md#pyfdl.TypedCollection.find) a constant time lookup for those attributes.
+        Each index is built the first time it's searched, and kept up to date as items are added and removed.
+        Indexes reflect the values at the time they are built or items are added. If you change an indexed
+        attribute of an item already in the collection, call [reindex](common.md#pyfdl.TypedCollection.reindex).
 
         Args:
             cls: type of class to be accepted
         """
         self._cls = cls
         self._data = {}
+        # Order of ids for positional access. Rebuilt from `_data` when needed after items are removed
+        self._ids = []
+        # Secondary indexes built so far: {attribute: {value: {item_id: item}}}
+        self._indexes = {}
+        # Indexed values per item, so items may be removed even if their values changed
+        self._indexed_values = {}
+        # Weak reference to the object holding this collection, notified on changes
+        self._owner = None
 
     @property
-    def ids(self):
-        return list(self._data.keys())
+    def ids(self) -> list[str]:
+        """
+        Returns:
+            ids: of the items in the order they were added. A copy, so the collection may be changed
+                while looping over them
+        """
+        return list(self._data)
 
     def add(self, item: Any):
         """Add an item to the collection.
@@ -211,6 +620,13 @@ class TypedCollection:
                 msg = f'{item.__class__.__name__}.{item.id_attribute} ("{item_id}") already exists.'
                 raise FDLError(msg)
             self._data[item_id] = item
+            if self._ids is not None:
+                self._ids.append(item_id)
+            if self._indexes:
+                self._index_item(item_id, item)
+            if self._owner is not None:
+                _adopt(item, self._owner)
+                self._notify_owner()
 
         else:
             msg = f'Item must have a valid identifier ("{item.id_attribute}"), not None or empty string'
@@ -235,10 +651,98 @@ class TypedCollection:
         """
         if item_id in self._data:
             del self._data[item_id]
+            self._ids = None
+            self._unindex_item(item_id)
+            self._notify_owner()
+
+    def find(self, attribute: str, value: Any) -> list[Any]:
+        """Find items where `attribute` matches `value`.
+        Indexed attributes are looked up directly, others are found by checking every item.
+        Please note that `None` values are not indexed.
+
+        Args:
+            attribute: name of attribute. Supports attributes of sub objects like: "clip_id.clip_name"
+            value: to look for
+
+        Returns:
+            items: matching items in the order they were added
+        """
+        index = self._indexes.get(attribute)
+        if index is None and attribute in getattr(self._cls, "indexes", ()):
+            index = self._build_index(attribute)
+
+        if index is not None:
+            return list(index.get(value, {}).values())
+
+        return [item for item in self._data.values() if _get_attribute(item, attribute) == value]
+
+    def reindex(self) -> None:
+        """Rebuild the secondary indexes. Needed if indexed attributes of items are changed after
+        they were added to the collection
+        """
+        attributes = list(self._indexes)
+        self._indexes.clear()
+        self._indexed_values.clear()
+
+        for attribute in attributes:
+            self._build_index(attribute)
+
+    def _get_ids(self) -> list[str]:
+        if self._ids is None:
+            self._ids = list(self._data)
+
+        return self._ids
+
+    def _build_index(self, attribute: str) -> dict:
+        index = self._indexes[attribute] = {}
+        for item_id, item in self._data.items():
+            value = _get_attribute(item, attribute)
+            if value is not None:
+                index.setdefault(value, {})[item_id] = item
+                self._indexed_values.setdefault(item_id, {})[attribute] = value
+
+        return index
+
+    def _notify_owner(self) -> None:
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None:
+            owner.invalidate()
+
+    def _index_item(self, item_id: str, item: Any) -> None:
+        values = {}
+        for attribute, index in self._indexes.items():
+            value = _get_attribute(item, attribute)
+            if value is not None:
+                index.setdefault(value, {})[item_id] = item
+                values[attribute] = value
+
+        self._indexed_values[item_id] = values
+
+    def _unindex_item(self, item_id: str) -> None:
+        for attribute, value in self._indexed_values.pop(item_id, {}).items():
+            items = self._indexes[attribute][value]
+            del items[item_id]
+            if not items:
+                del self._indexes[attribute][value]
 
     def to_list(self) -> list[dict]:
         return [item.to_dict() for item in self]
 
+    def copy(self) -> "TypedCollection":
+        """Create a new collection with copies of all items
+
+        Returns:
+            copy: of this collection
+        """
+        collection = TypedCollection(self._cls)
+        # Items are known to be valid and unique, so we skip the checks in `add`.
+        # Indexes are built again when the copy is searched
+        for item_id, item in self._data.items():
+            collection._data[item_id] = item.copy()
+        collection._ids = None
+
+        return collection
+
     def _get_item_id(self, item: Any) -> str:
         """
         Get the "id" of the item based on the item's `id_attribute`
@@ -251,6 +755,10 @@ class TypedCollection:
         """
         return getattr(item, item.id_attribute)
 
+    def __reduce__(self) -> tuple:
+        # Indexes and views are rebuilt from the items rather than pickled along with them
+        return _restore_collection, (type(self), self._cls, tuple(self._data), tuple(self._data.values()))
+
     def __bool__(self):
         return bool(self._data)
 
@@ -260,8 +768,11 @@ class TypedCollection:
     def __iter__(self):
         yield from self._data.values()
 
-    def __getitem__(self, item):
-        return self.get(self.ids[item])
+    def __getitem__(self, item: Union[int, slice]) -> Union[Any, list[Any]]:
+        if isinstance(item, slice):
+            return [self._data[item_id] for item_id in self._get_ids()[item]]
+
+        return self._data[self._get_ids()[item]]
 
     def __contains__(self, item: Any) -> bool:
         # We support both looking for an item by item.id and "string" for future use of collection
@@ -273,7 +784,103 @@ class TypedCollection:
             return item in self._data
 
 
+def _restore_collection(collection_type: type, cls: Any, ids: tuple, items: tuple) -> TypedCollection:
+    """Recreate a pickled [TypedCollection](common.md#pyfdl.TypedCollection) from its items"""
+    collection = TypedCollection.__new__(collection_type)
+    TypedCollection.__init__(collection, cls)
+    if isinstance(collection, LazyCollection):
+        collection._raw = None
+
+    # Items are known to be valid and unique, so we skip the checks in `add`
+    collection._data.update(zip(ids, items))
+    collection._ids = None
+
+    return collection
+
+
+def _materialize(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._raw is not None:
+            self.materialize()
+
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+class LazyCollection(TypedCollection):
+    def __init__(self, cls: Any, raw: list[dict]):
+        """A [TypedCollection](common.md#pyfdl.TypedCollection) holding on to a list of dicts and only
+        creating its items the first time the collection is accessed.
+        Items are created lazily as well, so their own collections stay as dicts until accessed.
+
+        Args:
+            cls: type of class to be accepted
+            raw: list of dicts to create items from
+        """
+        super().__init__(cls)
+        self._raw = raw
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._raw is None
+
+    def copy(self) -> TypedCollection:
+        # The raw dicts are never modified, so an untouched collection may share them
+        if self._raw is not None:
+            return LazyCollection(self._cls, self._raw)
+
+        return super().copy()
+
+    def materialize(self) -> None:
+        """Create the items of this collection from the stored dicts"""
+        raw, self._raw = self._raw, None
+        if raw is None:
+            return
+
+        from_dict = self._cls.from_dict
+        for item in raw:
+            self.add(from_dict(item, lazy=True))
+
+    @property
+    @_materialize
+    def ids(self) -> list[str]:
+        return super().ids
+
+    add = _materialize(TypedCollection.add)
+    get = _materialize(TypedCollection.get)
+    remove = _materialize(TypedCollection.remove)
+    find = _materialize(TypedCollection.find)
+    reindex = _materialize(TypedCollection.reindex)
+    to_list = _materialize(TypedCollection.to_list)
+    __len__ = _materialize(TypedCollection.__len__)
+    __iter__ = _materialize(TypedCollection.__iter__)
+    __getitem__ = _materialize(TypedCollection.__getitem__)
+    __contains__ = _materialize(TypedCollection.__contains__)
+
+    def __reduce__(self) -> tuple:
+        # Untouched collections keep their items as dicts
+        if self._raw is not None:
+            return LazyCollection, (self._cls, self._raw)
+
+        return super().__reduce__()
+
+    def __bool__(self):
+        # Avoid creating items just to check if there are any
+        if self._raw is not None:
+            return bool(self._raw)
+
+        return super().__bool__()
+
+
 class Dimensions(Base):
+    # Compact representation as there may be a great number of these
+    __slots__ = ("_width", "_height", "_dtype", "_parent")
+
+    attributes = ("width", "height")
+    required = ("width", "height")
+
     def __init__(
         self,
         width: Optional[Union[int, float]] = None,
@@ -292,13 +899,38 @@ class Dimensions(Base):
         """
 
         super().__init__()
-        self.attributes = ["width", "height"]
-        self.required = ["width", "height"]
+        # New objects have nobody to notify, so the setters are skipped
+        self._parent = None
+        self._dtype = dtype
+        self._width = width
+        self._height = height
+
+    @property
+    def width(self) -> Union[int, float, None]:
+        return self._width
+
+    @width.setter
+    def width(self, value: Union[int, float, None]):
+        self._width = value
+        self._changed()
+
+    @property
+    def height(self) -> Union[int, float, None]:
+        return self._height
+
+    @height.setter
+    def height(self, value: Union[int, float, None]):
+        self._height = value
+        self._changed()
 
-        self.dtype = dtype
+    @property
+    def dtype(self) -> type:
+        return self._dtype
 
-        self.width = width
-        self.height = height
+    @dtype.setter
+    def dtype(self, value: type):
+        self._dtype = value
+        self._changed()
 
     def scale_by(self, factor: float) -> None:
         """
@@ -325,7 +957,12 @@ class Dimensions(Base):
 
     def to_dict(self) -> dict:
         # TODO: do we round before casting to int?
-        return {"width": self.dtype(self.width), "height": self.dtype(self.height)}
+        dtype = self._dtype
+        return {"width": dtype(self.width), "height": dtype(self.height)}
+
+    def __reduce__(self) -> tuple:
+        # Subclasses like the ones bound to a GeometryStore are pickled as plain values
+        return _restore_dimensions, (self.width, self.height, self.dtype)
 
     def __iter__(self):
         return iter((self.width, self.height))
@@ -349,6 +986,12 @@ class Dimensions(Base):
 
 
 class Point(Base):
+    # Compact representation as there may be a great number of these
+    __slots__ = ("_x", "_y", "_parent")
+
+    attributes = ("x", "y")
+    required = ("x", "y")
+
     def __init__(self, x: Optional[float] = None, y: Optional[float] = None):
         """Point properly formatted
 
@@ -357,11 +1000,51 @@ class Point(Base):
             y:
         """
         super().__init__()
-        self.attributes = ["x", "y"]
-        self.required = ["x", "y"]
+        # New objects have nobody to notify, so the setters are skipped
+        self._parent = None
+        self._x = x
+        self._y = y
 
-        self.x = x
-        self.y = y
+    @property
+    def x(self) -> Union[int, float, None]:
+        return self._x
+
+    @x.setter
+    def x(self, value: Union[int, float, None]):
+        self._x = value
+        self._changed()
+
+    @property
+    def y(self) -> Union[int, float, None]:
+        return self._y
+
+    @y.setter
+    def y(self, value: Union[int, float, None]):
+        self._y = value
+        self._changed()
+
+    def copy(self) -> "Point":
+        """
+        Create a copy of this point
+
+        Returns:
+            copy: of this point
+        """
+
+        return Point(x=self.x, y=self.y)
+
+    def to_dict(self) -> dict:
+        x = self.x
+        y = self.y
+        if x is None or y is None:
+            msg = f"{self!r} is missing some required attributes: {self.check_required()}"
+            raise FDLError(msg)
+
+        return {"x": x, "y": y}
+
+    def __reduce__(self) -> tuple:
+        # Subclasses like the ones bound to a GeometryStore are pickled as plain values
+        return _restore_point, (self.x, self.y)
 
     def __iter__(self):
         return iter((self.x, self.y))
@@ -373,7 +1056,31 @@ class Point(Base):
         return f"{self.__class__.__name__}(x={self.x}, y={self.y})"
 
 
+def _restore_dimensions(width: Union[int, float], height: Union[int, float], dtype: type) -> Dimensions:
+    # Skip `__init__` of new objects
+    dimensions = Dimensions.__new__(Dimensions)
+    dimensions._parent = None
+    dimensions._dtype = dtype
+    dimensions._width = width
+    dimensions._height = height
+
+    return dimensions
+
+
+def _restore_point(x: Union[int, float], y: Union[int, float]) -> Point:
+    point = Point.__new__(Point)
+    point._parent = None
+    point._x = x
+    point._y = y
+
+    return point
+
+
 class RoundStrategy(Base):
+    attributes = ("even", "mode")
+    required = ("even", "mode")
+    defaults = MappingProxyType({"even": "even", "mode": "up"})
+
     def __init__(self, even: Optional[str] = None, mode: Optional[str] = None):
         """Describes how to handle rounding canvas dimensions when applying a
         [CanvasTemplate](canvas_template.md#pyfdl.CanvasTemplate).
@@ -392,10 +1099,6 @@ class RoundStrategy(Base):
             FDLError: if you provide a value other than the ones listed above
         """
         super().__init__()
-        self.attributes = ["even", "mode"]
-        self.required = ["even", "mode"]
-        self.defaults = {"even": "even", "mode": "up"}
-
         self.even = even
         self.mode = mode
 
@@ -416,6 +1119,7 @@ class RoundStrategy(Base):
             raise FDLError(msg)
 
         self._even = value
+        self._changed()
 
     @property
     def mode(self):
@@ -429,6 +1133,7 @@ class RoundStrategy(Base):
             raise FDLError(msg)
 
         self._mode = value
+        self._changed()
 
     @property
     def rules(self) -> dict:
@@ -0,0 +1,102 @@
+import bz2
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import IO, Optional
+
+from .errors import FDLError
+
+# Compressions of the standard library, and the suffixes of files using them
+COMPRESSIONS = {".gz": "gzip", ".xz": "xz", ".bz2": "bz2"}
+
+# Compressed data starts with these bytes. Json can't, so plain files are never mistaken for compressed ones
+_MAGIC = {b"\x1f\x8b": "gzip", b"\xfd7zXZ\x00": "xz", b"BZh": "bz2"}
+_MAGIC_SIZE = max(len(magic) for magic in _MAGIC)
+
+
+def get_compression(path: Path) -> Optional[str]:
+    """
+    Args:
+        path: to file
+
+    Returns:
+        compression: "gzip", "xz" or "bz2" based on the suffix of `path`, or `None` for other files
+    """
+    return COMPRESSIONS.get(path.suffix.lower())
+
+
+def detect_compression(fp: IO[bytes]) -> Optional[str]:
+    """Look at the first bytes of a binary stream to find out how it's compressed.
+    The position of the stream is left as it was.
+
+    Args:
+        fp: seekable binary stream
+
+    Returns:
+        compression: "gzip", "xz" or "bz2", or `None` for uncompressed data
+    """
+    header = fp.read(_MAGIC_SIZE)
+    fp.seek(-len(header), io.SEEK_CUR)
+
+    return next((compression for magic, compression in _MAGIC.items() if header.startswith(magic)), None)
+
+
+def open_decompressed(fp: IO[bytes]) -> IO[bytes]:
+    """Wrap a binary stream so compressed data is decompressed while it's read.
+    Data is decompressed in chunks, so the whole file is never decompressed in one go.
+    Closing the returned stream leaves `fp` open.
+
+    Args:
+        fp: seekable binary stream of compressed or uncompressed data
+
+    Returns:
+        stream: of decompressed data. `fp` itself if it isn't compressed
+    """
+    compression = detect_compression(fp)
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fp, mode="rb")
+
+    if compression == "xz":
+        return lzma.LZMAFile(fp, mode="rb")
+
+    if compression == "bz2":
+        return bz2.BZ2File(fp, mode="rb")
+
+    return fp
+
+
+def open_compressed(fp: IO[bytes], compression: str, compression_level: Optional[int] = None) -> IO[bytes]:
+    """Wrap a binary stream so data is compressed while it's written.
+    Closing the returned stream finishes the compressed data, but leaves `fp` open.
+
+    Args:
+        fp: binary stream to write compressed data to
+        compression: "gzip", "xz" or "bz2"
+        compression_level: 0-9 (1-9 for "bz2"), where lower levels are faster and higher levels make
+            smaller files. Defaults to 9 for "gzip" and "bz2", and 6 for "xz"
+
+    Raises:
+        FDLError: for unknown compressions or levels
+
+    Returns:
+        stream: compressing data written to it
+    """
+    lowest = 1 if compression == "bz2" else 0
+    if compression_level is not None and compression_level not in range(lowest, 10):
+        msg = f'Compression level of "{compression}" must be between {lowest} and 9, not {compression_level!r}'
+        raise FDLError(msg)
+
+    if compression == "gzip":
+        level = 9 if compression_level is None else compression_level
+        # No file name or time in the header, so the same FDL always gives the same bytes
+        return gzip.GzipFile(filename="", fileobj=fp, mode="wb", compresslevel=level, mtime=0)
+
+    if compression == "xz":
+        return lzma.LZMAFile(fp, mode="wb", preset=compression_level)
+
+    if compression == "bz2":
+        return bz2.BZ2File(fp, mode="wb", compresslevel=9 if compression_level is None else compression_level)
+
+    msg = f"Unknown compression: {compression!r}. Please use one of {sorted(COMPRESSIONS.values())}"
+    raise FDLError(msg)
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Optional
 
 from pyfdl import Base, Canvas, TypedCollection
@@ -5,6 +6,12 @@ from pyfdl.clipid import ClipID
 
 
 class Context(Base):
+    attributes = ("label", "context_creator", "clip_id", "canvases")
+    defaults = MappingProxyType({"context_creator": "PyFDL"})
+    object_map = MappingProxyType({"clip_id": ClipID, "canvases": Canvas})
+    id_attribute = "label"
+    indexes = ("clip_id.clip_name",)
+
     def __init__(
         self,
         label: Optional[str] = None,
@@ -13,11 +20,6 @@ class Context(Base):
         clip_id: Optional[ClipID] = None,
     ):
         super().__init__()
-        self.attributes = ["label", "context_creator", "clip_id", "canvases"]
-        self.defaults = {"context_creator": "PyFDL"}
-        self.object_map = {"clip_id": ClipID, "canvases": Canvas}
-        self.id_attribute = "label"
-
         self.label = label
         self.context_creator = context_creator
         self.clip_id = clip_id
@@ -1,9 +1,69 @@
+from typing import Any, Optional
+
+
 class FDLError(Exception):
     pass
 
 
+class ValidationIssue:
+    def __init__(self, path: str, kind: str, value: Any, message: str):
+        """A single problem found when validating an FDL
+
+        Args:
+            path: JSON pointer to the offending value like: "/contexts/0/canvases/1/source_canvas_id"
+            kind: "duplicate_id", "source_canvas_id" or "framing_intent_id" for broken relations,
+                otherwise the json schema keyword that failed like: "required" or "pattern"
+            value: the offending value
+            message: describing the problem
+        """
+        self.path = path
+        self.kind = kind
+        self.value = value
+        self.message = message
+
+    def __eq__(self, other):
+        if not isinstance(other, ValidationIssue):
+            return NotImplemented
+
+        return (self.path, self.kind, self.value, self.message) == (
+            other.path,
+            other.kind,
+            other.value,
+            other.message,
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path!r}, kind={self.kind!r}, value={self.value!r})"
+
+    def __str__(self):
+        if self.path:
+            return f"{self.path}: {self.message}"
+
+        return self.message
+
+
 class FDLValidationError(FDLError):
-    pass
+    def __init__(self, msg: str, errors: Optional[list[ValidationIssue]] = None):
+        """
+        Args:
+            msg: error message
+            errors: the issues found during validation
+        """
+        super().__init__(msg)
+        self.errors = errors or []
+
+    @classmethod
+    def from_errors(cls, errors: list[ValidationIssue]) -> "FDLValidationError":
+        """
+        Args:
+            errors: the issues found during validation
+
+        Returns:
+            error: with a message listing all issues
+        """
+        nl = "\n"
+        msg = f"Validation failed!\n" f"{f'{nl}'.join(str(error) for error in errors)}"
+        return cls(msg, errors=errors)
 
 
 class HandlerError(FDLError):
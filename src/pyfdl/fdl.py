@@ -1,19 +1,61 @@
-import json
-from pathlib import Path
+from collections.abc import Iterator
+from itertools import islice
+from types import MappingProxyType
 from typing import Optional
 
-import jsonschema
-
 from .canvas import Canvas
 from .canvas_template import CanvasTemplate
-from .common import FDL_SCHEMA_MAJOR, FDL_SCHEMA_MINOR, FDL_SCHEMA_VERSION, Base, TypedCollection
+from .common import (
+    FDL_SCHEMA_MAJOR,
+    FDL_SCHEMA_MINOR,
+    FDL_SCHEMA_VERSION,
+    Base,
+    TypedCollection,
+)
 from .context import Context
-from .errors import FDLError, FDLValidationError
+from .errors import FDLError, FDLValidationError, ValidationIssue
 from .framing_intent import FramingIntent
 from .header import Header
+from .validators import get_schema, get_validator, iter_schema_issues
+
+
+def _canvas_relations(canvas: Canvas) -> tuple:
+    relations = canvas._relations_cache
+    if relations is None:
+        canvas._adopt_children(canvas._get_fields())
+        relations = (canvas.id, canvas.source_canvas_id, tuple(canvas.framing_decisions))
+        canvas._relations_cache = relations
+
+    return relations
+
+
+def _context_relations(context: Context) -> tuple:
+    relations = context._relations_cache
+    if relations is None:
+        context._adopt_children(context._get_fields())
+        relations = tuple(_canvas_relations(canvas) for canvas in context.canvases)
+        context._relations_cache = relations
+
+    return relations
 
 
 class FDL(Base):
+    attributes = (
+        "uuid",
+        "version",
+        "fdl_creator",
+        "default_framing_intent",
+        "framing_intents",
+        "contexts",
+        "canvas_templates",
+    )
+    kwarg_map = MappingProxyType({"uuid": "uuid_"})
+    required = ("uuid", "version")
+    defaults = MappingProxyType({"uuid": Base.generate_uuid, "fdl_creator": "PyFDL", "version": FDL_SCHEMA_VERSION})
+    object_map = MappingProxyType(
+        {"framing_intents": FramingIntent, "contexts": Context, "canvas_templates": CanvasTemplate}
+    )
+
     def __init__(
         self,
         uuid_: Optional[str] = None,
@@ -25,20 +67,6 @@ class FDL(Base):
         canvas_templates: Optional[TypedCollection] = None,
     ):
         super().__init__()
-        self.attributes = [
-            "uuid",
-            "version",
-            "fdl_creator",
-            "default_framing_intent",
-            "framing_intents",
-            "contexts",
-            "canvas_templates",
-        ]
-        self.kwarg_map = {"uuid": "uuid_"}
-        self.required = ["uuid", "version"]
-        self.defaults = {"uuid": Base.generate_uuid, "fdl_creator": "PyFDL", "version": FDL_SCHEMA_VERSION}
-        self.object_map = {"framing_intents": FramingIntent, "contexts": Context, "canvas_templates": CanvasTemplate}
-
         self.uuid = uuid_
         self.version = version
         self.fdl_creator = fdl_creator
@@ -46,7 +74,6 @@ class FDL(Base):
         self.default_framing_intent = default_framing_intent
         self.contexts = contexts or TypedCollection(Context)
         self.canvas_templates = canvas_templates or TypedCollection(CanvasTemplate)
-        self._schema = None
 
     def place_canvas_in_context(self, context_label: str, canvas: Canvas):
         """Place a canvas in a context. If no context with the provided label exist,
@@ -102,67 +129,161 @@ class FDL(Base):
             raise FDLError(msg)
 
         self._default_framing_intent = framing_intent_id
+        self._changed()
 
-    def validate(self):
+    def validate(self, raw: Optional[dict] = None, fail_fast: bool = False, max_errors: Optional[int] = None):
         """Validate the current state of the FDL.
          ID's and relationships between items are checked and values are
          validated against the json schema.
 
+        Args:
+            raw: parsed json this FDL was just created from. Validated against the json schema
+                as is, instead of serializing the FDL with `to_dict` first
+            fail_fast: stop at the first error found
+            max_errors: stop after finding this many errors
+
         Raises:
-            FDLValidationError: if any errors are found
+            FDLValidationError: if any errors are found. The structured errors are available in its
+                `errors` attribute
+            ValueError: if `max_errors` is less than 1
         """
-        if not self._schema:
-            self._schema = self.load_schema()
+        errors = self.validation_errors(raw=raw, fail_fast=fail_fast, max_errors=max_errors)
+        if errors:
+            raise FDLValidationError.from_errors(errors)
 
-        errors = []
+    def validation_errors(
+        self, raw: Optional[dict] = None, fail_fast: bool = False, max_errors: Optional[int] = None
+    ) -> list[ValidationIssue]:
+        """Validate the FDL like [validate](fdl.md#pyfdl.FDL.validate), but return the errors instead of
+        raising an exception. Validation stops as soon as `max_errors` errors are found, so gatekeeping
+        doesn't pay for traversing the whole FDL when a single error is enough.
 
+        Args:
+            raw: parsed json this FDL was just created from. Validated against the json schema
+                as is, instead of serializing the FDL with `to_dict` first
+            fail_fast: stop at the first error found. Same as `max_errors=1`
+            max_errors: stop after finding this many errors
+
+        Raises:
+            ValueError: if `max_errors` is less than 1
+
+        Returns:
+            errors: found, relational errors first. Empty if the FDL is valid
+        """
+        if max_errors is not None and max_errors < 1:
+            msg = f"max_errors must be at least 1, not {max_errors}. Use None to find all errors"
+            raise ValueError(msg)
+
+        if fail_fast:
+            max_errors = 1
+
+        return list(islice(self.iter_validation_errors(raw=raw), max_errors))
+
+    def iter_validation_errors(self, raw: Optional[dict] = None, schema: bool = True) -> Iterator[ValidationIssue]:
+        """Validate the FDL and yield errors as they're found. Relational errors come first,
+        followed by errors from the json schema.
+
+        Args:
+            raw: parsed json this FDL was just created from. Validated against the json schema
+                as is, instead of serializing the FDL with `to_dict` first
+            schema: validate against the json schema. Turn off if the json was validated separately
+
+        Returns:
+            errors:
+        """
         # Check internal relations
-        canvases = TypedCollection(Canvas)
-        canvas_collections = [context.canvases for context in self.contexts]
+        yield from self._relation_errors()
+        if not schema:
+            return
+
+        # Check structure and values against json schema
+        validator = get_validator(*self.schema_version)
+        yield from iter_schema_issues(validator, self.to_dict() if raw is None else raw)
 
-        for canvas_collection in canvas_collections:
-            for canvas in canvas_collection:
-                canvases.add(canvas)
+    def _relation_errors(self) -> tuple[ValidationIssue, ...]:
+        """Check that canvas ids are unique and that `source_canvas_id` and `framing_intent_id`
+        point to registered items.
 
-        for canvas in canvases:
-            if canvases.get(canvas.source_canvas_id) is None:
+        Ids and references are cached per canvas and context, and dropped when they change.
+        Only changed objects are visited again on the next call.
+        """
+        errors = self._relations_cache
+        if errors is not None:
+            return errors
+
+        self._adopt_children(self._get_fields())
+
+        errors = []
+        canvas_ids = set()
+        references = []
+        for context_idx, context in enumerate(self.contexts):
+            for canvas_idx, (canvas_id, source_canvas_id, framing_decisions) in enumerate(
+                _context_relations(context)
+            ):
+                path = f"/contexts/{context_idx}/canvases/{canvas_idx}"
+                if canvas_id in canvas_ids:
+                    errors.append(
+                        ValidationIssue(
+                            path=f"{path}/id",
+                            kind="duplicate_id",
+                            value=canvas_id,
+                            message=f'Canvas.id ("{canvas_id}") already exists.',
+                        )
+                    )
+
+                canvas_ids.add(canvas_id)
+                references.append((path, source_canvas_id, framing_decisions))
+
+        for path, source_canvas_id, framing_decisions in references:
+            if source_canvas_id not in canvas_ids:
                 errors.append(
-                    f"{canvas.source_canvas_id} (canvas.source_canvas_id) not found in " f"registered canvases"
+                    ValidationIssue(
+                        path=f"{path}/source_canvas_id",
+                        kind="source_canvas_id",
+                        value=source_canvas_id,
+                        message=f"{source_canvas_id} (canvas.source_canvas_id) not found in registered canvases",
+                    )
                 )
 
-            for framing_decision in canvas.framing_decisions:
+            for fd_idx, framing_decision in enumerate(framing_decisions):
                 if framing_decision.framing_intent_id not in self.framing_intents:
-                    errors.append(  # noqa: PERF401
-                        f"{framing_decision}.framing_intent_id ({framing_decision.framing_intent_id}) "
-                        f"not found in registered framing intents"
+                    errors.append(
+                        ValidationIssue(
+                            path=f"{path}/framing_decisions/{fd_idx}/framing_intent_id",
+                            kind="framing_intent_id",
+                            value=framing_decision.framing_intent_id,
+                            message=(
+                                f"{framing_decision!r}.framing_intent_id ({framing_decision.framing_intent_id}) "
+                                f"not found in registered framing intents"
+                            ),
+                        )
                     )
 
-        # Check structure and values against json schema
-        v = jsonschema.validators.validator_for(self._schema)
-        validator = v(schema=self._schema, format_checker=v.FORMAT_CHECKER)
-        for error in validator.iter_errors(self.to_dict()):
-            errors.append(str(error))  # noqa: PERF401
+        errors = tuple(errors)
+        self._relations_cache = errors
 
-        if errors:
-            nl = "\n"
-            msg = f"Validation failed!\n" f"{f'{nl}'.join(errors)}"
-            raise FDLValidationError(msg)
-
-    def load_schema(self) -> dict:
-        """Load a jsonschema based on the version in `Header` or default to current version
-        set in [base](common.md)
+        return errors
 
+    @property
+    def schema_version(self) -> tuple[int, int]:
+        """
         Returns:
-            schema:
+            (major, minor): version of json schema based on the version in `Header` or the current
+                version set in [base](common.md)
         """
         major = self.version.get("major") if self.version else FDL_SCHEMA_MAJOR
         minor = self.version.get("minor") if self.version else FDL_SCHEMA_MINOR
 
-        schema_path = Path(__file__).parent.joinpath("schema", f"v{major}.{minor}", "ascfdl.schema.json")
-        with schema_path.open("rb") as fp:
-            schema = json.load(fp)
+        return major, minor
 
-        return schema
+    def load_schema(self) -> dict:
+        """Load a jsonschema based on the version in `Header` or default to current version
+        set in [base](common.md). Schemas are loaded once per process and shared between instances.
+
+        Returns:
+            schema:
+        """
+        return get_schema(*self.schema_version)
 
     def __repr__(self):
         return repr(self.header)
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Optional, TypeVar, Union
 
 from .common import Base, Dimensions, Point
@@ -8,6 +9,27 @@ FramingIntent = TypeVar("FramingIntent")
 
 
 class FramingDecision(Base):
+    attributes = (
+        "label",
+        "id",
+        "framing_intent_id",
+        "dimensions",
+        "anchor_point",
+        "protection_dimensions",
+        "protection_anchor_point",
+    )
+    kwarg_map = MappingProxyType({"id": "id_"})
+    object_map = MappingProxyType(
+        {
+            "dimensions": Dimensions,
+            "anchor_point": Point,
+            "protection_dimensions": Dimensions,
+            "protection_anchor_point": Point,
+        }
+    )
+    required = ("id", "framing_intent_id", "dimensions", "anchor_point")
+    indexes = ("label", "framing_intent_id")
+
     def __init__(
         self,
         label: Optional[str] = None,
@@ -19,24 +41,6 @@ class FramingDecision(Base):
         protection_anchor_point: Optional[Point] = None,
     ):
         super().__init__()
-        self.attributes = [
-            "label",
-            "id",
-            "framing_intent_id",
-            "dimensions",
-            "anchor_point",
-            "protection_dimensions",
-            "protection_anchor_point",
-        ]
-        self.kwarg_map = {"id": "id_"}
-        self.object_map = {
-            "dimensions": Dimensions,
-            "anchor_point": Point,
-            "protection_dimensions": Dimensions,
-            "protection_anchor_point": Point,
-        }
-        self.required = ["id", "framing_intent_id", "dimensions", "anchor_point"]
-
         self.label = label
         self.id = id_
         self.framing_intent_id = framing_intent_id
@@ -52,6 +56,7 @@ class FramingDecision(Base):
     @dimensions.setter
     def dimensions(self, dim: Union[Dimensions, None]):
         self._dimensions = dim
+        self._changed(dim)
 
     @property
     def protection_dimensions(self) -> Union[Dimensions, None]:
@@ -60,6 +65,7 @@ class FramingDecision(Base):
     @protection_dimensions.setter
     def protection_dimensions(self, dim: Union[Dimensions, None]):
         self._protection_dimensions = dim
+        self._changed(dim)
 
     @classmethod
     def from_framing_intent(cls, canvas: Canvas, framing_intent: FramingIntent) -> "FramingDecision":
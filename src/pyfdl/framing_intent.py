@@ -1,9 +1,17 @@
+from types import MappingProxyType
 from typing import Optional, Union
 
 from .common import Base, Dimensions
 
 
 class FramingIntent(Base):
+    attributes = ("id", "label", "aspect_ratio", "protection")
+    kwarg_map = MappingProxyType({"id": "id_"})
+    object_map = MappingProxyType({"aspect_ratio": Dimensions})
+    required = ("id", "aspect_ratio")
+    defaults = MappingProxyType({"protection": 0})
+    indexes = ("label",)
+
     def __init__(
         self,
         label: Optional[str] = None,
@@ -12,12 +20,6 @@ class FramingIntent(Base):
         protection: Optional[float] = None,
     ):
         super().__init__()
-        self.attributes = ["id", "label", "aspect_ratio", "protection"]
-        self.kwarg_map = {"id": "id_"}
-        self.object_map = {"aspect_ratio": Dimensions}
-        self.required = ["id", "aspect_ratio"]
-        self.defaults = {"protection": 0}
-
         self.id = id_
         self.label = label
         self.aspect_ratio = aspect_ratio
@@ -32,6 +34,7 @@ class FramingIntent(Base):
         self._aspect_ratio = dim
         if dim is not None:
             self._aspect_ratio.dtype = int
+        self._changed(dim)
 
     def __repr__(self):
         return (
@@ -0,0 +1,248 @@
+from typing import Any, Iterable, Union
+
+from .canvas import Canvas
+from .common import Dimensions, Point
+from .errors import FDLError
+from .fdl import FDL
+from .framing_decision import FramingDecision
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+CANVAS_FIELDS = ("dimensions", "effective_dimensions", "effective_anchor_point")
+FRAMING_DECISION_FIELDS = ("dimensions", "anchor_point", "protection_dimensions", "protection_anchor_point")
+
+
+def _to_number(value: float) -> Union[int, float]:
+    # Arrays store floats. Hand back integral values as int to match what's parsed from json
+    value = float(value)
+    if value.is_integer():
+        return int(value)
+
+    return value
+
+
+class ArrayDimensions(Dimensions):
+    __slots__ = ("_array", "_row")
+
+    def __init__(self, array: Any, row: int, dtype: Union[int, float] = float):
+        """
+        [Dimensions](common.md#pyfdl.Dimensions) reading and writing their values straight from a row in
+        a [GeometryStore](geometry.md#pyfdl.GeometryStore) array.
+
+        Args:
+            array: two column array holding width and height
+            row: index of these dimensions in the array
+            dtype: set data type of dimension values
+        """
+        self._parent = None
+        self._array = array
+        self._row = row
+        self.dtype = dtype
+
+    @property
+    def width(self) -> Union[int, float]:
+        return _to_number(self._array[self._row, 0])
+
+    @width.setter
+    def width(self, value: Union[int, float]):
+        self._array[self._row, 0] = value
+        self._changed()
+
+    @property
+    def height(self) -> Union[int, float]:
+        return _to_number(self._array[self._row, 1])
+
+    @height.setter
+    def height(self, value: Union[int, float]):
+        self._array[self._row, 1] = value
+        self._changed()
+
+
+class ArrayPoint(Point):
+    __slots__ = ("_array", "_row")
+
+    def __init__(self, array: Any, row: int):
+        """
+        [Point](common.md#pyfdl.Point) reading and writing its values straight from a row in
+        a [GeometryStore](geometry.md#pyfdl.GeometryStore) array.
+
+        Args:
+            array: two column array holding x and y
+            row: index of this point in the array
+        """
+        self._parent = None
+        self._array = array
+        self._row = row
+
+    @property
+    def x(self) -> Union[int, float]:
+        return _to_number(self._array[self._row, 0])
+
+    @x.setter
+    def x(self, value: Union[int, float]):
+        self._array[self._row, 0] = value
+        self._changed()
+
+    @property
+    def y(self) -> Union[int, float]:
+        return _to_number(self._array[self._row, 1])
+
+    @y.setter
+    def y(self, value: Union[int, float]):
+        self._array[self._row, 1] = value
+        self._changed()
+
+
+class GeometryStore:
+    def __init__(self, fdls: Iterable[FDL]):
+        """Keeps the geometry of canvases and framing decisions of a set of FDLs in contiguous
+        NumPy arrays for vectorized math across a whole show.
+
+        The dimensions and anchor points of the stored objects are replaced by array backed versions,
+        so reading or changing them through the regular object API reads or writes the arrays.
+        Missing values are stored as `nan` and remain `None` on the objects.
+        Assigning new `Dimensions` or `Point` objects detaches that value from the store. Create a new
+        store to pick up such changes.
+        Changes written straight to the arrays are not seen by the cached output of `to_dict`.
+        Call [invalidate](geometry.md#pyfdl.GeometryStore.invalidate) after modifying the arrays.
+
+        Requires NumPy to be installed.
+
+        Args:
+            fdls: to collect geometry from
+
+        Raises:
+            FDLError: if NumPy is not installed
+
+        Attributes:
+            canvases: list of all stored canvases
+            framing_decisions: list of all stored framing decisions
+            framing_decision_canvas: array with the index of the parent canvas of each framing decision
+        """
+
+        if np is None:
+            msg = 'GeometryStore requires "numpy". Please install it to use this feature.'
+            raise FDLError(msg)
+
+        self.canvases = []
+        self.framing_decisions = []
+        parents = []
+
+        for fdl in fdls:
+            for context in fdl.contexts:
+                for canvas in context.canvases:
+                    for framing_decision in canvas.framing_decisions:
+                        self.framing_decisions.append(framing_decision)
+                        parents.append(len(self.canvases))
+
+                    self.canvases.append(canvas)
+
+        self.framing_decision_canvas = np.array(parents, dtype=np.intp)
+        self._canvas_rows = {id(canvas): row for row, canvas in enumerate(self.canvases)}
+        self._framing_decision_rows = {id(item): row for row, item in enumerate(self.framing_decisions)}
+        self._canvas_arrays = self._bind(self.canvases, CANVAS_FIELDS)
+        self._framing_decision_arrays = self._bind(self.framing_decisions, FRAMING_DECISION_FIELDS)
+
+    @staticmethod
+    def _bind(items: list, fields: tuple[str, ...]) -> dict:
+        arrays = {}
+        for field in fields:
+            array = np.full((len(items), 2), np.nan, dtype=np.float64)
+            for row, item in enumerate(items):
+                value = getattr(item, field)
+                if value is None:
+                    continue
+
+                array[row] = tuple(value)
+                if isinstance(value, Dimensions):
+                    setattr(item, field, ArrayDimensions(array, row, dtype=value.dtype))
+                else:
+                    setattr(item, field, ArrayPoint(array, row))
+
+            arrays[field] = array
+
+        return arrays
+
+    def invalidate(self) -> None:
+        """Mark all stored canvases and framing decisions as changed. Call this after modifying
+        the arrays directly
+        """
+        for item in self.canvases + self.framing_decisions:
+            item.invalidate()
+
+    def canvas_array(self, field: str) -> Any:
+        """Get the array holding a geometry field of all canvases.
+
+        Args:
+            field: one of "dimensions", "effective_dimensions" or "effective_anchor_point"
+
+        Returns:
+            array: of shape (number of canvases, 2)
+        """
+        return self._canvas_arrays[field]
+
+    def framing_decision_array(self, field: str) -> Any:
+        """Get the array holding a geometry field of all framing decisions.
+
+        Args:
+            field: one of "dimensions", "anchor_point", "protection_dimensions" or "protection_anchor_point"
+
+        Returns:
+            array: of shape (number of framing decisions, 2)
+        """
+        return self._framing_decision_arrays[field]
+
+    def canvas_index(self, canvas: Canvas) -> int:
+        """Get the row of a canvas in the canvas arrays
+
+        Args:
+            canvas: stored in this store
+
+        Returns:
+            index:
+        """
+        return self._canvas_rows[id(canvas)]
+
+    def framing_decision_index(self, framing_decision: FramingDecision) -> int:
+        """Get the row of a framing decision in the framing decision arrays
+
+        Args:
+            framing_decision: stored in this store
+
+        Returns:
+            index:
+        """
+        return self._framing_decision_rows[id(framing_decision)]
+
+    def framing_decision_aspect_ratios(self) -> Any:
+        """
+        Returns:
+            aspect_ratios: width / height of every framing decision
+        """
+        dimensions = self.framing_decision_array("dimensions")
+        return dimensions[:, 0] / dimensions[:, 1]
+
+    def framing_decisions_inside_canvas(self) -> Any:
+        """Check that every framing decision, including protection, fits inside its canvas
+
+        Returns:
+            mask: `True` for every framing decision inside the bounds of its canvas
+        """
+        canvas_dimensions = self.canvas_array("dimensions")[self.framing_decision_canvas]
+        inside = np.ones(len(self.framing_decisions), dtype=bool)
+
+        for dim_field, point_field in (
+            ("dimensions", "anchor_point"),
+            ("protection_dimensions", "protection_anchor_point"),
+        ):
+            dimensions = self.framing_decision_array(dim_field)
+            anchor_point = self.framing_decision_array(point_field)
+            present = ~np.isnan(dimensions).any(axis=1)
+            fits = (anchor_point >= 0).all(axis=1) & (anchor_point + dimensions <= canvas_dimensions).all(axis=1)
+            inside &= ~present | fits
+
+        return inside
@@ -1,6 +1,7 @@
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import IO, Any, Iterator, Optional, Union
 
+from pyfdl.context import Context
 from pyfdl.fdl import FDL
 from pyfdl.plugins import get_registry
 
@@ -28,7 +29,7 @@ def get_handler(func_name: str, path: Optional[Union[Path, str]] = None, handler
 
     else:
         path = Path(path)
-        handler = _registry.get_handler_by_suffix(path.suffix, func_name=func_name)
+        handler = _registry.get_handler_by_suffix("".join(path.suffixes), func_name=func_name)
 
     return handler
 
@@ -54,6 +55,27 @@ def read_from_file(
     return handler.read_from_file(path, **handler_kwargs)
 
 
+def iter_contexts(
+    path: Union[Path, str], handler_name: Optional[str] = None, **handler_kwargs: Optional[Any]
+) -> Iterator["Context"]:
+    """
+    Handler agnostic function for reading the contexts of an FDL file one at a time, without loading
+    the whole file. A suitable handler will be chosen based on `path` or `handler_name`.
+
+    Args:
+        path: to the file in question
+        handler_name: name of handler to use
+        **handler_kwargs: arguments passed to handler
+
+    Returns:
+        contexts:
+    """
+    path = Path(path)
+    handler = get_handler(func_name="iter_contexts", path=path, handler_name=handler_name)
+
+    return handler.iter_contexts(path, **handler_kwargs)
+
+
 def read_from_string(s: str, handler_name: str = "fdl", **handler_kwargs: Optional[Any]) -> "FDL":
     """
     Handler agnostic function for producing an FDL based on a string. A suitable handler will be
@@ -71,6 +93,41 @@ def read_from_string(s: str, handler_name: str = "fdl", **handler_kwargs: Option
     return handler.read_from_string(s, **handler_kwargs)
 
 
+def read_from_bytes(data: Union[bytes, bytearray], handler_name: str = "fdl", **handler_kwargs: Optional[Any]) -> "FDL":
+    """
+    Handler agnostic function for producing an FDL from bytes, without decoding them into a string first.
+    A suitable handler will be chosen based on `handler_name`. Defaults to "fdl".
+
+    Args:
+        data: bytes to convert into an FDL
+        handler_name: name of handler to use
+        **handler_kwargs: arguments passed to handler
+
+    Returns:
+        FDL:
+    """
+    handler = get_handler(func_name="read_from_bytes", handler_name=handler_name)
+    return handler.read_from_bytes(data, **handler_kwargs)
+
+
+def read_from_buffer(buffer: Any, handler_name: str = "fdl", **handler_kwargs: Optional[Any]) -> "FDL":
+    """
+    Handler agnostic function for producing an FDL from an object supporting the buffer protocol,
+    like a `memoryview` or an `mmap` of a file. A suitable handler will be chosen based on `handler_name`.
+    Defaults to "fdl".
+
+    Args:
+        buffer: to convert into an FDL
+        handler_name: name of handler to use
+        **handler_kwargs: arguments passed to handler
+
+    Returns:
+        FDL:
+    """
+    handler = get_handler(func_name="read_from_buffer", handler_name=handler_name)
+    return handler.read_from_buffer(buffer, **handler_kwargs)
+
+
 def write_to_file(
     fdl: FDL, path: Union[Path, str], handler_name: Optional[str] = None, **handler_kwargs: Optional[Any]
 ):
@@ -89,6 +146,21 @@ def write_to_file(
     handler.write_to_file(fdl, path, **handler_kwargs)
 
 
+def write_to_stream(fdl: FDL, stream: IO, handler_name: str = "fdl", **handler_kwargs: Optional[Any]):
+    """
+    Handler agnostic function to write an FDL to a text or binary stream. A suitable handler will be chosen
+    based on `handler_name`. Defaults to "fdl".
+
+    Args:
+        fdl: to write
+        stream: text or binary stream like an open file or socket
+        handler_name: name of handler to use
+        **handler_kwargs: arguments passed to handler
+    """
+    handler = get_handler(func_name="write_to_stream", handler_name=handler_name)
+    handler.write_to_stream(fdl, stream, **handler_kwargs)
+
+
 def write_to_string(fdl: FDL, handler_name: str = "fdl", **handler_kwargs: Optional[Any]):
     """
     Handler agnostic function for producing a string representation of an FDL. A suitable handler will
@@ -104,3 +176,20 @@ def write_to_string(fdl: FDL, handler_name: str = "fdl", **handler_kwargs: Optio
     """
     handler = get_handler(func_name="write_to_string", handler_name=handler_name)
     return handler.write_to_string(fdl, **handler_kwargs)
+
+
+def write_to_bytes(fdl: FDL, handler_name: str = "fdl", **handler_kwargs: Optional[Any]) -> bytes:
+    """
+    Handler agnostic function for producing a bytes representation of an FDL. A suitable handler will
+    be chosen based on `handler_name`. Defaults to "fdl". Use "fdlb" for the compact binary format.
+
+    Args:
+        fdl: to write
+        handler_name: name of handler to use
+        **handler_kwargs: arguments passed to handler
+
+    Returns:
+        data:
+    """
+    handler = get_handler(func_name="write_to_bytes", handler_name=handler_name)
+    return handler.write_to_bytes(fdl, **handler_kwargs)
@@ -0,0 +1,176 @@
+import mmap
+from pathlib import Path
+from typing import IO, Optional, TypeVar, Union
+
+from pyfdl import FDL
+from pyfdl.binary import pack, unpack
+from pyfdl.json_backends import JSONInput
+
+PluginRegistry = TypeVar("PluginRegistry")
+
+
+class BinaryFDLHandler:
+    def __init__(self):
+        """
+        Built-in handler for FDLs in a compact binary format. Binary FDLs are a bit smaller than compact
+        json and quick to decode. Made for caching FDLs and passing them between processes. They hold
+        the exact same data as the json version. Requires the `msgpack` library.
+        """
+        self.name = "fdlb"
+        self.suffixes = [".fdlb"]
+
+    def read_from_file(
+        self,
+        path: Path,
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+        memory_map: bool = False,
+    ) -> FDL:
+        """
+        Read an FDL from a binary file.
+
+        Args:
+            path: to binary fdl file
+            validate: validate incoming data with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating at the first error found
+            max_errors: stop validating after finding this many errors
+            memory_map: decode the file straight from a memory map of it instead of reading it first
+
+        Raises:
+            FDLError: if the file isn't a binary FDL
+            FDLValidationError: if the contents doesn't follow the spec
+
+        Returns:
+            FDL:
+        """
+        kwargs = {"validate": validate, "lazy": lazy, "fail_fast": fail_fast, "max_errors": max_errors}
+        if memory_map:
+            with path.open("rb") as fp:
+                # Empty files can't be mapped, but aren't binary FDLs anyway
+                if path.stat().st_size:
+                    with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                        return self.read_from_buffer(buffer, **kwargs)
+
+        return self.read_from_bytes(path.read_bytes(), **kwargs)
+
+    def read_from_bytes(
+        self,
+        data: Union[bytes, bytearray],
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+    ) -> FDL:
+        """
+        Read an FDL from bytes in the binary format.
+
+        Args:
+            data: binary FDL
+            validate: validate incoming data with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating at the first error found
+            max_errors: stop validating after finding this many errors
+
+        Raises:
+            FDLError: if the data isn't a binary FDL
+            FDLValidationError: if the contents doesn't follow the spec
+
+        Returns:
+            FDL:
+        """
+        return self.read_from_buffer(data, validate=validate, lazy=lazy, fail_fast=fail_fast, max_errors=max_errors)
+
+    def read_from_buffer(
+        self,
+        buffer: JSONInput,
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+    ) -> FDL:
+        """
+        Read an FDL in the binary format from any object supporting the buffer protocol,
+        like a `memoryview` or an `mmap`.
+
+        Args:
+            buffer: holding a binary FDL
+            validate: validate incoming data with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating at the first error found
+            max_errors: stop validating after finding this many errors
+
+        Raises:
+            FDLError: if the data isn't a binary FDL
+            FDLValidationError: if the contents doesn't follow the spec
+
+        Returns:
+            FDL:
+        """
+        raw = unpack(buffer)
+        fdl = FDL.from_dict(raw, lazy=lazy)
+
+        if validate:
+            fdl.validate(raw, fail_fast=fail_fast, max_errors=max_errors)
+
+        return fdl
+
+    def write_to_file(self, fdl: FDL, path: Path, validate: bool = True):
+        """
+        Dump an FDL to a binary file.
+
+        Args:
+            fdl: object to serialize
+            path: path to store binary fdl file
+            validate: validate outgoing data with jsonschema
+
+        Raises:
+            FDLValidationError: if the contents doesn't follow the spec
+        """
+        with path.open("wb") as fp:
+            self.write_to_stream(fdl, fp, validate=validate)
+
+    def write_to_stream(self, fdl: FDL, stream: IO[bytes], validate: bool = True):
+        """
+        Dump an FDL to a binary stream like an open file or socket.
+
+        Args:
+            fdl: object to serialize
+            stream: binary stream
+            validate: validate outgoing data with jsonschema
+
+        Raises:
+            FDLValidationError: if the contents doesn't follow the spec
+        """
+        stream.write(self.write_to_bytes(fdl, validate=validate))
+
+    def write_to_bytes(self, fdl: FDL, validate: bool = True) -> bytes:
+        """
+        Dump an FDL to bytes in the binary format.
+
+        Args:
+            fdl: object to serialize
+            validate: validate outgoing data with jsonschema
+
+        Raises:
+            FDLValidationError: if the contents doesn't follow the spec
+
+        Returns:
+            data: binary FDL
+        """
+        if validate:
+            fdl.validate()
+
+        return pack(fdl.to_dict())
+
+
+def register_plugin(registry: PluginRegistry):
+    """
+    Mandatory function to register handler in the registry. Called by the PluginRegistry itself.
+
+    Args:
+        registry: The PluginRegistry passes itself to this function
+    """
+    registry.add_handler(BinaryFDLHandler())
@@ -1,8 +1,12 @@
-import json
+import io
+import mmap
 from pathlib import Path
-from typing import TypeVar, Union
+from typing import IO, Iterator, Optional, TypeVar, Union
 
-from pyfdl import FDL
+from pyfdl import FDL, Context
+from pyfdl.compression import get_compression, open_compressed, open_decompressed
+from pyfdl.json_backends import JSONInput, get_json_backend
+from pyfdl.streaming import iter_contexts, read_fdl, write_json
 
 PluginRegistry = TypeVar("PluginRegistry")
 
@@ -10,18 +14,44 @@ PluginRegistry = TypeVar("PluginRegistry")
 class FDLHandler:
     def __init__(self):
         """
-        The default built-in FDL handler. Takes care of reading and writing FDL files
+        The default built-in FDL handler. Takes care of reading and writing FDL files.
+        Files compressed with gzip, xz or bz2 (".fdl.gz", ".fdl.xz" and ".fdl.bz2") are decompressed
+        while they're read, and compressed while they're written.
         """
         self.name = "fdl"
-        self.suffixes = [".fdl"]
+        self.suffixes = [".fdl", ".fdl.gz", ".fdl.xz", ".fdl.bz2"]
 
-    def read_from_file(self, path: Path, validate: bool = True) -> FDL:
+    def read_from_file(
+        self,
+        path: Path,
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+        stream: bool = False,
+        memory_map: bool = False,
+        json_backend: Optional[str] = None,
+    ) -> FDL:
         """
         Read an FDL from a file.
 
+        In stream mode the file is read in chunks and each context is created as soon as its json is read,
+        instead of loading the whole file and its json first. Use this for very large FDLs.
+
+        Compressed files are recognized by their first bytes and decompressed while they're read,
+        without writing the decompressed FDL anywhere.
+
         Args:
             path: to fdl file
             validate: validate incoming json with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating at the first error found
+            max_errors: stop validating after finding this many errors
+            stream: read the file in chunks to keep memory usage down
+            memory_map: parse the file straight from a memory map of it instead of reading it first.
+                Ignored for compressed files
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed.
+                Streaming always uses "stdlib"
 
         Raises:
             jsonschema.exceptions.ValidationError: if the contents doesn't follow the spec
@@ -30,16 +60,65 @@ class FDLHandler:
             FDL:
         """
 
-        with path.open("r") as fp:
-            raw = fp.read()
-            return self.read_from_string(raw, validate=validate)
+        if stream:
+            with path.open("rb") as fp, open_decompressed(fp) as source, io.TextIOWrapper(source, "utf-8") as text:
+                return read_fdl(text, validate=validate, lazy=lazy, fail_fast=fail_fast, max_errors=max_errors)
+
+        kwargs = {
+            "validate": validate,
+            "lazy": lazy,
+            "fail_fast": fail_fast,
+            "max_errors": max_errors,
+            "json_backend": json_backend,
+        }
+        with path.open("rb") as fp, open_decompressed(fp) as source:
+            # Empty files can't be mapped, but are rejected by the json parser anyway
+            if memory_map and source is fp and path.stat().st_size:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    return self.read_from_buffer(buffer, **kwargs)
+
+            return self.read_from_bytes(source.read(), **kwargs)
+
+    def iter_contexts(self, path: Path, validate: bool = True, lazy: bool = False) -> Iterator[Context]:
+        """Read the contexts of an FDL file one at a time. The file is read in chunks, and only one
+        context is kept in memory at a time. Compressed files are decompressed while they're read.
 
-    def read_from_string(self, s: str, validate: bool = True) -> FDL:
+        Args:
+            path: to fdl file
+            validate: validate each context with jsonschema
+            lazy: only create canvases and framing decisions when first accessed
+
+        Raises:
+            FDLValidationError: if a context doesn't follow the spec
+
+        Returns:
+            contexts:
+        """
+        with path.open("rb") as fp, open_decompressed(fp) as source, io.TextIOWrapper(source, "utf-8") as text:
+            yield from iter_contexts(text, validate=validate, lazy=lazy)
+
+    def read_from_string(
+        self,
+        s: str,
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+        json_backend: Optional[str] = None,
+    ) -> FDL:
         """Read an FDL from a string.
 
+        In lazy mode the parsed json is kept and the items of `framing_intents`, `contexts`,
+        `canvas_templates` and their sub collections are created the first time each collection is accessed.
+        Validation needs the whole tree, so combine `lazy` with `validate=False` to get the benefit.
+
         Args:
             s: string representation of an FDL
             validate: validate incoming json with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating at the first error found
+            max_errors: stop validating after finding this many errors
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
 
         Raises:
             jsonschema.exceptions.ValidationError: if the contents doesn't follow the spec
@@ -48,35 +127,156 @@ class FDLHandler:
             FDL:
 
         """
-        fdl = FDL.from_dict(json.loads(s))
+        raw = get_json_backend(json_backend).loads(s)
+        return self._read_raw(raw, validate=validate, lazy=lazy, fail_fast=fail_fast, max_errors=max_errors)
+
+    def read_from_bytes(
+        self,
+        data: Union[bytes, bytearray],
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+        json_backend: Optional[str] = None,
+    ) -> FDL:
+        """Read an FDL from bytes like the contents of a file or a network response.
+        The json is parsed straight from the bytes without decoding them into a string first.
+
+        Args:
+            data: utf-8 (or utf-16/32) encoded FDL
+            validate: validate incoming json with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating at the first error found
+            max_errors: stop validating after finding this many errors
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            jsonschema.exceptions.ValidationError: if the contents doesn't follow the spec
+
+        Returns:
+            FDL:
+        """
+        return self.read_from_buffer(
+            data, validate=validate, lazy=lazy, fail_fast=fail_fast, max_errors=max_errors, json_backend=json_backend
+        )
+
+    def read_from_buffer(
+        self,
+        buffer: JSONInput,
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+        json_backend: Optional[str] = None,
+    ) -> FDL:
+        """Read an FDL from any object supporting the buffer protocol, like a `memoryview` or an `mmap`.
+        The "orjson" json backend parses the buffer in place without copying it. The others decode it
+        into a string once.
+
+        Args:
+            buffer: holding an utf-8 (or utf-16/32) encoded FDL
+            validate: validate incoming json with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating at the first error found
+            max_errors: stop validating after finding this many errors
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            jsonschema.exceptions.ValidationError: if the contents doesn't follow the spec
+
+        Returns:
+            FDL:
+        """
+        raw = get_json_backend(json_backend).loads(buffer)
+        return self._read_raw(raw, validate=validate, lazy=lazy, fail_fast=fail_fast, max_errors=max_errors)
+
+    def _read_raw(self, raw: dict, validate: bool, lazy: bool, fail_fast: bool, max_errors: Optional[int]) -> FDL:
+        fdl = FDL.from_dict(raw, lazy=lazy)
 
         if validate:
-            fdl.validate()
+            # Validate the parsed json rather than serializing the new FDL again
+            fdl.validate(raw, fail_fast=fail_fast, max_errors=max_errors)
 
         return fdl
 
-    def write_to_file(self, fdl: FDL, path: Path, validate: bool = True, indent: Union[int, None] = 2):
-        """Dump an FDL to a file.
+    def write_to_file(
+        self,
+        fdl: FDL,
+        path: Path,
+        validate: bool = True,
+        indent: Union[int, None] = 2,
+        json_backend: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ):
+        """Dump an FDL to a file. Paths ending with ".gz", ".xz" or ".bz2" are compressed with gzip, xz or bz2
+        while the json is written.
 
         Args:
             fdl: object to serialize
             path: path to store fdl file
             validate: validate outgoing json with jsonschema
             indent: amount of spaces
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the standard library, which writes
+                while encoding. See [write_to_stream](handlers.md#pyfdl.handlers.fdl_handler.FDLHandler.write_to_stream)
+            compression_level: 0-9 for compressed files. Lower levels are faster, higher levels make
+                smaller files. See [open_compressed](handlers.md#pyfdl.compression.open_compressed)
+
+        Raises:
+            jsonschema.exceptions.ValidationError: if the contents doesn't follow the spec
+            FDLError: for compression levels out of range
+        """
+        kwargs = {"validate": validate, "indent": indent, "json_backend": json_backend}
+        compression = get_compression(path)
+        with path.open("wb") as fp:
+            if compression is None:
+                self.write_to_stream(fdl, fp, **kwargs)
+                return
+
+            with open_compressed(fp, compression, compression_level=compression_level) as target:
+                self.write_to_stream(fdl, target, **kwargs)
+
+    def write_to_stream(
+        self,
+        fdl: FDL,
+        stream: IO,
+        validate: bool = True,
+        indent: Union[int, None] = 2,
+        json_backend: Optional[str] = None,
+    ):
+        """Dump an FDL to a text or binary stream. By default the json is written in chunks while it's
+        encoded, so the whole string is never held in memory. Other json backends encode the whole
+        string first, which is faster but holds it in memory.
+
+        Args:
+            fdl: object to serialize
+            stream: text or binary stream like an open file or socket
+            validate: validate outgoing json with jsonschema
+            indent: amount of spaces
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to writing while encoding with the
+                standard library
 
         Raises:
             jsonschema.exceptions.ValidationError: if the contents doesn't follow the spec
         """
-        with path.open("w") as fp:
-            fp.write(self.write_to_string(fdl, validate=validate, indent=indent))
+        if validate:
+            fdl.validate()
+
+        if json_backend is None:
+            write_json(fdl.to_dict(), stream, indent=indent)
+            return
+
+        get_json_backend(json_backend).dump(fdl.to_dict(), stream, indent=indent)
 
-    def write_to_string(self, fdl: FDL, validate: bool = True, indent: Union[int, None] = 2) -> str:
+    def write_to_string(
+        self, fdl: FDL, validate: bool = True, indent: Union[int, None] = 2, json_backend: Optional[str] = None
+    ) -> str:
         """Dump an FDL to string
 
         Args:
             fdl: object to serialize
             validate: validate outgoing json with jsonschema
             indent: amount of spaces
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
 
         Raises:
             jsonschema.exceptions.ValidationError: if the contents doesn't follow the spec
@@ -87,7 +287,26 @@ class FDLHandler:
         if validate:
             fdl.validate()
 
-        return json.dumps(fdl.to_dict(), indent=indent, sort_keys=False)
+        return get_json_backend(json_backend).dumps(fdl.to_dict(), indent=indent)
+
+    def write_to_bytes(
+        self, fdl: FDL, validate: bool = True, indent: Union[int, None] = 2, json_backend: Optional[str] = None
+    ) -> bytes:
+        """Dump an FDL to utf-8 encoded bytes
+
+        Args:
+            fdl: object to serialize
+            validate: validate outgoing json with jsonschema
+            indent: amount of spaces
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            jsonschema.exceptions.ValidationError: if the contents doesn't follow the spec
+
+        Returns:
+            data: utf-8 encoded json
+        """
+        return self.write_to_string(fdl, validate=validate, indent=indent, json_backend=json_backend).encode()
 
 
 def register_plugin(registry: PluginRegistry):
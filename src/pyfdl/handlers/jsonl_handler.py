@@ -0,0 +1,220 @@
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, TypeVar, Union
+
+from pyfdl import FDL
+from pyfdl.json_backends import get_json_backend
+from pyfdl.streaming import _is_binary
+
+PluginRegistry = TypeVar("PluginRegistry")
+
+
+class JSONLinesHandler:
+    def __init__(self):
+        """
+        Built-in handler for many FDLs in one file as JSON Lines, one FDL per line.
+        Reading yields one FDL at a time, and writing appends to the file. Useful for queues and log
+        style storage, where one file per FDL means lots of files to open and close.
+        """
+        self.name = "fdljsonl"
+        self.suffixes = [".fdljsonl"]
+
+    def read_from_file(
+        self,
+        path: Path,
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+        json_backend: Optional[str] = None,
+    ) -> Iterator[FDL]:
+        """
+        Read the FDLs in a JSON Lines file one at a time. Empty lines are skipped.
+        The file is opened right away, and closed once all its FDLs are read.
+
+        Args:
+            path: to JSON Lines file
+            validate: validate each FDL with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating an FDL at the first error found
+            max_errors: stop validating an FDL after finding this many errors
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            OSError: if the file can't be opened
+            FDLValidationError: if an FDL doesn't follow the spec
+
+        Returns:
+            fdls:
+        """
+        # Open the file here rather than in a generator, so missing files are reported before iterating
+        fp = path.open("rb")
+        fdls = self.read_from_stream(
+            fp, validate=validate, lazy=lazy, fail_fast=fail_fast, max_errors=max_errors, json_backend=json_backend
+        )
+        return self._close_when_done(fp, fdls)
+
+    def _close_when_done(self, fp: IO, fdls: Iterator[FDL]) -> Iterator[FDL]:
+        with fp:
+            yield from fdls
+
+    def read_from_stream(
+        self,
+        stream: IO,
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+        json_backend: Optional[str] = None,
+    ) -> Iterator[FDL]:
+        """
+        Read FDLs one line at a time from a text or binary stream like an open file or a pipe.
+        Empty lines are skipped.
+
+        Args:
+            stream: text or binary stream with one FDL per line
+            validate: validate each FDL with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating an FDL at the first error found
+            max_errors: stop validating an FDL after finding this many errors
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            FDLValidationError: if an FDL doesn't follow the spec
+
+        Returns:
+            fdls:
+        """
+        loads = get_json_backend(json_backend).loads
+        for line in stream:
+            if not line.strip():
+                continue
+
+            raw = loads(line)
+            fdl = FDL.from_dict(raw, lazy=lazy)
+            if validate:
+                fdl.validate(raw, fail_fast=fail_fast, max_errors=max_errors)
+
+            yield fdl
+
+    def read_from_string(
+        self,
+        s: str,
+        validate: bool = True,
+        lazy: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+        json_backend: Optional[str] = None,
+    ) -> Iterator[FDL]:
+        """
+        Read the FDLs in a string of JSON Lines one at a time. Empty lines are skipped.
+
+        Args:
+            s: string with one FDL per line
+            validate: validate each FDL with jsonschema
+            lazy: only create contexts, canvases etc. when first accessed
+            fail_fast: stop validating an FDL at the first error found
+            max_errors: stop validating an FDL after finding this many errors
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            FDLValidationError: if an FDL doesn't follow the spec
+
+        Returns:
+            fdls:
+        """
+        # Only split on line feeds. `str.splitlines` also splits on characters json allows in strings
+        return self.read_from_stream(
+            s.split("\n"),
+            validate=validate,
+            lazy=lazy,
+            fail_fast=fail_fast,
+            max_errors=max_errors,
+            json_backend=json_backend,
+        )
+
+    def write_to_file(
+        self,
+        fdls: Union[FDL, Iterable[FDL]],
+        path: Path,
+        validate: bool = True,
+        append: bool = True,
+        json_backend: Optional[str] = None,
+    ):
+        """
+        Append one or more FDLs to a JSON Lines file, one FDL per line. The file is created if missing.
+
+        Args:
+            fdls: an FDL or any iterable of FDLs like a generator
+            path: to JSON Lines file
+            validate: validate each FDL with jsonschema before it's written
+            append: add to the end of the file. Otherwise, the file is replaced
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            FDLValidationError: if an FDL doesn't follow the spec
+        """
+        with path.open("ab" if append else "wb") as fp:
+            self.write_to_stream(fdls, fp, validate=validate, json_backend=json_backend)
+
+    def write_to_stream(
+        self,
+        fdls: Union[FDL, Iterable[FDL]],
+        stream: IO,
+        validate: bool = True,
+        json_backend: Optional[str] = None,
+    ):
+        """
+        Write one or more FDLs to a text or binary stream, one FDL per line.
+
+        Args:
+            fdls: an FDL or any iterable of FDLs like a generator
+            stream: text or binary stream like an open file or a pipe
+            validate: validate each FDL with jsonschema before it's written
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            FDLValidationError: if an FDL doesn't follow the spec
+        """
+        binary = _is_binary(stream)
+        for line in self._iter_lines(fdls, validate, json_backend):
+            stream.write(line.encode() if binary else line)
+
+    def write_to_string(
+        self, fdls: Union[FDL, Iterable[FDL]], validate: bool = True, json_backend: Optional[str] = None
+    ) -> str:
+        """
+        Dump one or more FDLs to a string of JSON Lines
+
+        Args:
+            fdls: an FDL or any iterable of FDLs like a generator
+            validate: validate each FDL with jsonschema
+            json_backend: "orjson", "ujson" or "stdlib". Defaults to the fastest one installed
+
+        Raises:
+            FDLValidationError: if an FDL doesn't follow the spec
+
+        Returns:
+            string: one FDL per line
+        """
+        return "".join(self._iter_lines(fdls, validate, json_backend))
+
+    def _iter_lines(
+        self, fdls: Union[FDL, Iterable[FDL]], validate: bool, json_backend: Optional[str]
+    ) -> Iterator[str]:
+        dumps = get_json_backend(json_backend).dumps
+        for fdl in (fdls,) if isinstance(fdls, FDL) else fdls:
+            if validate:
+                fdl.validate()
+
+            # Without indentation json is a single line, as line breaks in strings are escaped
+            yield dumps(fdl.to_dict(), indent=None) + "\n"
+
+
+def register_plugin(registry: PluginRegistry):
+    """
+    Mandatory function to register handler in the registry. Called by the PluginRegistry itself.
+
+    Args:
+        registry: The PluginRegistry passes itself to this function
+    """
+    registry.add_handler(JSONLinesHandler())
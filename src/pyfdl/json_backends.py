@@ -0,0 +1,272 @@
+import json
+import mmap
+import re
+from typing import IO, Any, Optional, Union
+
+from .errors import FDLError
+from .streaming import DEFAULT_CHUNK_SIZE, _is_binary, write_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+# Backends in order of preference when picked automatically
+JSON_BACKENDS = ("orjson", "ujson", "stdlib")
+
+# Floats outside of 1e-4 <= x < 1e16 are formatted differently by orjson and ujson
+# ("1e-7", "0.00001" vs "1e-07", "1e-05")
+_EXPONENT = re.compile(rb"e[-+0-9]")
+_NUMBER_CHARS = frozenset(b"0123456789.-")
+_NUMBER_START = frozenset(b" [:")
+
+# Integers too large for 64 bits are decoded as floats by orjson
+_DIGITS = bytes.maketrans(bytes(range(256)), bytes(48 if 48 <= c <= 57 else 32 for c in range(256)))
+_LARGE_INTEGER = b"0" * 19
+
+# Anything json can be decoded from
+JSONInput = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+
+
+def _has_large_integer(s: JSONInput) -> bool:
+    if isinstance(s, (bytes, bytearray)):
+        return _LARGE_INTEGER in s.translate(_DIGITS)
+
+    if isinstance(s, str):
+        return _LARGE_INTEGER in s.encode().translate(_DIGITS)
+
+    # Check other buffers a chunk at a time rather than copying them whole.
+    # Chunks overlap to catch numbers crossing the boundaries
+    with memoryview(s) as view:
+        overlap = len(_LARGE_INTEGER) - 1
+        for start in range(0, max(len(view) - overlap, 1), DEFAULT_CHUNK_SIZE):
+            chunk = bytes(view[start : start + DEFAULT_CHUNK_SIZE + overlap])
+            if _LARGE_INTEGER in chunk.translate(_DIGITS):
+                return True
+
+    return False
+
+
+def _decode(buffer: JSONInput) -> str:
+    # Decode a buffer straight into a string, without copying it into bytes first
+    if isinstance(buffer, str):
+        return buffer
+
+    with memoryview(buffer) as view:
+        encoding = json.detect_encoding(bytes(view[:4]))
+        return str(view, encoding, "surrogatepass")
+
+
+def _is_stdlib_compatible(encoded: bytes) -> bool:
+    # Check the output of a native library for anything stdlib encodes differently.
+    # Strings looking like numbers may cause false alarms, which only costs a trip through stdlib
+    # stdlib escapes DEL (0x7f) as well, while it counts as ascii
+    if not encoded.isascii() or b"\x7f" in encoded or b"0.0000" in encoded:
+        return False
+
+    for match in _EXPONENT.finditer(encoded):
+        pos = match.start() - 1
+        if pos < 0 or encoded[pos] not in b"0123456789":
+            continue
+
+        while pos > 0 and encoded[pos - 1] in _NUMBER_CHARS:
+            pos -= 1
+
+        if pos == 0 or encoded[pos - 1] in _NUMBER_START:
+            return False
+
+    return True
+
+
+def _write_encoded(encoded: bytes, fp: IO) -> None:
+    # Write an encoded ascii document a chunk at a time
+    data = encoded if _is_binary(fp) else encoded.decode()
+    for start in range(0, len(data), DEFAULT_CHUNK_SIZE):
+        fp.write(data[start : start + DEFAULT_CHUNK_SIZE])
+
+
+class JSONBackend:
+    name = "stdlib"
+
+    def __init__(self):
+        """Decodes and encodes json with the standard library. This is the reference all other backends
+        are compared to. Other backends produce the exact same output, and fall back to this one for
+        anything they would encode differently.
+        """
+
+    def loads(self, s: JSONInput) -> Any:
+        """
+        Args:
+            s: json document as a string, or as bytes or any other buffer like a `memoryview` or an `mmap`
+
+        Returns:
+            data: decoded json
+        """
+        if isinstance(s, (str, bytes, bytearray)):
+            return json.loads(s)
+
+        return json.loads(_decode(s))
+
+    def dumps(self, data: Any, indent: Optional[int] = 2) -> str:
+        """
+        Args:
+            data: to encode
+            indent: amount of spaces
+
+        Returns:
+            json: same as `json.dumps(data, indent=indent)`
+        """
+        return json.dumps(data, indent=indent, sort_keys=False)
+
+    def dump(self, data: Any, fp: IO, indent: Optional[int] = 2) -> None:
+        """Write json to a text or binary stream. The standard library backend encodes in chunks,
+        while the others encode the whole document before writing it.
+
+        Args:
+            data: to encode
+            fp: text or binary stream
+            indent: amount of spaces
+        """
+        write_json(data, fp, indent=indent)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonBackend(JSONBackend):
+    name = "orjson"
+
+    def __init__(self):
+        """Decodes and encodes json with `orjson`. Only output indented with two spaces is produced
+        by `orjson` itself.
+        """
+        super().__init__()
+        if orjson is None:
+            msg = 'The "orjson" json backend requires "orjson". Please install it to use this backend.'
+            raise FDLError(msg)
+
+    def loads(self, s: JSONInput) -> Any:
+        if _has_large_integer(s):
+            return super().loads(s)
+
+        try:
+            if isinstance(s, (str, bytes, bytearray, memoryview)):
+                return orjson.loads(s)
+
+            # orjson reads memoryviews of other buffers like mmap without copying them
+            with memoryview(s) as view:
+                return orjson.loads(view)
+
+        except orjson.JSONDecodeError:
+            # Stdlib accepts a few things orjson doesn't, like NaN
+            return super().loads(s)
+
+    def _encode(self, data: Any, indent: Optional[int]) -> Optional[bytes]:
+        if indent != 2:
+            return None
+
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+        except (orjson.JSONEncodeError, TypeError):
+            return None
+
+        # NaN and infinity turn into null in orjson
+        if b"null" in encoded or not _is_stdlib_compatible(encoded):
+            return None
+
+        return encoded
+
+    def dumps(self, data: Any, indent: Optional[int] = 2) -> str:
+        encoded = self._encode(data, indent)
+        if encoded is None:
+            return super().dumps(data, indent=indent)
+
+        return encoded.decode()
+
+    def dump(self, data: Any, fp: IO, indent: Optional[int] = 2) -> None:
+        encoded = self._encode(data, indent)
+        if encoded is None:
+            super().dump(data, fp, indent=indent)
+            return
+
+        _write_encoded(encoded, fp)
+
+
+class UjsonBackend(JSONBackend):
+    name = "ujson"
+
+    def __init__(self):
+        """Decodes and encodes json with `ujson`. Only output indented with two spaces is produced
+        by `ujson` itself.
+        """
+        super().__init__()
+        if ujson is None:
+            msg = 'The "ujson" json backend requires "ujson". Please install it to use this backend.'
+            raise FDLError(msg)
+
+    def loads(self, s: JSONInput) -> Any:
+        try:
+            # ujson only reads strings and bytes
+            return ujson.loads(s if isinstance(s, (str, bytes, bytearray)) else _decode(s))
+
+        except ValueError:
+            # Let stdlib decide, and raise its errors if the document is broken
+            return super().loads(s)
+
+    def dumps(self, data: Any, indent: Optional[int] = 2) -> str:
+        if indent == 2:
+            try:
+                encoded = ujson.dumps(data, indent=2, ensure_ascii=True, escape_forward_slashes=False)
+
+            except (OverflowError, TypeError, ValueError):
+                encoded = None
+
+            if encoded is not None and _is_stdlib_compatible(encoded.encode()):
+                return encoded
+
+        return super().dumps(data, indent=indent)
+
+    def dump(self, data: Any, fp: IO, indent: Optional[int] = 2) -> None:
+        if indent != 2:
+            super().dump(data, fp, indent=indent)
+            return
+
+        _write_encoded(self.dumps(data, indent=indent).encode(), fp)
+
+
+_BACKEND_CLASSES = {"orjson": OrjsonBackend, "ujson": UjsonBackend, "stdlib": JSONBackend}
+_AVAILABLE = {"orjson": orjson is not None, "ujson": ujson is not None, "stdlib": True}
+_INSTANCES = {}
+
+
+def get_json_backend(name: Optional[str] = None) -> JSONBackend:
+    """Get a json backend by name, or the fastest one installed.
+
+    Args:
+        name: "orjson", "ujson" or "stdlib". Defaults to the first installed one in that order
+
+    Raises:
+        FDLError: if the backend is unknown or its library isn't installed
+
+    Returns:
+        backend:
+    """
+    if name is None:
+        name = next(backend for backend in JSON_BACKENDS if _AVAILABLE[backend])
+
+    backend = _INSTANCES.get(name)
+    if backend is None:
+        if name not in _BACKEND_CLASSES:
+            msg = f"Unknown json backend: {name!r}. Please use one of {JSON_BACKENDS}"
+            raise FDLError(msg)
+
+        backend = _INSTANCES[name] = _BACKEND_CLASSES[name]()
+
+    return backend
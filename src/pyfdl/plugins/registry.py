@@ -101,9 +101,11 @@ class PluginRegistry:
         Get a registered handler by `suffix`, and
         make sure it has a function (`func_name`) to call
 
+        Compound suffixes like ".fdl.gz" are matched from the longest to the shortest, so
+        "shot.v2.fdl.gz" tries ".v2.fdl.gz", then ".fdl.gz" and finally ".gz".
 
         Args:
-            suffix: including the dot (".fdl")
+            suffix: including the dot (".fdl"). May be all the suffixes of a file (".fdl.gz")
             func_name: name of function in handler to call
 
         Returns:
@@ -112,12 +114,14 @@ class PluginRegistry:
         Raises:
             error:
         """
-        for handler in self.handlers.values():
-            if not hasattr(handler, "suffixes"):
-                continue
-
-            if suffix in handler.suffixes and hasattr(handler, func_name):
-                return handler
+        candidates = [suffix[index:] for index, char in enumerate(suffix) if char == "."] or [suffix]
+        for candidate in candidates:
+            for handler in self.handlers.values():
+                if not hasattr(handler, "suffixes"):
+                    continue
+
+                if candidate in handler.suffixes and hasattr(handler, func_name):
+                    return handler
 
         msg = (
             f'No handler supporting suffix: "{suffix}" and function: "{func_name}" seems to be registered. '
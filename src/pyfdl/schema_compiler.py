@@ -0,0 +1,337 @@
+import re
+from collections.abc import Iterator
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+# Keywords that don't affect validation
+ANNOTATIONS = frozenset(
+    ("$schema", "$id", "$comment", "$defs", "definitions", "title", "description", "default", "examples")
+)
+
+TYPE_CHECKS = {
+    "object": "isinstance({0}, dict)",
+    "array": "isinstance({0}, list)",
+    "string": "isinstance({0}, str)",
+    "boolean": "isinstance({0}, bool)",
+    "null": "{0} is None",
+    "number": "(isinstance({0}, (int, float)) and not isinstance({0}, bool))",
+    "integer": (
+        "((isinstance({0}, int) and not isinstance({0}, bool)) "
+        "or (isinstance({0}, float) and {0}.is_integer()))"
+    ),
+}
+
+
+class UnsupportedSchemaError(Exception):
+    pass
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _equal(one: Any, two: Any) -> bool:
+    # Like json schema, don't treat booleans as numbers
+    if isinstance(one, bool) or isinstance(two, bool):
+        return type(one) is type(two) and one == two
+
+    if isinstance(one, (list, tuple)) and isinstance(two, (list, tuple)):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[key], two[key]) for key in one)
+
+    return one == two
+
+
+def _is_uuid(value: Any) -> bool:
+    # Same rules as the "uuid" format checker in jsonschema
+    if not isinstance(value, str):
+        return True
+
+    try:
+        UUID(value)
+    except ValueError:
+        return False
+
+    return all(value[position] == "-" for position in (8, 13, 18, 23))
+
+
+FORMAT_CHECKS = {"uuid": "_is_uuid"}
+
+
+class SchemaCompiler:
+    def __init__(self, schema: dict):
+        """Compiles a json schema into a Python function returning `True` if an instance is valid.
+        Supports the subset of json schema used by the ASC FDL schemas.
+
+        Args:
+            schema: json schema to compile
+
+        Raises:
+            UnsupportedSchemaError: if the schema uses features not supported by the compiler
+        """
+        self.schema = schema
+        self.namespace = {"_equal": _equal, "_is_number": _is_number, "_is_uuid": _is_uuid}
+        self.functions = []
+        self._refs = {}
+        self._counter = 0
+
+    def compile(self) -> Callable[[Any], bool]:
+        """
+        Returns:
+            check: function returning `True` if the provided instance is valid
+        """
+        name = self._compile_node(self.schema)
+        source = "\n\n".join(self.functions)
+        code = compile(source, "<pyfdl.schema_compiler>", "exec")
+        exec(code, self.namespace)  # noqa: S102
+
+        return self.namespace[name]
+
+    def _new_name(self, prefix: str = "validate") -> str:
+        self._counter += 1
+        return f"{prefix}_{self._counter}"
+
+    def _constant(self, value: Any) -> str:
+        name = self._new_name("const")
+        self.namespace[name] = value
+        return name
+
+    def _resolve_ref(self, ref: str) -> str:
+        if ref in self._refs:
+            return self._refs[ref]
+
+        if not ref.startswith("#"):
+            msg = f"Only local references are supported: {ref}"
+            raise UnsupportedSchemaError(msg)
+
+        target = self.schema
+        for part in ref.lstrip("#").split("/"):
+            if not part:
+                continue
+            part = part.replace("~1", "/").replace("~0", "~")
+            target = target[part]
+
+        # Register the name before compiling in case of recursive references
+        name = self._new_name()
+        self._refs[ref] = name
+        self._compile_node(target, name=name)
+
+        return name
+
+    def _compile_node(self, node: Any, name: Optional[str] = None) -> str:
+        name = name or self._new_name()
+        lines = [f"def {name}(data):"]
+
+        if node is True or node == {}:
+            lines.append("    return True")
+            self.functions.append("\n".join(lines))
+            return name
+
+        if node is False:
+            lines.append("    return False")
+            self.functions.append("\n".join(lines))
+            return name
+
+        if not isinstance(node, dict):
+            msg = f"Unsupported schema: {node!r}"
+            raise UnsupportedSchemaError(msg)
+
+        for keyword, value in node.items():
+            if keyword in ANNOTATIONS:
+                continue
+
+            handler = getattr(self, f"_kw_{keyword.lstrip('$')}", None)
+            if handler is None:
+                msg = f'Unsupported keyword: "{keyword}"'
+                raise UnsupportedSchemaError(msg)
+
+            lines.extend(f"    {line}" for line in handler(value, node))
+
+        lines.append("    return True")
+        self.functions.append("\n".join(lines))
+
+        return name
+
+    # Keyword handlers return lines of code that `return False` if the check fails
+
+    def _kw_ref(self, ref: str, node: dict) -> list[str]:
+        return [f"if not {self._resolve_ref(ref)}(data):", "    return False"]
+
+    def _kw_type(self, types: Any, node: dict) -> list[str]:
+        types = [types] if isinstance(types, str) else types
+        checks = []
+        for type_ in types:
+            if type_ not in TYPE_CHECKS:
+                msg = f'Unsupported type: "{type_}"'
+                raise UnsupportedSchemaError(msg)
+            checks.append(TYPE_CHECKS[type_].format("data"))
+
+        return [f"if not ({' or '.join(checks)}):", "    return False"]
+
+    def _kw_const(self, value: Any, node: dict) -> list[str]:
+        return [f"if not _equal(data, {self._constant(value)}):", "    return False"]
+
+    def _kw_enum(self, values: list, node: dict) -> list[str]:
+        return [f"if not any(_equal(data, value) for value in {self._constant(values)}):", "    return False"]
+
+    def _kw_minimum(self, value: float, node: dict) -> list[str]:
+        return [f"if _is_number(data) and data < {value!r}:", "    return False"]
+
+    def _kw_maximum(self, value: float, node: dict) -> list[str]:
+        return [f"if _is_number(data) and data > {value!r}:", "    return False"]
+
+    def _kw_exclusiveMinimum(self, value: float, node: dict) -> list[str]:
+        return [f"if _is_number(data) and data <= {value!r}:", "    return False"]
+
+    def _kw_exclusiveMaximum(self, value: float, node: dict) -> list[str]:
+        return [f"if _is_number(data) and data >= {value!r}:", "    return False"]
+
+    def _kw_minLength(self, value: int, node: dict) -> list[str]:
+        return [f"if isinstance(data, str) and len(data) < {value!r}:", "    return False"]
+
+    def _kw_maxLength(self, value: int, node: dict) -> list[str]:
+        return [f"if isinstance(data, str) and len(data) > {value!r}:", "    return False"]
+
+    def _kw_pattern(self, pattern: str, node: dict) -> list[str]:
+        regex = self._constant(re.compile(pattern))
+        return [f"if isinstance(data, str) and {regex}.search(data) is None:", "    return False"]
+
+    def _kw_format(self, format_: str, node: dict) -> list[str]:
+        if format_ not in FORMAT_CHECKS:
+            msg = f'Unsupported format: "{format_}"'
+            raise UnsupportedSchemaError(msg)
+
+        return [f"if not {FORMAT_CHECKS[format_]}(data):", "    return False"]
+
+    def _kw_required(self, keys: list, node: dict) -> list[str]:
+        if not keys:
+            return []
+
+        lines = ["if isinstance(data, dict):"]
+        for key in keys:
+            lines.extend([f"    if {key!r} not in data:", "        return False"])
+
+        return lines
+
+    def _kw_dependentRequired(self, dependencies: dict, node: dict) -> list[str]:
+        if not dependencies:
+            return []
+
+        lines = ["if isinstance(data, dict):"]
+        for key, required in dependencies.items():
+            lines.append(f"    if {key!r} in data:")
+            for dep in required:
+                lines.extend([f"        if {dep!r} not in data:", "            return False"])
+
+        return lines
+
+    def _kw_properties(self, properties: dict, node: dict) -> list[str]:
+        if not properties:
+            return []
+
+        lines = ["if isinstance(data, dict):"]
+        for key, sub_schema in properties.items():
+            func = self._compile_node(sub_schema)
+            lines.append(f"    if {key!r} in data and not {func}(data[{key!r}]):")
+            lines.append("        return False")
+
+        return lines
+
+    def _kw_patternProperties(self, patterns: dict, node: dict) -> list[str]:
+        if not patterns:
+            return []
+
+        lines = ["if isinstance(data, dict):", "    for key, value in data.items():"]
+        for pattern, sub_schema in patterns.items():
+            regex = self._constant(re.compile(pattern))
+            func = self._compile_node(sub_schema)
+            lines.append(f"        if {regex}.search(key) is not None and not {func}(value):")
+            lines.append("            return False")
+
+        return lines
+
+    def _kw_additionalProperties(self, sub_schema: Any, node: dict) -> list[str]:
+        known = self._constant(frozenset(node.get("properties", {})))
+        patterns = self._constant([re.compile(pattern) for pattern in node.get("patternProperties", {})])
+        lines = [
+            "if isinstance(data, dict):",
+            "    for key, value in data.items():",
+            f"        if key in {known} or any(regex.search(key) for regex in {patterns}):",
+            "            continue",
+        ]
+        if sub_schema is False:
+            lines.append("        return False")
+        else:
+            func = self._compile_node(sub_schema)
+            lines.append(f"        if not {func}(value):")
+            lines.append("            return False")
+
+        return lines
+
+    def _kw_items(self, sub_schema: Any, node: dict) -> list[str]:
+        if isinstance(sub_schema, list):
+            msg = "Tuple validation with a list of items is not supported"
+            raise UnsupportedSchemaError(msg)
+
+        func = self._compile_node(sub_schema)
+        return [
+            "if isinstance(data, list):",
+            "    for item in data:",
+            f"        if not {func}(item):",
+            "            return False",
+        ]
+
+    def _kw_not(self, sub_schema: Any, node: dict) -> list[str]:
+        return [f"if {self._compile_node(sub_schema)}(data):", "    return False"]
+
+    def _kw_allOf(self, sub_schemas: list, node: dict) -> list[str]:
+        lines = []
+        for sub_schema in sub_schemas:
+            lines.extend([f"if not {self._compile_node(sub_schema)}(data):", "    return False"])
+
+        return lines
+
+    def _kw_anyOf(self, sub_schemas: list, node: dict) -> list[str]:
+        funcs = ", ".join(self._compile_node(sub_schema) for sub_schema in sub_schemas)
+        return [f"if not any(func(data) for func in ({funcs},)):", "    return False"]
+
+    def _kw_oneOf(self, sub_schemas: list, node: dict) -> list[str]:
+        funcs = ", ".join(self._compile_node(sub_schema) for sub_schema in sub_schemas)
+        return [f"if sum(1 for func in ({funcs},) if func(data)) != 1:", "    return False"]
+
+
+class CompiledValidator:
+    def __init__(self, schema: dict, fallback: Any):
+        """Validator running a compiled version of the schema. Valid instances are accepted by the
+        compiled check alone. For invalid instances the `fallback` validator is used to report the errors,
+        so errors are identical to the ones produced by `jsonschema`.
+        If the schema can't be compiled, all validation is done by the `fallback` validator.
+
+        Args:
+            schema: json schema
+            fallback: `jsonschema` validator for the same schema
+        """
+        self.schema = schema
+        self.fallback = fallback
+        try:
+            self.check = SchemaCompiler(schema).compile()
+            self.is_compiled = True
+
+        except UnsupportedSchemaError:
+            self.check = fallback.is_valid
+            self.is_compiled = False
+
+    def is_valid(self, instance: Any) -> bool:
+        return self.check(instance)
+
+    def iter_errors(self, instance: Any) -> Iterator[Any]:
+        if self.check(instance):
+            return iter(())
+
+        return self.fallback.iter_errors(instance)
+
+    def validate(self, instance: Any) -> None:
+        if not self.check(instance):
+            self.fallback.validate(instance)
@@ -0,0 +1,501 @@
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from .canvas import Canvas
+from .context import Context
+from .errors import FDLError
+from .fdl import FDL
+from .framing_decision import FramingDecision
+
+
+def _spec(*paths: Union[str, tuple[str, str]]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    # (column, path) for every value stored in a table. Columns are named after their path unless given
+    spec = []
+    for path in paths:
+        column, path = path if isinstance(path, tuple) else (path.replace(".", "_"), path)
+        spec.append((column, tuple(path.split("."))))
+
+    return tuple(spec)
+
+
+def _dimensions(name: str) -> tuple[str, str]:
+    return f"{name}.width", f"{name}.height"
+
+
+def _point(name: str) -> tuple[str, str]:
+    return f"{name}.x", f"{name}.y"
+
+
+# Tables and the values of the FDL json they hold
+_TABLES = {
+    "fdls": _spec("uuid", "version.major", "version.minor", "fdl_creator", "default_framing_intent"),
+    "framing_intents": _spec("id", "label", *_dimensions("aspect_ratio"), "protection"),
+    "contexts": _spec(
+        "label",
+        "context_creator",
+        ("clip_name", "clip_id.clip_name"),
+        ("clip_file", "clip_id.file"),
+        ("sequence_value", "clip_id.sequence.value"),
+        ("sequence_idx", "clip_id.sequence.idx"),
+        ("sequence_min", "clip_id.sequence.min"),
+        ("sequence_max", "clip_id.sequence.max"),
+    ),
+    "canvases": _spec(
+        "label",
+        "id",
+        "source_canvas_id",
+        *_dimensions("dimensions"),
+        *_dimensions("effective_dimensions"),
+        *_point("effective_anchor_point"),
+        *_dimensions("photosite_dimensions"),
+        *_dimensions("physical_dimensions"),
+        "anamorphic_squeeze",
+    ),
+    "framing_decisions": _spec(
+        "label",
+        "id",
+        "framing_intent_id",
+        *_dimensions("dimensions"),
+        *_point("anchor_point"),
+        *_dimensions("protection_dimensions"),
+        *_point("protection_anchor_point"),
+    ),
+    "canvas_templates": _spec(
+        "label",
+        "id",
+        *_dimensions("target_dimensions"),
+        "target_anamorphic_squeeze",
+        "fit_source",
+        "fit_method",
+        "alignment_method_vertical",
+        "alignment_method_horizontal",
+        "preserve_from_source_canvas",
+        *_dimensions("maximum_dimensions"),
+        "pad_to_maximum",
+        "round.even",
+        "round.mode",
+    ),
+}
+
+# Columns holding json booleans. SQLite stores them as 0 and 1, so they're turned back into bools when read
+_BOOLEANS = {"canvas_templates": {"pad_to_maximum"}}
+
+# Columns linking rows to their parent, and the key of each table
+_PARENTS = {
+    "fdls": (),
+    "framing_intents": ("fdl_key",),
+    "contexts": ("fdl_key",),
+    "canvases": ("fdl_key", "context_key"),
+    "framing_decisions": ("fdl_key", "canvas_key"),
+    "canvas_templates": ("fdl_key",),
+}
+_KEYS = {
+    "fdls": "fdl_key",
+    "framing_intents": "framing_intent_key",
+    "contexts": "context_key",
+    "canvases": "canvas_key",
+    "framing_decisions": "framing_decision_key",
+    "canvas_templates": "canvas_template_key",
+}
+
+_INDEXES = {
+    "framing_intents": ["fdl_key, id", "aspect_ratio_width, aspect_ratio_height"],
+    "contexts": ["fdl_key", "clip_name", "label"],
+    "canvases": ["context_key", "id", "source_canvas_id", "dimensions_width, dimensions_height"],
+    "framing_decisions": ["canvas_key", "framing_intent_id", "dimensions_width, dimensions_height"],
+    "canvas_templates": ["fdl_key"],
+}
+
+# Tables joined to find matches, in order, and how they're joined
+_JOINS = (
+    ("fdls", "f", ""),
+    ("contexts", "c", "c.fdl_key = f.fdl_key"),
+    ("canvases", "cv", "cv.context_key = c.context_key"),
+    ("framing_decisions", "fd", "fd.canvas_key = cv.canvas_key"),
+    ("framing_intents", "fi", "fi.fdl_key = fd.fdl_key AND fi.id = fd.framing_intent_id"),
+)
+
+# Filters supported by the find methods: (alias, columns)
+_FILTERS = {
+    "uuid": ("f", ("uuid",)),
+    "clip_name": ("c", ("clip_name",)),
+    "context_label": ("c", ("label",)),
+    "canvas_id": ("cv", ("id",)),
+    "source_canvas_id": ("cv", ("source_canvas_id",)),
+    "canvas_dimensions": ("cv", ("dimensions_width", "dimensions_height")),
+    "framing_decision_id": ("fd", ("id",)),
+    "framing_intent_id": ("fd", ("framing_intent_id",)),
+    "framing_dimensions": ("fd", ("dimensions_width", "dimensions_height")),
+    "has_protection": ("fd", ("protection_dimensions_width",)),
+    "aspect_ratio": ("fi", ("aspect_ratio_width", "aspect_ratio_height")),
+}
+
+
+def _flatten(data: dict, spec: tuple) -> list:
+    values = []
+    for _, path in spec:
+        value = data
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        values.append(value)
+
+    return values
+
+
+def _unflatten(row: Iterable, table: str) -> dict:
+    data = {}
+    booleans = _BOOLEANS.get(table, ())
+    for (column, path), value in zip(_TABLES[table], row):
+        if value is None:
+            continue
+
+        if column in booleans:
+            value = bool(value)
+
+        target = data
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+
+    return data
+
+
+class FDLStore:
+    def __init__(self, path: Union[Path, str] = ":memory:"):
+        """Persistent store of FDLs in an SQLite database, using normalized tables for FDLs, framing intents,
+        contexts, canvases, framing decisions and canvas templates. Common values like clip names, canvas ids,
+        source canvas ids, framing intent ids and dimensions are indexed, so questions like
+        "which clips are framed for 2.39 with protection" are answered without reading any FDL files.
+
+        Queries return complete FDLs, or only the contexts, canvases or framing decisions matching them.
+        The tables may also be queried directly through `connection`.
+
+        Args:
+            path: to database file. Created if missing. Defaults to an in-memory database
+        """
+        self.path = str(path)
+        self.connection = sqlite3.connect(self.path)
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        with self.connection:
+            for table, spec in _TABLES.items():
+                # Columns are left without a type so values are stored as is. Ints stay ints and floats stay
+                # floats. Only booleans are turned into 0 and 1 by SQLite. See `_BOOLEANS`
+                columns = [f"{_KEYS[table]} INTEGER PRIMARY KEY"]
+                columns.extend(f"{parent} INTEGER NOT NULL" for parent in _PARENTS[table])
+                if table != "fdls":
+                    columns.append("position INTEGER NOT NULL")
+                columns.extend(column for column, _ in spec)
+                if table == "fdls":
+                    columns[columns.index("uuid")] = "uuid TEXT NOT NULL UNIQUE"
+
+                self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})")
+
+            for table, indexes in _INDEXES.items():
+                for columns in indexes:
+                    name = f"{table}_{columns.replace(', ', '_')}"
+                    self.connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+
+    def add(self, fdl: FDL, validate: bool = True) -> None:
+        """Add an FDL to the store, replacing any stored FDL with the same uuid
+
+        Args:
+            fdl: to store
+            validate: validate the FDL with jsonschema before it's stored
+
+        Raises:
+            FDLValidationError: if the FDL doesn't follow the spec
+        """
+        self.add_many((fdl,), validate=validate)
+
+    def add_many(self, fdls: Iterable[FDL], validate: bool = True) -> None:
+        """Add FDLs to the store in a single transaction, replacing any stored FDLs with the same uuids.
+        Nothing is stored if one of them fails.
+
+        Args:
+            fdls: any iterable of FDLs like a generator
+            validate: validate each FDL with jsonschema before it's stored
+
+        Raises:
+            FDLValidationError: if an FDL doesn't follow the spec
+        """
+        with self.connection:
+            for fdl in fdls:
+                if validate:
+                    fdl.validate()
+
+                self._insert(fdl.to_dict())
+
+    def _insert(self, data: dict) -> None:
+        self._delete(data.get("uuid"))
+        fdl_key = self._insert_row("fdls", (), 0, data)
+        self._insert_rows("framing_intents", (fdl_key,), data.get("framing_intents", ()))
+        self._insert_rows("canvas_templates", (fdl_key,), data.get("canvas_templates", ()))
+
+        for position, context in enumerate(data.get("contexts", ())):
+            context_key = self._insert_row("contexts", (fdl_key,), position, context)
+            for canvas_position, canvas in enumerate(context.get("canvases", ())):
+                canvas_key = self._insert_row("canvases", (fdl_key, context_key), canvas_position, canvas)
+                self._insert_rows("framing_decisions", (fdl_key, canvas_key), canvas.get("framing_decisions", ()))
+
+    def _insert_row(self, table: str, parents: tuple, position: int, data: dict) -> int:
+        values = [*parents] if table == "fdls" else [*parents, position]
+        values.extend(_flatten(data, _TABLES[table]))
+        placeholders = ", ".join("?" * len(values))
+        cursor = self.connection.execute(f"INSERT INTO {table} VALUES (NULL, {placeholders})", values)
+
+        return cursor.lastrowid
+
+    def _insert_rows(self, table: str, parents: tuple, items: Iterable[dict]) -> None:
+        rows = [[*parents, position, *_flatten(item, _TABLES[table])] for position, item in enumerate(items)]
+        if rows:
+            placeholders = ", ".join("?" * len(rows[0]))
+            self.connection.executemany(f"INSERT INTO {table} VALUES (NULL, {placeholders})", rows)
+
+    def remove(self, uuid: str) -> None:
+        """Remove an FDL from the store if found
+
+        Args:
+            uuid: of FDL to remove
+        """
+        with self.connection:
+            self._delete(uuid)
+
+    def _delete(self, uuid: str) -> None:
+        row = self.connection.execute("SELECT fdl_key FROM fdls WHERE uuid = ?", (uuid,)).fetchone()
+        if row is None:
+            return
+
+        for table in reversed(_TABLES):
+            self.connection.execute(f"DELETE FROM {table} WHERE fdl_key = ?", row)
+
+    def get(self, uuid: str) -> Optional[FDL]:
+        """Get a stored FDL
+
+        Args:
+            uuid: of FDL to get
+
+        Returns:
+            FDL: or `None` if not found
+        """
+        fdls = self.find_fdls(uuid=uuid)
+
+        return fdls[0] if fdls else None
+
+    def uuids(self) -> list[str]:
+        """
+        Returns:
+            uuids: of all stored FDLs in the order they were added
+        """
+        return [uuid for (uuid,) in self.connection.execute("SELECT uuid FROM fdls ORDER BY fdl_key")]
+
+    def find_fdls(self, **filters: Any) -> list[FDL]:
+        """Find FDLs holding anything matching all the provided filters. Returns all FDLs without filters.
+
+        Args:
+            **filters: see [filters](store.md#filters)
+
+        Raises:
+            FDLError: for unknown filters
+
+        Returns:
+            fdls: complete FDLs
+        """
+        keys = self._match("f", filters)
+        fdls = self._rows("fdls", f"fdl_key IN ({keys})", filters)
+        intents = self._grouped_rows("framing_intents", "fdl_key", f"fdl_key IN ({keys})", filters)
+        templates = self._grouped_rows("canvas_templates", "fdl_key", f"fdl_key IN ({keys})", filters)
+        contexts = self._load_contexts(f"fdl_key IN ({keys})", filters)
+
+        result = []
+        for fdl_key, raw in fdls:
+            raw["framing_intents"] = intents.get(fdl_key, [])
+            raw["contexts"] = [context for _, context in contexts.get(fdl_key, [])]
+            raw["canvas_templates"] = templates.get(fdl_key, [])
+            result.append(FDL.from_dict(raw))
+
+        return result
+
+    def find_contexts(self, **filters: Any) -> list[Context]:
+        """Find contexts holding anything matching all the provided filters. Returns all contexts without filters.
+
+        Args:
+            **filters: see [filters](store.md#filters)
+
+        Raises:
+            FDLError: for unknown filters
+
+        Returns:
+            contexts: complete contexts with all their canvases
+        """
+        keys = self._match("c", filters)
+        contexts = self._load_contexts(f"context_key IN ({keys})", filters)
+
+        return [Context.from_dict(raw) for items in contexts.values() for _, raw in items]
+
+    def find_canvases(self, **filters: Any) -> list[Canvas]:
+        """Find canvases holding anything matching all the provided filters. Returns all canvases without filters.
+
+        Args:
+            **filters: see [filters](store.md#filters)
+
+        Raises:
+            FDLError: for unknown filters
+
+        Returns:
+            canvases: complete canvases with all their framing decisions
+        """
+        keys = self._match("cv", filters)
+        canvases = self._load_canvases(f"canvas_key IN ({keys})", filters)
+
+        return [Canvas.from_dict(raw) for items in canvases.values() for _, raw in items]
+
+    def find_framing_decisions(self, **filters: Any) -> list[FramingDecision]:
+        """Find framing decisions matching all the provided filters. Returns all framing decisions without filters.
+
+        Args:
+            **filters: see [filters](store.md#filters)
+
+        Raises:
+            FDLError: for unknown filters
+
+        Returns:
+            framing_decisions:
+        """
+        keys = self._match("fd", filters)
+        rows = self._rows("framing_decisions", f"framing_decision_key IN ({keys})", filters)
+
+        return [FramingDecision.from_dict(raw) for _, raw in rows]
+
+    def _match(self, alias: str, filters: dict) -> str:
+        # Build a query selecting the keys of rows in the table of `alias` matching the filters
+        aliases = [join_alias for _, join_alias, _ in _JOINS]
+        depth = aliases.index(alias)
+        conditions = []
+        for name, value in filters.items():
+            if name not in _FILTERS:
+                msg = f"Unknown filter: {name!r}. Please use one of {sorted(_FILTERS)}"
+                raise FDLError(msg)
+
+            if value is None:
+                continue
+
+            filter_alias, columns = _FILTERS[name]
+            depth = max(depth, aliases.index(filter_alias))
+            conditions.append(self._condition(name, filter_alias, columns))
+
+        table = _JOINS[aliases.index(alias)][0]
+        query = [f"SELECT DISTINCT {alias}.{_KEYS[table]} FROM fdls f"]
+        for table, join_alias, on in _JOINS[1 : depth + 1]:
+            query.append(f"JOIN {table} {join_alias} ON {on}")
+
+        if conditions:
+            query.append(f"WHERE {' AND '.join(conditions)}")
+
+        return " ".join(query)
+
+    @staticmethod
+    def _condition(name: str, alias: str, columns: tuple) -> str:
+        if name == "has_protection":
+            return f"(CASE WHEN :{name} THEN {alias}.{columns[0]} IS NOT NULL ELSE {alias}.{columns[0]} IS NULL END)"
+
+        if name == "aspect_ratio":
+            # Ratios like 2.39 are compared with two decimals. Dimensions like (239, 100) are compared as is
+            width, height = (f"{alias}.{column}" for column in columns)
+            return (
+                f"(CASE WHEN :{name}_height IS NULL "
+                f"THEN ROUND(CAST({width} AS REAL) / {height}, 2) = ROUND(:{name}, 2) "
+                f"ELSE {width} = :{name} AND {height} = :{name}_height END)"
+            )
+
+        if len(columns) == 2:
+            return f"{alias}.{columns[0]} = :{name} AND {alias}.{columns[1]} = :{name}_height"
+
+        return f"{alias}.{columns[0]} = :{name}"
+
+    @staticmethod
+    def _parameters(filters: dict) -> dict:
+        parameters = {}
+        for name, value in filters.items():
+            if isinstance(value, Iterable) and not isinstance(value, str):
+                # Dimensions and (width, height) tuples
+                value, parameters[f"{name}_height"] = value
+            elif name in ("aspect_ratio", "canvas_dimensions", "framing_dimensions"):
+                parameters[f"{name}_height"] = None
+
+            parameters[name] = value
+
+        return parameters
+
+    def _rows(self, table: str, where: str, filters: dict) -> list[tuple[int, dict]]:
+        spec = _TABLES[table]
+        columns = ", ".join(column for column, _ in spec)
+        order = "fdl_key" if table == "fdls" else f"{_PARENTS[table][-1]}, position"
+        query = f"SELECT {_KEYS[table]}, {columns} FROM {table} WHERE {where} ORDER BY {order}"
+        cursor = self.connection.execute(query, self._parameters(filters))
+
+        return [(row[0], _unflatten(row[1:], table)) for row in cursor]
+
+    def _grouped_rows(self, table: str, parent: str, where: str, filters: dict) -> dict[int, list]:
+        spec = _TABLES[table]
+        columns = ", ".join(column for column, _ in spec)
+        query = f"SELECT {parent}, {columns} FROM {table} WHERE {where} ORDER BY {parent}, position"
+
+        grouped = defaultdict(list)
+        for row in self.connection.execute(query, self._parameters(filters)):
+            grouped[row[0]].append(_unflatten(row[1:], table))
+
+        return grouped
+
+    def _load_contexts(self, where: str, filters: dict) -> dict[int, list[tuple[int, dict]]]:
+        # Contexts grouped by FDL, with their canvases
+        canvases = self._load_canvases(f"context_key IN (SELECT context_key FROM contexts WHERE {where})", filters)
+
+        spec = _TABLES["contexts"]
+        columns = ", ".join(column for column, _ in spec)
+        query = f"SELECT fdl_key, context_key, {columns} FROM contexts WHERE {where} ORDER BY fdl_key, position"
+
+        grouped = defaultdict(list)
+        for row in self.connection.execute(query, self._parameters(filters)):
+            context = _unflatten(row[2:], "contexts")
+            context["canvases"] = [canvas for _, canvas in canvases.get(row[1], [])]
+            grouped[row[0]].append((row[1], context))
+
+        return grouped
+
+    def _load_canvases(self, where: str, filters: dict) -> dict[int, list[tuple[int, dict]]]:
+        # Canvases grouped by context, with their framing decisions
+        decisions = self._grouped_rows(
+            "framing_decisions", "canvas_key", f"canvas_key IN (SELECT canvas_key FROM canvases WHERE {where})", filters
+        )
+
+        spec = _TABLES["canvases"]
+        columns = ", ".join(column for column, _ in spec)
+        query = f"SELECT context_key, canvas_key, {columns} FROM canvases WHERE {where} ORDER BY context_key, position"
+
+        grouped = defaultdict(list)
+        for row in self.connection.execute(query, self._parameters(filters)):
+            canvas = _unflatten(row[2:], "canvases")
+            canvas["framing_decisions"] = decisions.get(row[1], [])
+            grouped[row[0]].append((row[1], canvas))
+
+        return grouped
+
+    def close(self) -> None:
+        """Close the database"""
+        self.connection.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM fdls").fetchone()[0]
+
+    def __contains__(self, uuid: str) -> bool:
+        return self.connection.execute("SELECT 1 FROM fdls WHERE uuid = ?", (uuid,)).fetchone() is not None
+
+    def __enter__(self) -> "FDLStore":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,333 @@
+import io
+import json
+import re
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from .common import FDL_SCHEMA_MAJOR, FDL_SCHEMA_MINOR, TypedCollection
+from .context import Context
+from .errors import FDLValidationError, ValidationIssue
+from .fdl import FDL
+from .validators import get_validator, iter_schema_issues
+
+DEFAULT_CHUNK_SIZE = 1024 * 64
+
+_WHITESPACE = " \t\n\r"
+_CONTAINERS = '"[{'
+_DELIMITER = re.compile(r"[,\]}\s]")
+_DECODER = json.JSONDecoder()
+
+
+class _ChunkReader:
+    def __init__(self, fp: IO[str], chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: Optional[int] = None) -> bool:
+        """Read another chunk, dropping what's already consumed from the buffer.
+
+        Returns:
+            `False` if the end of the file is reached
+        """
+        if self.eof:
+            return False
+
+        chunk = self.fp.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it.
+        Returns an empty string at the end of the file
+        """
+        while True:
+            buffer = self.buffer
+            size = len(buffer)
+            pos = self.pos
+            while pos < size and buffer[pos] in _WHITESPACE:
+                pos += 1
+
+            self.pos = pos
+            if pos < size or not self.fill():
+                return buffer[pos] if pos < size else ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            expected = " or ".join(repr(c) for c in chars)
+            msg = f"Expecting {expected}"
+            raise json.JSONDecodeError(msg, self.buffer, self.pos)
+
+        self.pos += 1
+
+        return char
+
+    def decode(self) -> Any:
+        """Decode the next complete json value, reading more of the file until the value is closed."""
+        if self.peek() not in _CONTAINERS:
+            # Numbers and literals have no closing character. Make sure they're read to the end
+            while _DELIMITER.search(self.buffer, self.pos) is None and self.fill():
+                pass
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+
+            except json.JSONDecodeError:
+                # Value is incomplete. Grow the reads with the size of the value to keep retries cheap
+                if self.fill(max(self.chunk_size, len(self.buffer) - self.pos)):
+                    continue
+
+                raise
+
+            self.pos = end
+            return value
+
+
+def iter_members(
+    fp: IO[str], stream_keys: Iterable[str] = (), chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[str, Optional[int], Any]]:
+    """Read the members of a json object in chunks without loading the whole document.
+    The arrays of the keys in `stream_keys` are not collected but passed on one item at a time,
+    as soon as each item is closed.
+
+    Args:
+        fp: text file like object holding a json object
+        stream_keys: keys of arrays to stream item by item
+        chunk_size: amount of characters to read at a time
+
+    Raises:
+        json.JSONDecodeError: if the document is not a valid json object
+
+    Returns:
+        members: tuples of (key, index, value). The index of streamed items, otherwise `None`
+    """
+    stream_keys = frozenset(stream_keys)
+    reader = _ChunkReader(fp, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+
+    while True:
+        if reader.peek() != '"':
+            reader.expect('"')
+
+        key = reader.decode()
+        reader.expect(":")
+
+        if key in stream_keys and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                index = 0
+                while True:
+                    yield key, index, reader.decode()
+                    index += 1
+                    if reader.expect(",]") == "]":
+                        break
+        else:
+            yield key, None, reader.decode()
+
+        if reader.expect(",}") == "}":
+            break
+
+    if reader.peek():
+        msg = "Extra data"
+        raise json.JSONDecodeError(msg, reader.buffer, reader.pos)
+
+
+CONTEXTS_POINTER = "/properties/contexts/items"
+
+
+def _schema_version(version: Any) -> tuple[int, int]:
+    # Same as `FDL.schema_version` but for raw json
+    if isinstance(version, dict) and version:
+        return version.get("major"), version.get("minor")
+
+    return FDL_SCHEMA_MAJOR, FDL_SCHEMA_MINOR
+
+
+def _context_issues(version: Any, index: int, raw: dict) -> list[ValidationIssue]:
+    validator = get_validator(*_schema_version(version), pointer=CONTEXTS_POINTER)
+    return list(iter_schema_issues(validator, raw, path=f"/contexts/{index}"))
+
+
+def read_fdl(
+    fp: IO[str],
+    validate: bool = True,
+    lazy: bool = False,
+    fail_fast: bool = False,
+    max_errors: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> FDL:
+    """Read an FDL in chunks. Each context is created as soon as its json is read, so the json of the
+    whole document is never held in memory. Contexts are validated on their own as they're read,
+    and reading stops once `max_errors` errors are found.
+
+    Args:
+        fp: text file like object holding an FDL
+        validate: validate incoming json with jsonschema
+        lazy: only create framing intents, canvas templates and canvases when first accessed
+        fail_fast: stop at the first error found
+        max_errors: stop after finding this many errors
+        chunk_size: amount of characters to read at a time
+
+    Raises:
+        FDLValidationError: if the contents doesn't follow the spec
+        ValueError: if `max_errors` is less than 1
+
+    Returns:
+        FDL:
+    """
+    if max_errors is not None and max_errors < 1:
+        msg = f"max_errors must be at least 1, not {max_errors}. Use None to find all errors"
+        raise ValueError(msg)
+
+    if fail_fast:
+        max_errors = 1
+
+    members = {}
+    contexts = TypedCollection(Context)
+    # Contexts read before the version of the FDL are validated once it's known
+    pending = []
+    errors = []
+
+    for key, index, value in iter_members(fp, stream_keys=("contexts",), chunk_size=chunk_size):
+        if index is None:
+            members[key] = value
+            continue
+
+        if validate:
+            if "version" in members:
+                issues = _context_issues(members["version"], index, value)
+                if issues:
+                    # The FDL is rejected anyway, so don't bother creating the context
+                    errors.extend(issues)
+                    if max_errors and len(errors) >= max_errors:
+                        raise FDLValidationError.from_errors(errors[:max_errors])
+
+                    continue
+            else:
+                pending.append((index, value))
+
+        contexts.add(Context.from_dict(value, lazy=lazy))
+
+    streamed = "contexts" not in members
+    fdl = FDL.from_dict(members, lazy=lazy)
+    if streamed:
+        fdl.contexts = contexts
+
+    if validate:
+        for index, value in pending:
+            errors.extend(_context_issues(members.get("version"), index, value))
+
+        if streamed:
+            # Contexts are validated already. An empty array stands in for them
+            members["contexts"] = []
+
+        validator = get_validator(*fdl.schema_version)
+        errors.extend(fdl.iter_validation_errors(schema=False))
+        errors.extend(iter_schema_issues(validator, members))
+        if errors:
+            raise FDLValidationError.from_errors(errors[:max_errors])
+
+    return fdl
+
+
+def iter_contexts(
+    fp: IO[str], validate: bool = True, lazy: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Context]:
+    """Read the contexts of an FDL one at a time without loading the rest of the document.
+    Only the contexts themselves are validated, as checking relations needs the whole FDL.
+
+    Args:
+        fp: text file like object holding an FDL
+        validate: validate each context with jsonschema
+        lazy: only create canvases and framing decisions when first accessed
+        chunk_size: amount of characters to read at a time
+
+    Raises:
+        FDLValidationError: if a context doesn't follow the spec
+
+    Returns:
+        contexts:
+    """
+    version = None
+    # Contexts read before the version of the FDL are held back until it's known
+    pending = []
+
+    for key, index, value in iter_members(fp, stream_keys=("contexts", "version"), chunk_size=chunk_size):
+        if key == "version":
+            version = value
+            for pending_index, pending_value in pending:
+                yield _read_context(version, pending_index, pending_value, validate, lazy)
+            pending = []
+
+        elif index is not None:
+            if version is None and validate:
+                pending.append((index, value))
+            else:
+                yield _read_context(version, index, value, validate, lazy)
+
+    for index, value in pending:
+        yield _read_context(version, index, value, validate, lazy)
+
+
+def _read_context(version: Any, index: int, raw: dict, validate: bool, lazy: bool) -> Context:
+    if validate:
+        errors = _context_issues(version, index, raw)
+        if errors:
+            raise FDLValidationError.from_errors(errors)
+
+    return Context.from_dict(raw, lazy=lazy)
+
+
+def _is_binary(fp: IO) -> bool:
+    if isinstance(fp, io.TextIOBase):
+        return False
+
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+
+    return "b" in getattr(fp, "mode", "")
+
+
+def write_json(
+    data: Any, fp: IO, indent: Optional[int] = 2, buffer_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8"
+) -> None:
+    """Encode json straight to a stream. The output is the same as `json.dumps`, but produced piece by
+    piece and written whenever `buffer_size` characters are collected. The first bytes are written
+    before the whole document is encoded, and the complete string is never held in memory.
+
+    Args:
+        data: to encode
+        fp: text or binary stream to write to
+        indent: amount of spaces
+        buffer_size: amount of characters to collect before writing
+        encoding: used for binary streams
+    """
+    binary = _is_binary(fp)
+    buffer = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=indent).iterencode(data):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            text = "".join(buffer)
+            fp.write(text.encode(encoding) if binary else text)
+            buffer = []
+            size = 0
+
+    if buffer:
+        text = "".join(buffer)
+        fp.write(text.encode(encoding) if binary else text)
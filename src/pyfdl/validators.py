@@ -0,0 +1,191 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+import jsonschema
+
+from .common import FDL_SCHEMA_MAJOR, FDL_SCHEMA_MINOR
+from .errors import FDLError, ValidationIssue
+from .schema_compiler import CompiledValidator
+
+SCHEMA_DIR = Path(__file__).parent.joinpath("schema")
+
+VALIDATOR_BACKENDS = ("compiled", "jsonschema")
+
+# Process wide caches keyed by (major, minor) and (major, minor, backend)
+_SCHEMAS = {}
+_VALIDATORS = {}
+_LOCK = threading.Lock()
+
+
+def get_schema_versions() -> list[tuple[int, int]]:
+    """
+    Returns:
+        versions: (major, minor) of all json schemas bundled with PyFDL
+    """
+    versions = []
+    for path in SCHEMA_DIR.glob("v*/ascfdl.schema.json"):
+        major, minor = path.parent.name.lstrip("v").split(".")
+        versions.append((int(major), int(minor)))
+
+    return sorted(versions)
+
+
+def get_schema(major: int = FDL_SCHEMA_MAJOR, minor: int = FDL_SCHEMA_MINOR) -> dict:
+    """Get one of the json schemas bundled with PyFDL. The schema is loaded once per process
+    and shared, so please treat it as read-only.
+
+    Args:
+        major: version of schema
+        minor: version of schema
+
+    Raises:
+        FDLError: if no schema matches the version
+
+    Returns:
+        schema:
+    """
+    key = (major, minor)
+    schema = _SCHEMAS.get(key)
+    if schema is not None:
+        return schema
+
+    with _LOCK:
+        schema = _SCHEMAS.get(key)
+        if schema is None:
+            schema_path = SCHEMA_DIR.joinpath(f"v{major}.{minor}", "ascfdl.schema.json")
+            if not schema_path.exists():
+                msg = f"No json schema found for FDL version: {major}.{minor}"
+                raise FDLError(msg)
+
+            with schema_path.open("rb") as fp:
+                schema = json.load(fp)
+
+            _SCHEMAS[key] = schema
+
+    return schema
+
+
+def get_sub_schema(schema: dict, pointer: str) -> dict:
+    """Get part of a schema as a standalone schema, for instance to validate single contexts
+    of an FDL. References to definitions in the original schema keep working.
+
+    Args:
+        schema: json schema
+        pointer: JSON pointer to the sub schema like: "/properties/contexts/items"
+
+    Returns:
+        schema:
+    """
+    node = schema
+    for part in pointer.split("/")[1:]:
+        node = node[part.replace("~1", "/").replace("~0", "~")]
+
+    sub_schema = {key: schema[key] for key in ("$schema", "$defs") if key in schema}
+    sub_schema.update(node)
+
+    return sub_schema
+
+
+def get_validator(
+    major: int = FDL_SCHEMA_MAJOR, minor: int = FDL_SCHEMA_MINOR, backend: str = "compiled", pointer: str = ""
+) -> Any:
+    """Get a ready to use validator for a schema version.
+    Validators are created once per process and shared between threads and FDL instances.
+
+    The "compiled" backend turns the schema into plain Python checks, which is a lot faster
+    than `jsonschema` for valid documents. Errors in invalid documents are reported by `jsonschema`,
+    so they are the same regardless of backend. If a schema uses features the compiler doesn't
+    support, the "compiled" backend falls back to `jsonschema` for everything.
+
+    Args:
+        major: version of schema
+        minor: version of schema
+        backend: "compiled" or "jsonschema"
+        pointer: JSON pointer to part of the schema like: "/properties/contexts/items". Used to validate
+            parts of an FDL on their own. Defaults to the whole schema
+
+    Raises:
+        FDLError: if the backend is unknown
+
+    Returns:
+        validator:
+    """
+    key = (major, minor, backend, pointer)
+    validator = _VALIDATORS.get(key)
+    if validator is not None:
+        return validator
+
+    if backend not in VALIDATOR_BACKENDS:
+        msg = f"Unknown validator backend: {backend!r}. Please use one of {VALIDATOR_BACKENDS}"
+        raise FDLError(msg)
+
+    schema = get_schema(major, minor)
+    if pointer:
+        schema = get_sub_schema(schema, pointer)
+
+    if backend == "compiled":
+        fallback = get_validator(major, minor, backend="jsonschema", pointer=pointer)
+
+    with _LOCK:
+        validator = _VALIDATORS.get(key)
+        if validator is None:
+            if backend == "compiled":
+                validator = CompiledValidator(schema, fallback)
+            else:
+                validator_cls = jsonschema.validators.validator_for(schema)
+                validator = validator_cls(schema=schema, format_checker=validator_cls.FORMAT_CHECKER)
+
+            _VALIDATORS[key] = validator
+
+    return validator
+
+
+def preload_validators(versions: Optional[Iterable[tuple[int, int]]] = None, backend: str = "compiled") -> None:
+    """Load schemas and create validators up front, for instance at the startup of a service.
+
+    Args:
+        versions: (major, minor) of versions to load. Defaults to all bundled versions
+        backend: "compiled" or "jsonschema"
+    """
+    for major, minor in versions or get_schema_versions():
+        get_validator(major, minor, backend=backend)
+
+
+def clear_validator_cache() -> None:
+    """Clear the cached schemas and validators"""
+    with _LOCK:
+        _SCHEMAS.clear()
+        _VALIDATORS.clear()
+
+
+def json_pointer(path: Iterable[Union[str, int]]) -> str:
+    """
+    Args:
+        path: keys and indexes leading to a value
+
+    Returns:
+        pointer: JSON pointer (RFC 6901) like: "/contexts/0/canvases/1"
+    """
+    return "".join(f"/{str(part).replace('~', '~0').replace('/', '~1')}" for part in path)
+
+
+def iter_schema_issues(validator: Any, instance: Any, path: str = "") -> Iterator[ValidationIssue]:
+    """Validate an instance and yield the errors as they're found
+
+    Args:
+        validator: from [get_validator](fdl.md#pyfdl.get_validator)
+        instance: to validate
+        path: JSON pointer to the instance within the FDL, prepended to the path of each issue
+
+    Returns:
+        issues:
+    """
+    for error in validator.iter_errors(instance):
+        yield ValidationIssue(
+            path=path + json_pointer(error.absolute_path),
+            kind=error.validator,
+            value=error.instance,
+            message=error.message,
+        )
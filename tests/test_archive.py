@@ -0,0 +1,93 @@
+import gzip
+import io
+import lzma
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+
+SAMPLE_FDL_DIR = Path(__file__).parent.joinpath("sample_data")
+SAMPLE_FDL_FILES = sorted(SAMPLE_FDL_DIR.glob("Scenario-9__*.fdl"))
+
+
+@pytest.fixture
+def members():
+    return {
+        "turnover/A001C003.fdl": SAMPLE_FDL_FILES[0].read_bytes(),
+        "turnover/A001C004.fdl.gz": gzip.compress(SAMPLE_FDL_FILES[1].read_bytes()),
+        "turnover/A001C005.fdl.xz": lzma.compress(SAMPLE_FDL_FILES[0].read_bytes()),
+        "turnover/notes.txt": b"Not an FDL",
+        "__MACOSX/turnover/._A001C003.fdl": b"\x00\x05\x16\x07",
+    }
+
+
+@pytest.fixture(params=["zip", "tar", "tar.gz"])
+def archive_path(request, members, tmp_path):
+    path = tmp_path / f"turnover.{request.param}"
+    if request.param == "zip":
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("turnover/", b"")
+            for name, data in members.items():
+                archive.writestr(name, data)
+
+    else:
+        with tarfile.open(path, "w:gz" if request.param.endswith("gz") else "w") as archive:
+            for name, data in members.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+
+    return path
+
+
+def test_archive_members(archive_path, members):
+    expected = ["turnover/A001C003.fdl", "turnover/A001C004.fdl.gz", "turnover/A001C005.fdl.xz"]
+    with pyfdl.FDLArchive(archive_path) as archive:
+        assert archive.names() == expected
+        assert list(archive) == expected
+        assert len(archive) == 3
+        assert "turnover/A001C003.fdl" in archive
+        assert "turnover/notes.txt" not in archive
+
+        assert archive.read_bytes("turnover/A001C003.fdl") == members["turnover/A001C003.fdl"]
+        assert archive.read_bytes("turnover/A001C004.fdl.gz") == SAMPLE_FDL_FILES[1].read_bytes()
+
+        with pytest.raises(pyfdl.FDLError):
+            archive.read("turnover/notes.txt")
+
+
+def test_archive_read(archive_path):
+    expected = [pyfdl.read_from_file(path).to_dict() for path in (*SAMPLE_FDL_FILES, SAMPLE_FDL_FILES[0])]
+    with pyfdl.FDLArchive(archive_path) as archive:
+        # Members are read in any order
+        assert archive["turnover/A001C005.fdl.xz"].to_dict() == expected[2]
+        assert archive.read("turnover/A001C003.fdl", lazy=True, validate=False).to_dict() == expected[0]
+
+        fdls = archive.read_all()
+        assert list(fdls) == archive.names()
+        assert [fdl.to_dict() for fdl in fdls.values()] == expected
+
+
+def test_archive_parallel(archive_path):
+    with pyfdl.FDLArchive(archive_path) as archive:
+        expected = [(name, fdl.to_dict()) for name, fdl in archive.iter_fdls()]
+        fdls = archive.iter_fdls(parallel=True, max_workers=2)
+        assert [(name, fdl.to_dict()) for name, fdl in fdls] == expected
+
+
+def test_archive_errors(tmp_path):
+    with pytest.raises(pyfdl.FDLError):
+        pyfdl.FDLArchive(SAMPLE_FDL_FILES[0])
+
+    path = tmp_path / "broken.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("broken.fdl", b'{"uuid": 1}')
+
+    with pyfdl.FDLArchive(path) as archive:
+        with pytest.raises(pyfdl.FDLValidationError):
+            archive.read_all(parallel=True, max_workers=1)
+
+        assert archive.read("broken.fdl", validate=False).uuid == 1
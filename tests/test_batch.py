@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+
+SAMPLE_FDL_DIR = Path(__file__).parent.joinpath("sample_data")
+SAMPLE_FDL_FILE = SAMPLE_FDL_DIR.joinpath("Scenario-9__OriginalFDL_UsedToMakePlate.fdl")
+
+
+@pytest.fixture(scope="module")
+def batch_validator():
+    with pyfdl.BatchValidator(max_workers=2) as validator:
+        yield validator
+
+
+@pytest.fixture
+def batch_files(tmp_path):
+    raw = json.loads(SAMPLE_FDL_FILE.read_text())
+
+    invalid = dict(raw, uuid="not a uuid")
+    invalid_path = tmp_path.joinpath("invalid.fdl")
+    invalid_path.write_text(json.dumps(invalid))
+
+    broken_path = tmp_path.joinpath("broken.fdl")
+    broken_path.write_text("{not json")
+
+    return [SAMPLE_FDL_FILE, invalid_path, broken_path, SAMPLE_FDL_FILE, tmp_path.joinpath("missing.fdl")]
+
+
+def test_batch_validate_files_ordered(batch_validator, batch_files):
+    results = list(batch_validator.validate_files(batch_files, ordered=True))
+
+    assert [result.index for result in results] == list(range(len(batch_files)))
+    assert [result.valid for result in results] == [True, False, False, True, False]
+    assert results[0].source == str(SAMPLE_FDL_FILE)
+
+    invalid = results[1]
+    assert invalid.exception is None
+    assert [error.path for error in invalid.errors] == ["/uuid"]
+
+    assert results[2].exception.startswith("JSONDecodeError")
+    assert results[4].exception.startswith("FileNotFoundError")
+
+
+def test_batch_validate_files_unordered(batch_validator, batch_files):
+    results = list(batch_validator.validate_files(batch_files * 5))
+    assert sorted(result.index for result in results) == list(range(len(batch_files) * 5))
+
+
+def test_batch_validate_strings_handler_kwargs(batch_validator):
+    raw = json.loads(SAMPLE_FDL_FILE.read_text())
+    invalid = json.dumps(dict(raw, uuid="not a uuid", unknown=1))
+
+    result = next(batch_validator.validate_strings([invalid]))
+    assert result.source == "<string>"
+    assert len(result.errors) > 1
+
+    result = next(batch_validator.validate_strings([invalid], fail_fast=True))
+    assert len(result.errors) == 1
+
+
+def test_validate_files():
+    results = list(pyfdl.validate_files([SAMPLE_FDL_FILE], max_workers=1))
+    assert len(results) == 1
+    assert results[0].valid
+
+
+def test_batch_validate_jsonl_files(batch_validator, tmp_path):
+    line = json.dumps(json.loads(SAMPLE_FDL_FILE.read_text()))
+    valid = tmp_path.joinpath("valid.fdljsonl")
+    valid.write_text(f"{line}\n{line}\n")
+    broken = tmp_path.joinpath("broken.fdljsonl")
+    broken.write_text(f"{line}\n{{not json\n")
+    invalid = tmp_path.joinpath("invalid.fdljsonl")
+    invalid.write_text(f"{line}\n{json.dumps(dict(json.loads(line), uuid='not a uuid'))}\n")
+    missing = tmp_path.joinpath("missing.fdljsonl")
+
+    paths = [valid, broken, invalid, missing]
+    results = list(batch_validator.validate_files(paths, ordered=True))
+    assert [result.valid for result in results] == [True, False, False, False]
+    assert results[1].exception.startswith("JSONDecodeError")
+    assert [error.path for error in results[2].errors] == ["/uuid"]
+    assert results[3].exception.startswith("FileNotFoundError")
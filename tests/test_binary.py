@@ -0,0 +1,117 @@
+import io
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+from pyfdl import binary
+from pyfdl.errors import FDLError
+
+pytest.importorskip("msgpack")
+
+SAMPLE_FDL_FILE = Path(__file__).parent.joinpath("sample_data", "Scenario-9__FDL_DeliveredToVFXVendor.fdl")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, b"\xc0"),
+        (True, b"\xc3"),
+        (False, b"\xc2"),
+        (0, b"\x00"),
+        (127, b"\x7f"),
+        (128, b"\xcc\x80"),
+        (65536, b"\xce\x00\x01\x00\x00"),
+        (2**64 - 1, b"\xcf" + b"\xff" * 8),
+        (-32, b"\xe0"),
+        (-33, b"\xd0\xdf"),
+        (-(2**63), b"\xd3\x80" + b"\x00" * 7),
+        (1.5, b"\xcb\x3f\xf8" + b"\x00" * 6),
+        ("å", b"\xa2\xc3\xa5"),
+        ("a" * 32, b"\xd9\x20" + b"a" * 32),
+        ("a" * 256, b"\xda\x01\x00" + b"a" * 256),
+        ([], b"\x90"),
+        (list(range(16)), b"\xdc\x00\x10" + bytes(range(16))),
+        ({"a": 1}, b"\x81\xa1a\x01"),
+    ],
+)
+def test_pack_msgpack_compatible(value, expected):
+    data = binary.pack(value)
+    assert data == binary.MAGIC + expected
+    assert binary.unpack(data) == value
+
+
+def test_round_trip():
+    data = [
+        {"nested": [{"a": [None, True, False]}, {}], "empty": "", "surrogate": "\ud800", "emoji": "\U0001f3ac"},
+        {str(n): n for n in range(70000)},
+        [-0.0, math.inf, 1e-05, 2**32, -(2**31) - 1, "b" * 70000],
+    ]
+    result = binary.unpack(memoryview(binary.pack(data)))
+    assert repr(result) == repr(data)
+
+
+@pytest.mark.parametrize("value", [2**64, -(2**63) - 1, object(), {"a": {1, 2}}])
+def test_pack_errors(value):
+    with pytest.raises(FDLError):
+        binary.pack(value)
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"\x81\xa1a\x01", "Not a binary FDL"),
+        (binary.MAGIC, "Broken binary FDL"),
+        (binary.MAGIC + b"\x82\xa1a\x01", "Broken binary FDL"),
+        (binary.MAGIC + b"\xa5abc", "Broken binary FDL"),
+        (binary.MAGIC + b"\x01\x02", "Broken binary FDL"),
+        (binary.MAGIC + b"\xc1", "Broken binary FDL"),
+        (binary.MAGIC + b"\x81\x01\x01", "Broken binary FDL"),
+    ],
+)
+def test_unpack_errors(data, message):
+    with pytest.raises(FDLError, match=message):
+        binary.unpack(data)
+
+
+def test_binary_handler(tmp_path):
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    expected = pyfdl.write_to_string(fdl)
+
+    data = pyfdl.write_to_bytes(fdl, handler_name="fdlb")
+    assert len(data) < len(json.dumps(fdl.to_dict(), separators=(",", ":")))
+    assert pyfdl.write_to_string(pyfdl.read_from_bytes(data, handler_name="fdlb")) == expected
+    assert pyfdl.write_to_string(pyfdl.read_from_buffer(memoryview(data), handler_name="fdlb")) == expected
+
+    path = tmp_path / "sample.fdlb"
+    pyfdl.write_to_file(fdl, path)
+    assert path.read_bytes() == data
+    assert pyfdl.write_to_string(pyfdl.read_from_file(path)) == expected
+    assert pyfdl.write_to_string(pyfdl.read_from_file(path, memory_map=True)) == expected
+
+    stream = io.BytesIO()
+    pyfdl.write_to_stream(fdl, stream, handler_name="fdlb")
+    assert stream.getvalue() == data
+
+
+def test_binary_handler_validation():
+    raw = json.loads(SAMPLE_FDL_FILE.read_text())
+    del raw["uuid"]
+    data = binary.pack(raw)
+
+    with pytest.raises(pyfdl.FDLValidationError):
+        pyfdl.read_from_bytes(data, handler_name="fdlb")
+
+    fdl = pyfdl.read_from_bytes(data, handler_name="fdlb", validate=False)
+    assert fdl.uuid is None
+
+
+def test_binary_requires_msgpack(monkeypatch):
+    monkeypatch.setattr(binary, "msgpack", None)
+    with pytest.raises(ImportError, match="msgpack"):
+        binary.pack({})
+
+    with pytest.raises(ImportError, match="msgpack"):
+        binary.unpack(binary.MAGIC)
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+from pyfdl.codegen import map_schema_arrays
+from pyfdl.validators import get_schema
+
+SAMPLE_FDL_FILE = Path(__file__).parent.joinpath("sample_data", "Scenario-9__FDL_DeliveredToVFXVendor.fdl")
+
+
+@pytest.fixture
+def generic_serialization():
+    # Temporarily disable generated functions to compare against the generic implementation
+    classes = [pyfdl.FDL, pyfdl.Context, pyfdl.Canvas, pyfdl.FramingDecision, pyfdl.FramingIntent, pyfdl.Point]
+    stored = {}
+    for cls in classes:
+        fields = cls.get_fields()
+        stored[cls] = (fields.serializer, fields.deserializer)
+        fields.serializer = fields.deserializer = None
+
+    yield
+
+    for cls, (serializer, deserializer) in stored.items():
+        fields = cls.get_fields()
+        fields.serializer, fields.deserializer = serializer, deserializer
+
+
+def test_map_schema_arrays():
+    arrays = map_schema_arrays(pyfdl.FDL, get_schema())
+    assert arrays[pyfdl.FDL] == {"framing_intents": True, "contexts": True, "canvas_templates": True}
+    assert arrays[pyfdl.Canvas]["framing_decisions"] is True
+    assert arrays[pyfdl.Canvas]["dimensions"] is False
+
+
+def test_builtin_classes_are_compiled():
+    for cls in (pyfdl.FDL, pyfdl.Context, pyfdl.Canvas, pyfdl.FramingDecision, pyfdl.CanvasTemplate):
+        assert cls.get_fields().serializer is not None
+        assert cls.get_fields().deserializer is not None
+
+
+def test_generated_round_trip():
+    raw = json.loads(SAMPLE_FDL_FILE.read_text())
+    generated = pyfdl.FDL.from_dict(raw).to_dict()
+    assert generated == raw
+
+
+def test_generic_matches_raw(generic_serialization):
+    raw = json.loads(SAMPLE_FDL_FILE.read_text())
+    assert pyfdl.FDL.from_dict(raw).to_dict() == raw
+
+
+def test_generated_to_dict_missing_required(sample_canvas_obj):
+    sample_canvas_obj.effective_anchor_point = None
+    with pytest.raises(pyfdl.FDLError) as err:
+        sample_canvas_obj.to_dict()
+
+    assert "['effective_anchor_point']" in str(err.value)
+
+
+def test_compile_serializers_subclass(base_subclass, base_class_dict):
+    pyfdl.compile_serializers(classes=[base_subclass])
+    assert base_subclass.get_fields().deserializer is not None
+
+    obj = base_subclass.from_dict(base_class_dict)
+    assert isinstance(obj.collection, pyfdl.TypedCollection)
+    assert obj.to_dict() == base_class_dict
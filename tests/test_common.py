@@ -75,6 +75,30 @@ def test_base_to_dict(base_subclass, base_class_dict):
         obj.to_dict()
 
 
+def test_base_fields_registry(sample_canvas_obj):
+    fields = pyfdl.Canvas.get_fields()
+    assert fields is pyfdl.Canvas.get_fields()
+    assert fields.attributes == tuple(pyfdl.Canvas.attributes)
+    assert ("id", "id_", None) in fields.from_dict_plan
+    assert ("effective_dimensions", "effective_anchor_point") in fields.required_links
+
+    # Metadata lives on the class, not on the instances
+    assert "attributes" not in vars(sample_canvas_obj)
+    assert "object_map" not in vars(sample_canvas_obj)
+
+    # and is read-only
+    with pytest.raises(TypeError):
+        pyfdl.Canvas.defaults["anamorphic_squeeze"] = 2
+
+
+def test_base_fields_registry_legacy_subclass(base_subclass):
+    # Subclasses setting metadata in __init__ are resolved once and cached
+    fields = base_subclass.get_fields()
+    assert fields is base_subclass.get_fields()
+    assert fields.attributes == ("id", "string", "point", "dimensions", "collection", "round")
+    assert fields.kwarg_map == {"id": "id_", "round": "round_"}
+
+
 def test_base_generate_uuid(base_subclass):
     assert isinstance(base_subclass.generate_uuid(), str)
 
@@ -87,6 +111,81 @@ def test_typed_collection_ids(sample_framing_intent_obj):
     assert collection.ids == [sample_framing_intent_obj.id]
 
 
+def test_typed_collection_ids_snapshot():
+    collection = pyfdl.TypedCollection(pyfdl.FramingIntent)
+    for idx in range(3):
+        collection.add(pyfdl.FramingIntent(id_=f"id{idx}"))
+
+    # Ids are a copy, so the collection may be changed while looping over them
+    ids = collection.ids
+    for item_id in collection.ids:
+        collection.remove(item_id)
+
+    assert ids == ["id0", "id1", "id2"]
+    assert collection.ids == []
+
+
+def test_typed_collection_indexing():
+    collection = pyfdl.TypedCollection(pyfdl.FramingIntent)
+    items = [pyfdl.FramingIntent(id_=f"id{idx}") for idx in range(5)]
+    for item in items:
+        collection.add(item)
+
+    assert collection[0] is items[0]
+    assert collection[-1] is items[-1]
+    assert collection[1:3] == items[1:3]
+    assert collection[::2] == items[::2]
+
+    collection.remove("id0")
+    assert collection[0] is items[1]
+    collection.remove("id2")
+    collection.add(items[0])
+    assert collection[:] == [items[1], items[3], items[4], items[0]]
+
+    with pytest.raises(IndexError):
+        collection[10]
+
+
+def test_typed_collection_find(sample_framing_decision_obj):
+    collection = pyfdl.TypedCollection(pyfdl.FramingDecision)
+    fd1 = sample_framing_decision_obj
+    fd2 = pyfdl.FramingDecision(id_="fd2", framing_intent_id=fd1.framing_intent_id)
+    fd3 = pyfdl.FramingDecision(id_="fd3", framing_intent_id="other")
+    for fd in (fd1, fd2, fd3):
+        collection.add(fd)
+
+    assert collection.find("framing_intent_id", fd1.framing_intent_id) == [fd1, fd2]
+    assert collection.find("framing_intent_id", "other") == [fd3]
+    assert collection.find("framing_intent_id", "missing") == []
+
+    # Indexes are built on first use
+    assert list(collection._indexes) == ["framing_intent_id"]
+
+    # Not indexed attributes are found as well
+    assert collection.find("id", "fd2") == [fd2]
+
+    collection.remove(fd1.id)
+    assert collection.find("framing_intent_id", fd2.framing_intent_id) == [fd2]
+
+    # Changes to indexed values after adding require a reindex
+    fd3.framing_intent_id = "changed"
+    assert collection.find("framing_intent_id", "changed") == []
+    collection.reindex()
+    assert collection.find("framing_intent_id", "changed") == [fd3]
+    assert collection.find("framing_intent_id", "other") == []
+
+
+def test_typed_collection_find_nested():
+    collection = pyfdl.TypedCollection(pyfdl.Context)
+    ctx1 = pyfdl.Context(label="ctx1", clip_id=pyfdl.ClipID(clip_name="A001C001"))
+    ctx2 = pyfdl.Context(label="ctx2")
+    collection.add(ctx1)
+    collection.add(ctx2)
+
+    assert collection.find("clip_id.clip_name", "A001C001") == [ctx1]
+    assert collection.find("clip_id.clip_name", None) == []
+
+
 def test_typed_collection_add(sample_framing_intent_obj):
     collection = pyfdl.TypedCollection(pyfdl.FramingIntent)
     framing_intent = sample_framing_intent_obj
@@ -146,6 +245,24 @@ def test_typed_collection_contents(sample_framing_intent_obj):
     assert list(collection) == [framing_intent]
 
 
+def test_lazy_collection(sample_framing_intent_obj):
+    raw = [sample_framing_intent_obj.to_dict()]
+    collection = pyfdl.LazyCollection(pyfdl.FramingIntent, raw)
+    assert isinstance(collection, pyfdl.TypedCollection)
+
+    # Checking truthiness doesn't create items
+    assert collection
+    assert not collection.is_materialized
+
+    assert sample_framing_intent_obj.id in collection
+    assert collection.is_materialized
+    assert collection.to_list() == raw
+
+    empty = pyfdl.LazyCollection(pyfdl.FramingIntent, [])
+    assert not empty
+    assert len(empty) == 0
+
+
 def test_dimensions_to_dict():
     dim_1 = pyfdl.Dimensions(width=1.1, height=2.2, dtype=int)
     assert dim_1.to_dict() == {"width": 1, "height": 2}
@@ -179,6 +296,23 @@ def test_dimensions_copy():
     assert dim_1.dtype == dim_2.dtype
 
 
+def test_dimensions_and_point_are_compact():
+    dim = pyfdl.Dimensions(width=1920, height=1080, dtype=int)
+    point = pyfdl.Point(x=10, y=20)
+
+    assert not hasattr(dim, "__dict__")
+    assert not hasattr(point, "__dict__")
+
+    with pytest.raises(AttributeError):
+        dim.bogus = 1
+
+    assert list(dim) == [1920, 1080]
+    assert dim.to_dict() == {"width": 1920, "height": 1080}
+    assert list(point) == [10, 20]
+    assert point.to_dict() == {"x": 10, "y": 20}
+    assert point == pyfdl.Point(x=10, y=20)
+
+
 @pytest.mark.parametrize(
     ("source_dim", "compare_dim", "expected"),
     [
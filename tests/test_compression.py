@@ -0,0 +1,65 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+from pyfdl.compression import COMPRESSIONS, detect_compression
+
+SAMPLE_FDL_FILE = Path(__file__).parent.joinpath("sample_data", "Scenario-9__FDL_DeliveredToVFXVendor.fdl")
+
+
+@pytest.mark.parametrize("suffix", list(COMPRESSIONS))
+def test_compressed_round_trip(suffix, tmp_path):
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    path = tmp_path / f"shot.fdl{suffix}"
+    pyfdl.write_to_file(fdl, path)
+
+    with path.open("rb") as fp:
+        assert detect_compression(fp) == COMPRESSIONS[suffix]
+        assert fp.tell() == 0
+
+    assert path.stat().st_size < SAMPLE_FDL_FILE.stat().st_size
+    assert pyfdl.read_from_file(path).to_dict() == fdl.to_dict()
+    assert pyfdl.read_from_file(path, stream=True).to_dict() == fdl.to_dict()
+    assert pyfdl.read_from_file(path, memory_map=True).to_dict() == fdl.to_dict()
+    assert [context.to_dict() for context in pyfdl.iter_contexts(path)] == [
+        context.to_dict() for context in fdl.contexts
+    ]
+
+
+def test_compression_level(tmp_path):
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    fast = tmp_path / "fast.fdl.gz"
+    small = tmp_path / "small.fdl.gz"
+    pyfdl.write_to_file(fdl, fast, compression_level=0)
+    pyfdl.write_to_file(fdl, small, compression_level=9)
+
+    assert small.stat().st_size < fast.stat().st_size
+    assert json.loads(gzip.decompress(fast.read_bytes())) == fdl.to_dict()
+
+    # The same FDL always compresses to the same bytes
+    pyfdl.write_to_file(fdl, fast, compression_level=9)
+    assert fast.read_bytes() == small.read_bytes()
+
+    with pytest.raises(pyfdl.FDLError):
+        pyfdl.write_to_file(fdl, fast, compression_level=10)
+
+    with pytest.raises(pyfdl.FDLError):
+        pyfdl.write_to_file(fdl, tmp_path / "shot.fdl.bz2", compression_level=0)
+
+
+def test_compression_detected_from_data(tmp_path):
+    # Compressed data is recognized even without a matching suffix
+    path = tmp_path / "shot.fdl"
+    path.write_bytes(gzip.compress(SAMPLE_FDL_FILE.read_bytes()))
+    assert pyfdl.read_from_file(path).to_dict() == json.loads(SAMPLE_FDL_FILE.read_text())
+
+    # Files without a compression suffix are written as plain json
+    plain = tmp_path / "plain.fdl"
+    pyfdl.write_to_file(pyfdl.read_from_file(SAMPLE_FDL_FILE), plain, compression_level=9)
+    with plain.open("rb") as fp:
+        assert detect_compression(fp) is None
+
+    assert json.loads(plain.read_text()) == json.loads(SAMPLE_FDL_FILE.read_text())
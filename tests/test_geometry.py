@@ -0,0 +1,91 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+
+np = pytest.importorskip("numpy")
+
+SAMPLE_FDL_FILE = Path(__file__).parent.joinpath("sample_data", "Scenario-9__FDL_DeliveredToVFXVendor.fdl")
+
+
+@pytest.fixture
+def sample_fdl():
+    return pyfdl.read_from_file(SAMPLE_FDL_FILE)
+
+
+def test_geometry_store_collects_geometry(sample_fdl):
+    expected = sample_fdl.to_dict()
+    store = pyfdl.GeometryStore([sample_fdl])
+
+    n_canvases = sum(len(context.canvases) for context in sample_fdl.contexts)
+    assert store.canvas_array("dimensions").shape == (n_canvases, 2)
+    assert len(store.framing_decision_canvas) == len(store.framing_decisions)
+
+    # Binding the objects to the store doesn't change their values
+    assert sample_fdl.to_dict() == expected
+
+
+def test_geometry_store_read_through(sample_fdl):
+    store = pyfdl.GeometryStore([sample_fdl])
+    canvas = store.canvases[0]
+    row = store.canvas_index(canvas)
+
+    assert isinstance(canvas.dimensions, pyfdl.Dimensions)
+    assert canvas.dimensions.dtype is int
+    assert canvas.dimensions.width == store.canvas_array("dimensions")[row, 0]
+
+    # Writing through the object updates the array and vice versa
+    canvas.dimensions.width = 1234
+    assert store.canvas_array("dimensions")[row, 0] == 1234
+
+    store.canvas_array("dimensions")[row, 1] = 567
+    assert canvas.dimensions.height == 567
+
+
+def test_geometry_store_missing_values(sample_canvas_obj, sample_framing_decision_obj):
+    fdl = pyfdl.FDL()
+    sample_framing_decision_obj.protection_dimensions = None
+    sample_framing_decision_obj.protection_anchor_point = None
+    sample_canvas_obj.framing_decisions.add(sample_framing_decision_obj)
+    fdl.place_canvas_in_context("context", sample_canvas_obj)
+
+    store = pyfdl.GeometryStore([fdl])
+    assert sample_framing_decision_obj.protection_dimensions is None
+    assert np.isnan(store.framing_decision_array("protection_dimensions")).all()
+
+
+def test_geometry_store_vectorized_checks(sample_fdl):
+    store = pyfdl.GeometryStore([sample_fdl])
+    ratios = store.framing_decision_aspect_ratios()
+    for ratio, framing_decision in zip(ratios, store.framing_decisions):
+        assert ratio == pytest.approx(framing_decision.dimensions.width / framing_decision.dimensions.height)
+
+    assert store.framing_decisions_inside_canvas().all()
+
+    framing_decision = store.framing_decisions[0]
+    framing_decision.anchor_point.x = -1
+    assert not store.framing_decisions_inside_canvas()[store.framing_decision_index(framing_decision)]
+
+
+def test_geometry_store_invalidate(sample_fdl):
+    store = pyfdl.GeometryStore([sample_fdl])
+    sample_fdl.to_dict()
+
+    store.canvas_array("dimensions")[0, 0] = 1234
+    store.invalidate()
+    assert sample_fdl.to_dict()["contexts"][0]["canvases"][0]["dimensions"]["width"] == 1234
+
+
+def test_geometry_store_pickle(sample_fdl):
+    store = pyfdl.GeometryStore([sample_fdl])
+    fdl_copy = pickle.loads(pickle.dumps(sample_fdl))
+
+    # Bound values are pickled as plain values, detached from the arrays
+    dimensions = fdl_copy.contexts[0].canvases[0].dimensions
+    assert type(dimensions) is pyfdl.Dimensions
+    assert fdl_copy.to_dict() == sample_fdl.to_dict()
+
+    dimensions.width = 1234
+    assert store.canvas_array("dimensions")[0, 0] != 1234
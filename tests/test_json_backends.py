@@ -0,0 +1,128 @@
+import io
+import json
+import mmap
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+from pyfdl.errors import FDLError
+from pyfdl.handlers import fdl_handler
+from pyfdl.json_backends import _AVAILABLE, JSON_BACKENDS
+from pyfdl.streaming import DEFAULT_CHUNK_SIZE
+
+SAMPLE_FDL_FILE = Path(__file__).parent.joinpath("sample_data", "Scenario-9__FDL_DeliveredToVFXVendor.fdl")
+
+BACKENDS = [
+    pytest.param(name, marks=pytest.mark.skipif(not _AVAILABLE[name], reason=f"{name} is not installed"))
+    for name in JSON_BACKENDS
+]
+
+EDGE_CASES = [
+    {"small": 1e-05, "smaller": 1.5e-10, "large": 1e16, "list": [1e-07, 2e20, -3.5e-05]},
+    {"label": "Fråming — \U0001f3ac", "path": "a/b\\c", "quote": '"'},
+    {"control": "tab\tdel\x7fnul\x00", "del": "\x7f"},
+    {"int": 12345678901234567890123, "negative": -9223372036854775809, "floats": [0.1, 1.0, -0.0]},
+    {"nested": [[], {}, [{}], {"a": [None, True, False]}], "empty": ""},
+    {"numbers_in_strings": ["1e5", " 1e5", "0.00001"]},
+]
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+@pytest.mark.parametrize("data", EDGE_CASES)
+@pytest.mark.parametrize("indent", [2, 4, None])
+def test_backend_matches_stdlib(name, data, indent):
+    backend = pyfdl.get_json_backend(name)
+    expected = json.dumps(data, indent=indent)
+
+    assert backend.dumps(data, indent=indent) == expected
+    assert backend.loads(expected) == data
+    assert backend.loads(expected.encode()) == data
+
+    text = io.StringIO()
+    binary = io.BytesIO()
+    backend.dump(data, text, indent=indent)
+    backend.dump(data, binary, indent=indent)
+    assert text.getvalue() == expected
+    assert binary.getvalue() == expected.encode()
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backend_errors(name):
+    backend = pyfdl.get_json_backend(name)
+    assert backend.name == name
+
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads('{"broken": ')
+
+    with pytest.raises(TypeError):
+        backend.dumps({"not json": object()})
+
+
+def test_get_json_backend():
+    assert pyfdl.get_json_backend().name == next(name for name in JSON_BACKENDS if _AVAILABLE[name])
+    assert pyfdl.get_json_backend("stdlib") is pyfdl.get_json_backend("stdlib")
+
+    with pytest.raises(FDLError):
+        pyfdl.get_json_backend("simplejson")
+
+
+def test_handler_writes_stream_with_stdlib(monkeypatch, tmp_path):
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    expected = pyfdl.write_to_string(fdl, json_backend="stdlib")
+
+    # Files and streams are written while encoding, unless a backend is asked for
+    def get_json_backend(name=None):
+        raise AssertionError(name)
+
+    monkeypatch.setattr(fdl_handler, "get_json_backend", get_json_backend)
+    path = tmp_path / "out.fdl"
+    pyfdl.write_to_file(fdl, path)
+    assert path.read_text() == expected
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_handler_json_backend(name, tmp_path):
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE, json_backend=name)
+    expected = pyfdl.write_to_string(fdl, json_backend="stdlib")
+    assert fdl.to_dict() == json.loads(SAMPLE_FDL_FILE.read_text())
+    assert pyfdl.write_to_string(fdl, json_backend=name) == expected
+    assert pyfdl.read_from_string(expected, json_backend=name).to_dict() == fdl.to_dict()
+
+    path = tmp_path / "out.fdl"
+    pyfdl.write_to_file(fdl, path, json_backend=name)
+    assert path.read_text() == expected
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_loads_buffers(name):
+    backend = pyfdl.get_json_backend(name)
+    data = {"label": "Fråming", "int": 12345678901234567890123, "float": 1e-05}
+    encoded = json.dumps(data).encode()
+
+    assert backend.loads(bytearray(encoded)) == data
+    assert backend.loads(memoryview(encoded)) == data
+    assert backend.loads(b"\xef\xbb\xbf" + encoded) == data
+    assert backend.loads(json.dumps(data).encode("utf-16")) == data
+
+    # Large integers crossing the boundary of the chunks they are looked for in
+    padded = b'{"pad": "' + b" " * (DEFAULT_CHUNK_SIZE - 20) + b'", "int": 12345678901234567890123}'
+    assert backend.loads(memoryview(padded))["int"] == 12345678901234567890123
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_read_from_buffer(name, tmp_path):
+    expected = json.loads(SAMPLE_FDL_FILE.read_text())
+    data = SAMPLE_FDL_FILE.read_bytes()
+
+    assert pyfdl.read_from_bytes(data, json_backend=name).to_dict() == expected
+    assert pyfdl.read_from_buffer(memoryview(data), json_backend=name).to_dict() == expected
+    assert pyfdl.read_from_file(SAMPLE_FDL_FILE, memory_map=True, json_backend=name).to_dict() == expected
+
+    with SAMPLE_FDL_FILE.open("rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        assert pyfdl.read_from_buffer(buffer, json_backend=name).to_dict() == expected
+
+    empty = tmp_path / "empty.fdl"
+    empty.touch()
+    with pytest.raises(json.JSONDecodeError):
+        pyfdl.read_from_file(empty, memory_map=True, json_backend=name)
@@ -0,0 +1,70 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+from pyfdl.handlers import get_handler
+
+SAMPLE_FDL_DIR = Path(__file__).parent.joinpath("sample_data")
+SAMPLE_FDL_FILES = sorted(SAMPLE_FDL_DIR.glob("Scenario-9__*.fdl"))
+
+
+@pytest.fixture
+def sample_fdls():
+    return [pyfdl.read_from_file(path) for path in SAMPLE_FDL_FILES]
+
+
+def test_jsonl_write_and_append(sample_fdls, tmp_path):
+    path = tmp_path / "shots.fdljsonl"
+    pyfdl.write_to_file(sample_fdls[0], path)
+    pyfdl.write_to_file(iter(sample_fdls[1:]), path)
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == len(sample_fdls)
+    assert [json.loads(line) for line in lines] == [fdl.to_dict() for fdl in sample_fdls]
+
+    fdls = pyfdl.read_from_file(path)
+    assert not isinstance(fdls, list)
+    assert [fdl.to_dict() for fdl in fdls] == [fdl.to_dict() for fdl in sample_fdls]
+
+    pyfdl.write_to_file(sample_fdls[0], path, append=False)
+    assert len(path.read_text().splitlines()) == 1
+
+
+def test_jsonl_string_and_streams(sample_fdls):
+    s = pyfdl.write_to_string(sample_fdls, handler_name="fdljsonl")
+    assert s.count("\n") == len(sample_fdls)
+
+    # Empty lines are skipped, and only line feeds separate documents
+    s = s.replace("ASC FDL", "ASC\u2028FDL")
+    fdls = list(pyfdl.read_from_string(f"\n{s}\n  \n", handler_name="fdljsonl"))
+    assert [fdl.uuid for fdl in fdls] == [fdl.uuid for fdl in sample_fdls]
+    assert fdls[0].fdl_creator == "ASC\u2028FDL Committee"
+
+    handler = get_handler(func_name="read_from_stream", handler_name="fdljsonl")
+    for stream in (io.StringIO(), io.BytesIO()):
+        pyfdl.write_to_stream(sample_fdls, stream, handler_name="fdljsonl")
+        stream.seek(0)
+        assert [fdl.uuid for fdl in handler.read_from_stream(stream)] == [fdl.uuid for fdl in sample_fdls]
+
+
+def test_jsonl_validation(sample_fdls):
+    raw = sample_fdls[1].to_dict().copy()
+    del raw["uuid"]
+    s = pyfdl.write_to_string(sample_fdls[0], handler_name="fdljsonl") + json.dumps(raw) + "\n"
+
+    fdls = pyfdl.read_from_string(s, handler_name="fdljsonl")
+    assert next(fdls).uuid == sample_fdls[0].uuid
+    with pytest.raises(pyfdl.FDLValidationError):
+        next(fdls)
+
+    fdls = list(pyfdl.read_from_string(s, handler_name="fdljsonl", validate=False))
+    assert fdls[1].uuid is None
+
+
+def test_jsonl_missing_file(tmp_path):
+    # Reported when reading starts, not when the FDLs are iterated
+    with pytest.raises(FileNotFoundError):
+        pyfdl.read_from_file(tmp_path / "missing.fdljsonl")
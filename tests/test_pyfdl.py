@@ -1,4 +1,6 @@
+import copy
 import json
+import pickle
 from pathlib import Path
 
 import pytest
@@ -28,6 +30,41 @@ def test_read_from_string():
     assert fdl.to_dict() == json.loads(raw)
 
 
+def test_read_from_string_validates_raw():
+    raw = SAMPLE_FDL_FILE.read_text()
+    fdl = pyfdl.read_from_string(raw)
+
+    # The parsed json is validated, so the FDL is not serialized on read
+    assert fdl.is_dirty
+
+    # Keys dropped when creating objects are still caught
+    data = json.loads(raw)
+    data["contexts"][0]["canvases"][0]["unknown"] = 1
+    with pytest.raises(pyfdl.FDLValidationError):
+        pyfdl.read_from_string(json.dumps(data))
+
+
+def test_read_from_string_lazy():
+    raw = SAMPLE_FDL_FILE.read_text()
+    fdl = pyfdl.read_from_string(raw, validate=False, lazy=True)
+
+    assert isinstance(fdl.contexts, pyfdl.LazyCollection)
+    assert not fdl.contexts.is_materialized
+    assert fdl.contexts
+
+    context = fdl.contexts[0]
+    assert fdl.contexts.is_materialized
+    assert isinstance(context, pyfdl.Context)
+    assert not context.canvases.is_materialized
+
+    assert fdl.to_dict() == json.loads(raw)
+
+
+def test_read_from_file_lazy_validated():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE, validate=True, lazy=True)
+    assert isinstance(fdl.contexts, pyfdl.LazyCollection)
+
+
 def test_write_to_file(tmp_path):
     my_path = Path(tmp_path, "myfdl.fdl")
     fdl1 = pyfdl.read_from_file(SAMPLE_FDL_FILE)
@@ -45,6 +82,189 @@ def test_write_to_string():
     assert json.loads(pyfdl.write_to_string(fdl)) == json.loads(raw)
 
 
+def test_copy_fdl():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    fdl_copy = fdl.copy()
+
+    assert fdl_copy is not fdl
+    assert fdl_copy.to_dict() == fdl.to_dict()
+
+    canvas = fdl.contexts[0].canvases[0]
+    canvas_copy = fdl_copy.contexts[0].canvases[0]
+    assert canvas_copy is not canvas
+    assert canvas_copy.dimensions is not canvas.dimensions
+
+    canvas_copy.dimensions.width = 1
+    assert canvas.dimensions.width != 1
+    assert fdl_copy.version is not fdl.version
+
+
+def test_copy_fdl_values_independent():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    fdl_copy = fdl.copy()
+
+    # Values modified in place only change the copy
+    framing_decision = fdl.contexts[0].canvases[0].framing_decisions[0]
+    framing_decision_copy = fdl_copy.contexts[0].canvases[0].framing_decisions[0]
+    framing_decision_copy.dimensions.scale_by(0.5)
+    framing_decision_copy.anchor_point.x = 1
+    assert framing_decision.dimensions != framing_decision_copy.dimensions
+    assert framing_decision.anchor_point.x != 1
+    assert fdl.to_dict() == json.loads(SAMPLE_FDL_FILE.read_text())
+
+
+def test_deepcopy_fdl():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE, lazy=True, validate=False)
+    fdl_copy = copy.deepcopy(fdl)
+    assert fdl_copy.to_dict() == fdl.to_dict()
+
+
+def test_to_dict_cache():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE, validate=False)
+    assert fdl.is_dirty
+
+    data = fdl.to_dict()
+    assert not fdl.is_dirty
+    assert fdl.to_dict() is data
+
+    # Changing an attribute deep down marks the whole chain as dirty
+    canvas = fdl.contexts[0].canvases[0]
+    framing_decision = canvas.framing_decisions[0]
+    framing_decision.dimensions.width = 10
+    assert framing_decision.is_dirty
+    assert canvas.is_dirty
+    assert fdl.is_dirty
+    assert fdl.to_dict()["contexts"][0]["canvases"][0]["framing_decisions"][0]["dimensions"]["width"] == 10
+
+    # Unchanged siblings keep their cache
+    canvas.label = "new label"
+    assert not framing_decision.is_dirty
+    assert fdl.to_dict()["contexts"][0]["canvases"][0]["label"] == "new label"
+
+    # Changes to collections are picked up as well
+    canvas.framing_decisions.remove(framing_decision.id)
+    assert fdl.is_dirty
+    assert fdl.to_dict()["contexts"][0]["canvases"][0]["framing_decisions"] == []
+
+
+def test_to_dict_cache_shared_values():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    fdl_copy = fdl.copy()
+    fdl_copy.contexts[0].canvases[0].dimensions = fdl.contexts[0].canvases[0].dimensions
+    fdl.to_dict()
+    fdl_copy.to_dict()
+
+    # Both owners of a shared value are notified
+    fdl.contexts[0].canvases[0].dimensions.width = 5
+    assert fdl.is_dirty
+    assert fdl_copy.is_dirty
+
+
+def test_to_dict_cache_new_values():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE, validate=False)
+    canvas = fdl.contexts[0].canvases[0]
+
+    # Nothing is tracked until a cache is filled
+    assert canvas.dimensions._parent is None
+    fdl.to_dict()
+    assert canvas.dimensions._parent() is canvas
+
+    # Values set after that are adopted as they come in
+    dimensions = pyfdl.Dimensions(width=10, height=10)
+    canvas.dimensions = dimensions
+    fdl.to_dict()
+    dimensions.width = 20
+    assert fdl.is_dirty
+    assert fdl.to_dict()["contexts"][0]["canvases"][0]["dimensions"]["width"] == 20
+
+    framing_decision = canvas.framing_decisions[0]
+    canvas.framing_decisions.remove(framing_decision.id)
+    framing_decision = pyfdl.FramingDecision(
+        id_=framing_decision.id,
+        framing_intent_id=framing_decision.framing_intent_id,
+        dimensions=pyfdl.Dimensions(width=10, height=10),
+        anchor_point=pyfdl.Point(x=0, y=0),
+    )
+    canvas.framing_decisions.add(framing_decision)
+    fdl.to_dict()
+    framing_decision.anchor_point.x = 1
+    assert fdl.is_dirty
+
+
+def test_pickle_fdl():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    fdl.to_dict()
+    fdl_copy = pickle.loads(pickle.dumps(fdl))
+    assert fdl_copy.to_dict() == fdl.to_dict()
+
+
+def test_pickle_compact_state():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    canvases = [canvas for context in fdl.contexts for canvas in context.canvases]
+
+    # Objects with the same layout share the names of their attributes
+    assert canvases[0].__getstate__()[0] is canvases[1].__getstate__()[0]
+
+    data = pickle.dumps(fdl)
+    assert data.count(b"effective_anchor_point") == 1
+    assert b"_dict_cache" not in data
+    assert b"_indexes" not in data
+
+    fdl_copy = pickle.loads(data)
+    assert fdl_copy.to_dict() == fdl.to_dict()
+    canvas = fdl_copy.contexts[0].canvases[0]
+    assert canvas.dimensions == canvases[0].dimensions
+    assert canvas.dimensions.dtype is int
+    assert fdl_copy.contexts[0].canvases.find("label", canvas.label) == [canvas]
+
+    # Changes are still tracked in the restored objects
+    fdl_copy.to_dict()
+    canvas.dimensions.width = 5
+    assert fdl_copy.is_dirty
+
+
+def test_pickle_size():
+    # Many contexts of the same layout, where sharing attribute names pays off
+    raw = pyfdl.read_from_file(SAMPLE_FDL_FILE).to_dict()
+    contexts = [dict(raw["contexts"][0], label=f"context {index}") for index in range(200)]
+    fdl = pyfdl.FDL.from_dict(dict(raw, contexts=contexts))
+
+    # Pickling the objects' full __dict__ took over twice the size of the plain json data
+    size = len(pickle.dumps(fdl, protocol=5))
+    assert size < len(pickle.dumps(fdl.to_dict(), protocol=5)) * 1.5
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    [
+        "sample_framing_intent_obj",
+        "sample_framing_decision_obj",
+        "sample_canvas_obj",
+        "sample_context_obj",
+        "sample_canvas_template_obj",
+        "sample_dimensions_float",
+        "sample_dimensions_int",
+    ],
+)
+def test_pickle_classes(fixture, request):
+    obj = request.getfixturevalue(fixture)
+    obj_copy = pickle.loads(pickle.dumps(obj))
+    assert type(obj_copy) is type(obj)
+    assert obj_copy.to_dict() == obj.to_dict()
+
+
+def test_pickle_lazy_and_legacy_state():
+    fdl = pyfdl.read_from_string(SAMPLE_FDL_FILE.read_text(), lazy=True, validate=False)
+    fdl_copy = pickle.loads(pickle.dumps(fdl))
+    assert not fdl_copy.contexts.is_materialized
+    assert fdl_copy.to_dict() == fdl.to_dict()
+
+    # State of objects pickled by earlier versions
+    clip_id = pyfdl.ClipID.__new__(pyfdl.ClipID)
+    clip_id.__setstate__({"clip_name": "A001", "_file": "A001.mov", "_sequence": None})
+    assert clip_id.to_dict() == {"clip_name": "A001", "file": "A001.mov"}
+
+
 def test_init_empty_fdl():
     fdl = pyfdl.FDL()
     assert isinstance(fdl, pyfdl.FDL)
@@ -126,3 +346,82 @@ def test_validate_missing_source_canvas_id(sample_canvas_obj):
     sample_canvas_obj.source_canvas_id = "shouldnotbethere"
     with pytest.raises(pyfdl.FDLValidationError):
         fdl.validate()
+
+
+def test_validate_incremental_relations():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    fdl.validate()
+
+    context = fdl.contexts[0]
+    canvas = context.canvases[0]
+    framing_decision = canvas.framing_decisions[0]
+    assert context._relations_cache is not None
+
+    # Changes deep down are picked up
+    framing_decision.framing_intent_id = "unknown"
+    assert context._relations_cache is None
+    with pytest.raises(pyfdl.FDLValidationError, match="unknown"):
+        fdl.validate()
+
+    framing_decision.framing_intent_id = fdl.framing_intents[0].id
+    fdl.validate()
+
+    # As are changes to collections
+    new_canvas = canvas.copy()
+    new_canvas.id = "NEWCANVAS"
+    new_canvas.source_canvas_id = "shouldnotbethere"
+    context.canvases.add(new_canvas)
+    with pytest.raises(pyfdl.FDLValidationError, match="shouldnotbethere"):
+        fdl.validate()
+
+    context.canvases.remove(new_canvas.id)
+    fdl.validate()
+
+    fdl.framing_intents = pyfdl.TypedCollection(pyfdl.FramingIntent)
+    with pytest.raises(pyfdl.FDLValidationError):
+        fdl.validate()
+
+
+def test_validate_duplicate_canvas_across_contexts():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    fdl.validate()
+
+    canvas = fdl.contexts[0].canvases[0]
+    context = pyfdl.Context(label="other")
+    context.canvases.add(canvas.copy())
+    fdl.contexts.add(context)
+    with pytest.raises(pyfdl.FDLError, match="already exists"):
+        fdl.validate()
+
+
+def test_validation_errors_structured():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    assert fdl.validation_errors() == []
+
+    canvas = fdl.contexts[0].canvases[0]
+    canvas.source_canvas_id = "shouldnotbethere"
+    fdl.uuid = "not a uuid"
+    canvas.dimensions.width = 0
+
+    errors = fdl.validation_errors()
+    assert len(errors) > 2
+    assert isinstance(errors[0], pyfdl.ValidationIssue)
+    assert errors[0].path == "/contexts/0/canvases/0/source_canvas_id"
+    assert errors[0].kind == "source_canvas_id"
+    assert errors[0].value == "shouldnotbethere"
+    assert errors[1].path == "/uuid"
+    assert errors[-1].path == "/contexts/0/canvases/0/dimensions/width"
+
+    assert fdl.validation_errors(fail_fast=True) == errors[:1]
+    assert fdl.validation_errors(max_errors=2) == errors[:2]
+
+    with pytest.raises(pyfdl.FDLValidationError) as err:
+        fdl.validate(max_errors=2)
+
+    assert err.value.errors == errors[:2]
+    assert "/dimensions/width" not in str(err.value)
+
+    # Zero or fewer errors would let invalid FDLs pass
+    for max_errors in (0, -1):
+        with pytest.raises(ValueError):
+            fdl.validate(max_errors=max_errors)
@@ -3,7 +3,9 @@ import pytest
 
 import pyfdl.plugins.registry
 from pyfdl.errors import UnknownHandlerError
+from pyfdl.handlers.binary_handler import BinaryFDLHandler
 from pyfdl.handlers.fdl_handler import FDLHandler
+from pyfdl.handlers.jsonl_handler import JSONLinesHandler
 from pyfdl.plugins import get_registry
 
 
@@ -28,6 +30,8 @@ def test_loading_registry():
 def test_load_builtin():
     _registry = get_registry()
     assert isinstance(_registry.handlers["fdl"], FDLHandler)
+    assert isinstance(_registry.handlers["fdlb"], BinaryFDLHandler)
+    assert isinstance(_registry.handlers["fdljsonl"], JSONLinesHandler)
 
 
 def test_load_plugin(capsys, install_plugins):  # noqa
@@ -83,3 +87,14 @@ def test_get_handler_by_suffix(simple_handler):
 
     with pytest.raises(UnknownHandlerError):
         _r.get_handler_by_suffix(suffix="bogus", func_name="bogus")
+
+
+def test_get_handler_by_compound_suffix():
+    _r = get_registry(reload=True)
+
+    assert isinstance(_r.get_handler_by_suffix(suffix=".fdl.gz", func_name="read_from_file"), FDLHandler)
+    assert isinstance(_r.get_handler_by_suffix(suffix=".v2.fdl.xz", func_name="read_from_file"), FDLHandler)
+    assert isinstance(_r.get_handler_by_suffix(suffix=".v2.fdl", func_name="read_from_file"), FDLHandler)
+
+    with pytest.raises(UnknownHandlerError):
+        _r.get_handler_by_suffix(suffix=".fdl.zip", func_name="read_from_file")
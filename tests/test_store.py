@@ -0,0 +1,158 @@
+import copy
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+
+SAMPLE_FDL_DIR = Path(__file__).parent.joinpath("sample_data")
+SAMPLE_FDL_FILES = sorted(SAMPLE_FDL_DIR.glob("Scenario-9__*.fdl"))
+
+
+@pytest.fixture
+def sample_fdls():
+    return [pyfdl.read_from_file(path) for path in SAMPLE_FDL_FILES]
+
+
+@pytest.fixture
+def scope_fdl(sample_fdls):
+    # A 2.39 framing intent used by a framing decision with protection on a named clip
+    raw = copy.deepcopy(sample_fdls[0].to_dict())
+    raw["uuid"] = pyfdl.Base.generate_uuid()
+    raw["version"] = pyfdl.FDL_SCHEMA_VERSION
+    raw["framing_intents"].append({"id": "SCOPE", "aspect_ratio": {"width": 239, "height": 100}, "protection": 0.05})
+    context = raw["contexts"][0]
+    context["clip_id"] = {"clip_name": "A001C003", "file": "A001C003.mxf"}
+    canvas = context["canvases"][0]
+    decision = copy.deepcopy(canvas["framing_decisions"][0])
+    decision.update(id=f"{canvas['id']}-SCOPE", framing_intent_id="SCOPE")
+    canvas["framing_decisions"].append(decision)
+
+    return pyfdl.FDL.from_dict(raw)
+
+
+def test_store_round_trip(sample_fdls, scope_fdl, tmp_path):
+    path = tmp_path / "fdls.db"
+    with pyfdl.FDLStore(path) as store:
+        store.add_many([*sample_fdls, scope_fdl])
+        assert len(store) == 3
+        assert store.uuids() == [fdl.uuid for fdl in [*sample_fdls, scope_fdl]]
+
+    # Values are stored as is, so ints stay ints and floats stay floats
+    with pyfdl.FDLStore(path) as store:
+        for fdl in [*sample_fdls, scope_fdl]:
+            assert fdl.uuid in store
+            assert store.get(fdl.uuid).to_dict() == fdl.to_dict()
+
+        assert [fdl.to_dict() for fdl in store.find_fdls()] == [
+            fdl.to_dict() for fdl in [*sample_fdls, scope_fdl]
+        ]
+        assert store.get("missing") is None
+
+
+def test_store_booleans(sample_fdls):
+    store = pyfdl.FDLStore()
+    fdl = sample_fdls[0]
+    canvas_template = fdl.canvas_templates[0]
+    canvas_template.maximum_dimensions = pyfdl.Dimensions(width=4096, height=2304)
+    canvas_template.pad_to_maximum = True
+    store.add(fdl)
+
+    stored = store.get(fdl.uuid)
+    assert stored.canvas_templates[0].pad_to_maximum is True
+    assert stored.to_dict() == fdl.to_dict()
+    stored.validate()
+
+
+def test_store_replace_and_remove(sample_fdls):
+    store = pyfdl.FDLStore()
+    store.add_many(sample_fdls)
+
+    fdl = sample_fdls[0]
+    fdl.fdl_creator = "Replaced"
+    fdl.contexts.remove(fdl.contexts[0].label)
+    store.add(fdl)
+    assert len(store) == 2
+    assert store.get(fdl.uuid).to_dict() == fdl.to_dict()
+
+    store.remove(fdl.uuid)
+    store.remove(fdl.uuid)
+    assert fdl.uuid not in store
+    assert store.uuids() == [sample_fdls[1].uuid]
+
+    for table in ("framing_intents", "contexts", "canvases", "framing_decisions", "canvas_templates"):
+        query = f"SELECT COUNT(*) FROM {table} JOIN fdls USING (fdl_key) WHERE uuid = ?"
+        assert store.connection.execute(query, (fdl.uuid,)).fetchone() == (0,)
+
+
+def test_store_validation(sample_fdls):
+    store = pyfdl.FDLStore()
+    fdl = sample_fdls[0]
+    fdl.contexts[0].canvases[0].framing_decisions[0].framing_intent_id = "bad id"
+
+    with pytest.raises(pyfdl.FDLValidationError):
+        store.add_many([sample_fdls[1], fdl])
+
+    # Nothing is stored when one of them fails
+    assert len(store) == 0
+
+    store.add(fdl, validate=False)
+    assert fdl.uuid in store
+
+
+def test_store_find(sample_fdls, scope_fdl):
+    store = pyfdl.FDLStore()
+    store.add_many([*sample_fdls, scope_fdl])
+
+    # Which clips are framed for 2.39 with protection
+    contexts = store.find_contexts(aspect_ratio=2.39, has_protection=True)
+    assert [context.clip_id.clip_name for context in contexts] == ["A001C003"]
+    assert contexts[0].to_dict() == scope_fdl.contexts[0].to_dict()
+
+    decisions = store.find_framing_decisions(aspect_ratio=(239, 100))
+    assert [decision.framing_intent_id for decision in decisions] == ["SCOPE"]
+    assert store.find_framing_decisions(aspect_ratio=(2.39, 1)) == []
+    expected = [
+        decision.id
+        for fdl in [*sample_fdls, scope_fdl]
+        for context in fdl.contexts
+        for canvas in context.canvases
+        for decision in canvas.framing_decisions
+        if decision.framing_intent_id == "FDLSMP03"
+    ]
+    decisions = store.find_framing_decisions(framing_intent_id="FDLSMP03", has_protection=True)
+    assert [decision.id for decision in decisions] == expected
+    assert store.find_framing_decisions(has_protection=False) == []
+
+    canvas = sample_fdls[0].contexts[0].canvases[0]
+    canvases = store.find_canvases(canvas_id=canvas.id)
+    assert len(canvases) == len(store.find_fdls(canvas_id=canvas.id)) > 1
+    assert canvases[0].to_dict() == canvas.to_dict()
+    assert len(store.find_canvases(canvas_dimensions=canvas.dimensions)) == len(canvases)
+    assert len(store.find_canvases(canvas_dimensions=(canvas.dimensions.width, 1))) == 0
+    assert len(store.find_canvases(source_canvas_id=canvas.source_canvas_id)) >= 2
+
+    fdls = store.find_fdls(clip_name="A001C003")
+    assert [fdl.uuid for fdl in fdls] == [scope_fdl.uuid]
+    assert store.find_fdls(clip_name="A001C003", uuid=sample_fdls[0].uuid) == []
+    assert len(store.find_fdls(clip_name=None)) == 3
+
+    with pytest.raises(pyfdl.FDLError):
+        store.find_canvases(clip="A001C003")
+
+
+def test_store_indexes():
+    store = pyfdl.FDLStore()
+    plans = {
+        "contexts": "clip_name = 'A001C003'",
+        "canvases": "id = '20220310'",
+        "framing_decisions": "framing_intent_id = 'SCOPE'",
+    }
+    for table, where in plans.items():
+        plan = store.connection.execute(f"EXPLAIN QUERY PLAN SELECT * FROM {table} WHERE {where}").fetchall()
+        assert "USING INDEX" in plan[0][-1]
+
+    plan = store.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM canvases WHERE source_canvas_id = '1' OR dimensions_width = 1"
+    ).fetchall()
+    assert all("SCAN" not in row[-1] for row in plan)
@@ -0,0 +1,133 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+import pyfdl
+from pyfdl.streaming import iter_members, read_fdl, write_json
+
+SAMPLE_FDL_FILE = Path(__file__).parent.joinpath("sample_data", "Scenario-9__FDL_DeliveredToVFXVendor.fdl")
+
+
+def test_iter_members_small_chunks():
+    raw = SAMPLE_FDL_FILE.read_text()
+    members = {}
+    for key, index, value in iter_members(io.StringIO(raw), stream_keys=["contexts"], chunk_size=7):
+        if index is None:
+            members[key] = value
+        else:
+            assert index == len(members.setdefault(key, []))
+            members[key].append(value)
+
+    assert members == json.loads(raw)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_iter_members_values_across_chunks(chunk_size):
+    raw = '{ "a" : 12345.5e1, "b": [ ], "c" :[true, null, {"d": "e}"}], "f": false }'
+    members = list(iter_members(io.StringIO(raw), stream_keys=["b", "c"], chunk_size=chunk_size))
+    assert members == [
+        ("a", None, 12345.5e1),
+        ("c", 0, True),
+        ("c", 1, None),
+        ("c", 2, {"d": "e}"}),
+        ("f", None, False),
+    ]
+
+
+@pytest.mark.parametrize("raw", ["[]", '{"a": 1', '{"a": [1, 2}', '{"a": 1} 2', '{"a" 1}'])
+def test_iter_members_invalid_json(raw):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_members(io.StringIO(raw), stream_keys=["a"], chunk_size=2))
+
+
+def test_read_from_file_stream():
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE, stream=True)
+    assert fdl.to_dict() == pyfdl.read_from_file(SAMPLE_FDL_FILE).to_dict()
+
+
+def test_read_stream_validation():
+    raw = json.loads(SAMPLE_FDL_FILE.read_text())
+    raw["contexts"][0]["canvases"][0]["id"] = "not valid id"
+    raw["uuid"] = "not a uuid"
+
+    with pytest.raises(pyfdl.FDLValidationError) as err:
+        read_fdl(io.StringIO(json.dumps(raw)), chunk_size=16)
+
+    paths = [error.path for error in err.value.errors]
+    assert "/contexts/0/canvases/0/id" in paths
+    assert "/uuid" in paths
+
+    # Reading stops at the first broken context
+    with pytest.raises(pyfdl.FDLValidationError) as err:
+        read_fdl(io.StringIO(json.dumps(raw)), fail_fast=True)
+
+    assert [error.path for error in err.value.errors] == ["/contexts/0/canvases/0/id"]
+
+    with pytest.raises(ValueError):
+        read_fdl(io.StringIO(json.dumps(raw)), max_errors=0)
+
+
+def test_read_stream_contexts_before_version():
+    raw = json.loads(SAMPLE_FDL_FILE.read_text())
+    reordered = {"contexts": raw.pop("contexts"), **raw}
+    fdl = read_fdl(io.StringIO(json.dumps(reordered)))
+    assert fdl.to_dict() == pyfdl.read_from_file(SAMPLE_FDL_FILE).to_dict()
+
+    reordered["contexts"][0]["label"] = 1
+    with pytest.raises(pyfdl.FDLValidationError):
+        read_fdl(io.StringIO(json.dumps(reordered)))
+
+
+def test_iter_contexts(tmp_path):
+    expected = pyfdl.read_from_file(SAMPLE_FDL_FILE).contexts
+    contexts = pyfdl.iter_contexts(SAMPLE_FDL_FILE)
+    assert not isinstance(contexts, list)
+    contexts = list(contexts)
+
+    assert all(isinstance(context, pyfdl.Context) for context in contexts)
+    assert [context.to_dict() for context in contexts] == expected.to_list()
+
+    raw = json.loads(SAMPLE_FDL_FILE.read_text())
+    raw["contexts"][0]["canvases"][0]["id"] = "not valid id"
+    path = tmp_path.joinpath("invalid.fdl")
+    path.write_text(json.dumps(raw))
+    with pytest.raises(pyfdl.FDLValidationError):
+        list(pyfdl.iter_contexts(path))
+
+    assert len(list(pyfdl.iter_contexts(path, validate=False))) == len(expected)
+
+
+@pytest.mark.parametrize("indent", [2, None])
+def test_write_json(indent):
+    data = json.loads(SAMPLE_FDL_FILE.read_text())
+
+    class CountingStream(io.StringIO):
+        writes = 0
+
+        def write(self, s):
+            self.writes += 1
+            return super().write(s)
+
+    text = CountingStream()
+    write_json(data, text, indent=indent, buffer_size=64)
+    assert text.getvalue() == json.dumps(data, indent=indent)
+    assert text.writes > 1
+
+    binary = io.BytesIO()
+    write_json(data, binary, indent=indent)
+    assert binary.getvalue() == json.dumps(data, indent=indent).encode()
+
+
+def test_write_to_stream(tmp_path):
+    fdl = pyfdl.read_from_file(SAMPLE_FDL_FILE)
+    expected = pyfdl.write_to_string(fdl)
+
+    stream = io.BytesIO()
+    pyfdl.write_to_stream(fdl, stream)
+    assert stream.getvalue().decode() == expected
+
+    path = tmp_path.joinpath("out.fdl")
+    pyfdl.write_to_file(fdl, path)
+    assert path.read_text() == expected
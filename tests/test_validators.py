@@ -0,0 +1,163 @@
+import copy
+import json
+import threading
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+import pyfdl
+from pyfdl import validators
+from pyfdl.schema_compiler import (
+    CompiledValidator,
+    SchemaCompiler,
+    UnsupportedSchemaError,
+)
+
+SAMPLE_FDL_FILE = Path(__file__).parent.joinpath("sample_data", "Scenario-9__OriginalFDL_UsedToMakePlate.fdl")
+
+
+@pytest.fixture
+def clean_cache():
+    validators.clear_validator_cache()
+    yield
+    validators.clear_validator_cache()
+
+
+def test_get_schema_versions():
+    assert validators.get_schema_versions() == [(0, 1), (1, 0), (2, 0)]
+
+
+def test_get_schema_cached(clean_cache):
+    schema = validators.get_schema(2, 0)
+    assert schema is validators.get_schema(2, 0)
+
+    with pytest.raises(pyfdl.FDLError):
+        validators.get_schema(99, 0)
+
+
+def test_get_validator_shared(clean_cache):
+    fdl1 = pyfdl.FDL()
+    fdl1.apply_defaults()
+    fdl2 = pyfdl.FDL()
+    fdl2.apply_defaults()
+
+    assert fdl1.load_schema() is fdl2.load_schema()
+    assert pyfdl.get_validator(*fdl1.schema_version) is pyfdl.get_validator(*fdl2.schema_version)
+
+
+def test_get_validator_threads(clean_cache):
+    results = []
+
+    def worker():
+        results.append(pyfdl.get_validator(2, 0))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(validator) for validator in results}) == 1
+
+
+def test_preload_validators(clean_cache):
+    pyfdl.preload_validators()
+    for version in validators.get_schema_versions():
+        assert (*version, "compiled", "") in validators._VALIDATORS
+
+
+def test_get_validator_unknown_backend(clean_cache):
+    with pytest.raises(pyfdl.FDLError):
+        pyfdl.get_validator(2, 0, backend="nope")
+
+
+@pytest.mark.parametrize("version", validators.get_schema_versions())
+def test_compiled_validator_compiles(version):
+    validator = pyfdl.get_validator(*version)
+    assert isinstance(validator, CompiledValidator)
+    assert validator.is_compiled
+
+
+def _invalid_variants(raw):
+    # Mutations touching most keywords used in the schemas
+    def mutate(func):
+        data = copy.deepcopy(raw)
+        func(data)
+        return data
+
+    context = ("contexts", 0)
+    canvas = (*context, "canvases", 0)
+    framing_decision = (*canvas, "framing_decisions", 0)
+
+    def setter(path, value):
+        def func(data):
+            target = data
+            for part in path[:-1]:
+                target = target[part]
+            target[path[-1]] = value
+
+        return func
+
+    def deleter(path):
+        def func(data):
+            target = data
+            for part in path[:-1]:
+                target = target[part]
+            del target[path[-1]]
+
+        return func
+
+    return [
+        mutate(setter(("uuid",), "not-a-uuid")),
+        mutate(setter(("uuid",), 12)),
+        mutate(setter(("version", "major"), True)),
+        mutate(setter(("version", "major"), 3)),
+        mutate(setter(("version", "minor"), 1.5)),
+        mutate(setter(("fdl_creator",), "")),
+        mutate(setter(("unknown_key",), 1)),
+        mutate(deleter(("version",))),
+        mutate(setter((*canvas, "id"), "not valid id")),
+        mutate(setter((*canvas, "dimensions", "width"), 0)),
+        mutate(setter((*canvas, "dimensions", "width"), 1.5)),
+        mutate(setter((*canvas, "dimensions", "height"), "1080")),
+        mutate(deleter((*canvas, "source_canvas_id"))),
+        mutate(setter((*canvas, "anamorphic_squeeze"), -1)),
+        mutate(setter((*framing_decision, "anchor_point", "x"), -1)),
+        mutate(setter((*framing_decision, "id"), None)),
+        mutate(setter((*context, "canvases"), {})),
+        mutate(setter(("framing_intents", 0, "aspect_ratio", "width"), False)),
+    ]
+
+
+@pytest.mark.parametrize("backend", validators.VALIDATOR_BACKENDS)
+def test_compiled_validator_matches_jsonschema(backend):
+    with SAMPLE_FDL_FILE.open() as fp:
+        raw = json.load(fp)
+
+    version = raw["version"]["major"], raw["version"]["minor"]
+    reference = pyfdl.get_validator(*version, backend="jsonschema")
+    validator = pyfdl.get_validator(*version, backend=backend)
+    assert validator.is_valid(raw)
+    assert list(validator.iter_errors(raw)) == []
+
+    for variant in _invalid_variants(raw):
+        expected = [str(error) for error in reference.iter_errors(variant)]
+        assert validator.is_valid(variant) is not expected
+        assert [str(error) for error in validator.iter_errors(variant)] == expected
+
+
+def test_compiled_validator_unsupported_schema():
+    schema = {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "unevaluatedProperties": False,
+    }
+    with pytest.raises(UnsupportedSchemaError):
+        SchemaCompiler(schema).compile()
+
+    fallback = jsonschema.Draft202012Validator(schema)
+    validator = CompiledValidator(schema, fallback)
+    assert not validator.is_compiled
+    assert validator.is_valid({})
+    assert not validator.is_valid([])